@@ -18,6 +18,7 @@ from src.extraction.extractor import (
     ExtractionResult,
     extract_entities,
     extract_structured_data,
+    get_extractor,
 )
 
 __all__ = [
@@ -26,4 +27,5 @@ __all__ = [
     "ExtractionResult",
     "extract_entities",
     "extract_structured_data",
+    "get_extractor",
 ]
@@ -15,6 +15,7 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -283,6 +284,12 @@ class Extractor:
             return f"<html><body>Visualization error: {e}</body></html>"
 
 
+@lru_cache(maxsize=8)
+def get_extractor(model_id: str = "gemini-2.5-flash") -> Extractor:
+    """Get a shared Extractor for a model (one per model_id)."""
+    return Extractor(model_id=model_id)
+
+
 # Convenience functions
 
 async def extract_entities(
@@ -301,7 +308,7 @@ async def extract_entities(
     Returns:
         List of extracted entities
     """
-    extractor = Extractor(model_id=model_id)
+    extractor = get_extractor(model_id)
     prompt = f"Extract all {', '.join(entity_types)} from the text."
     result = extractor.extract(text, prompt)
     return result.extractions if result.success else []
@@ -323,7 +330,7 @@ async def extract_structured_data(
     Returns:
         Extracted data matching schema
     """
-    extractor = Extractor(model_id=model_id)
+    extractor = get_extractor(model_id)
     
     prompt = f"""Extract information from the text according to this schema:
 {json.dumps(schema, indent=2)}
@@ -6,7 +6,9 @@ Combines loading, chunking, embedding, and storage.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -27,6 +29,13 @@ class ProcessingResult:
     total_chars: int
     metadata: dict[str, Any]
     error: str | None = None
+    skipped: bool = False
+
+
+def file_digest(path: Path) -> str:
+    """BLAKE2b digest (16 bytes, hex) of a file's contents, read in blocks."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
 
 
 class DocumentProcessor:
@@ -56,6 +65,7 @@ class DocumentProcessor:
         file_path: str | Path,
         collection_name: str = "documents",
         extra_metadata: dict | None = None,
+        skip_existing: bool = False,
     ) -> ProcessingResult:
         """
         Process a single file through the full pipeline.
@@ -64,6 +74,7 @@ class DocumentProcessor:
             file_path: Path to the document
             collection_name: Vector store collection name
             extra_metadata: Additional metadata to store
+            skip_existing: Skip files whose contents are already stored in the collection
             
         Returns:
             ProcessingResult with status and stats
@@ -71,6 +82,24 @@ class DocumentProcessor:
         file_path = Path(file_path).expanduser().resolve()
         
         try:
+            # Chunks carry the file's content hash, so identical files can be recognized
+            content_hash = file_digest(file_path)
+            if (
+                skip_existing
+                and self.vector_store
+                and self.vector_store.count(collection_name, where={"content_hash": content_hash})
+            ):
+                logger.info(f"Skipping {file_path.name}: already in collection '{collection_name}'")
+                return ProcessingResult(
+                    success=True,
+                    document_id="",
+                    source=str(file_path),
+                    num_chunks=0,
+                    total_chars=0,
+                    metadata={"content_hash": content_hash},
+                    skipped=True,
+                )
+            
             # Load document
             loader = DocumentLoader(file_path)
             doc = loader.load()
@@ -83,6 +112,7 @@ class DocumentProcessor:
                 "source": str(file_path),
                 "filename": file_path.name,
                 "doc_id": doc_id,
+                "content_hash": content_hash,
                 **(doc.metadata or {}),
                 **(extra_metadata or {}),
             }
@@ -135,6 +165,8 @@ class DocumentProcessor:
         collection_name: str = "documents",
         recursive: bool = True,
         extensions: set[str] | None = None,
+        workers: int = 1,
+        skip_existing: bool = False,
     ) -> list[ProcessingResult]:
         """
         Process all supported files in a directory.
@@ -144,6 +176,8 @@ class DocumentProcessor:
             collection_name: Vector store collection
             recursive: Whether to process subdirectories
             extensions: File extensions to process (default: all supported)
+            workers: Number of files to process concurrently
+            skip_existing: Skip files whose contents are already stored in the collection
             
         Returns:
             List of ProcessingResults
@@ -169,14 +203,20 @@ class DocumentProcessor:
         
         logger.info(f"Found {len(files)} files to process in {directory}")
         
-        results = []
-        for file_path in files:
-            result = self.process_file(
+        def process(file_path: Path) -> ProcessingResult:
+            return self.process_file(
                 file_path,
                 collection_name=collection_name,
                 extra_metadata={"directory": str(directory)},
+                skip_existing=skip_existing,
             )
-            results.append(result)
+        
+        if workers > 1 and len(files) > 1:
+            # Overlap parsing of one file with embedding/storage of another
+            with ThreadPoolExecutor(max_workers=min(workers, len(files)), thread_name_prefix="ingest") as pool:
+                results = list(pool.map(process, files))
+        else:
+            results = [process(f) for f in files]
         
         successful = sum(1 for r in results if r.success)
         logger.info(f"Processed {successful}/{len(results)} files successfully")
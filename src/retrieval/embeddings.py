@@ -16,6 +16,15 @@ logger = logging.getLogger(__name__)
 # Singleton instance
 _embeddings_instance: "LocalEmbeddings | None" = None
 
+# Bounds of the power-of-two token-length buckets texts are grouped into
+MIN_BUCKET_TOKENS = 16
+MAX_BUCKET_TOKENS = 512
+
+
+def length_bucket(num_tokens: int) -> int:
+    """Round a token count up to its power-of-two bucket, clamped to 16..512."""
+    return min(MAX_BUCKET_TOKENS, max(MIN_BUCKET_TOKENS, 1 << (num_tokens - 1).bit_length()))
+
 
 class LocalEmbeddings:
     """
@@ -93,6 +102,12 @@ class LocalEmbeddings:
         )
         return embedding.tolist()
     
+    def token_counts(self, texts: list[str]) -> list[int]:
+        """Count each text's tokens with the model's tokenizer (no special tokens)."""
+        model = self._load_model()
+        encoded = model.tokenizer(texts, add_special_tokens=False)
+        return [len(ids) for ids in encoded["input_ids"]]
+    
     def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
         """Generate embeddings for multiple texts (synchronous)."""
         model = self._load_model()
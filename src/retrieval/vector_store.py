@@ -7,19 +7,142 @@ Uses a simple file-based approach for Python 3.14 compatibility.
 
 from __future__ import annotations
 
+import base64
+import hashlib
 import json
 import logging
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from src.config.paths import VECTOR_STORE_DIR
 from src.retrieval.embeddings import LocalEmbeddings, get_embeddings
 
 logger = logging.getLogger(__name__)
 
-# Singleton instance
-_vector_store_instance: "VectorStore | None" = None
+# One shared instance per resolved persist directory
+_vector_store_instances: "dict[Path, VectorStore]" = {}
+
+# Metadata value types stored as-is; anything else (except None) is stringified
+_ALLOWED_METADATA_TYPES = (str, int, float, bool)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rows_dot(matrix, query, rows):
+        """Dot product of query with each listed row of matrix, without gathering them."""
+        scores = np.empty(rows.shape[0], dtype=np.float32)
+        for i in prange(rows.shape[0]):
+            row = rows[i]
+            acc = np.float32(0.0)
+            for j in range(matrix.shape[1]):
+                acc += matrix[row, j] * query[j]
+            scores[i] = acc
+        return scores
+else:
+    _rows_dot = None  # type: ignore[assignment]
+
+
+def _clean_metadata(metadata: dict[str, Any] | None) -> dict[str, Any]:
+    """Drop None values and stringify anything that isn't a plain scalar."""
+    if not metadata:
+        return {}
+    return {
+        k: v if isinstance(v, _ALLOWED_METADATA_TYPES) else str(v)
+        for k, v in metadata.items()
+        if v is not None
+    }
+
+
+def _make_result(doc_id: str, doc: dict, similarity: float) -> dict[str, Any]:
+    """Build a search result from a stored document and its similarity."""
+    return {
+        "id": doc_id,
+        "text": doc["text"],
+        "metadata": doc["metadata"],
+        "score": similarity,
+        "distance": 1 - similarity,
+    }
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length in place (zero rows are left as-is)."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors /= norms
+    return vectors
+
+
+def _encode_array(obj: np.ndarray) -> dict[str, str]:
+    """Serialize an embedding as its dtype plus base64 of the raw bytes."""
+    return {"dtype": obj.dtype.str, "data": base64.b64encode(obj.tobytes()).decode("ascii")}
+
+
+def _decode_embedding(value: Any, dtype: np.dtype) -> np.ndarray:
+    """Turn a stored embedding back into an ndarray of the given dtype."""
+    if isinstance(value, dict):
+        array = np.frombuffer(base64.b64decode(value["data"]), dtype=np.dtype(value["dtype"]))
+        return array.astype(dtype, copy=False)
+    # Legacy list-of-floats embeddings may predate insert-time normalization
+    return _normalize_rows(np.array(value, dtype=np.float32)).astype(dtype, copy=False)
+
+
+def _log_default(obj: Any) -> Any:
+    """JSON default hook for write-log records."""
+    if isinstance(obj, np.ndarray):
+        return _encode_array(obj)
+    return str(obj)
+
+
+@lru_cache(maxsize=128)
+def _contains_any_pattern(substrings: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile substrings into one alternation so each document is scanned once."""
+    return re.compile("|".join(map(re.escape, substrings)))
+
+
+def _compile_document_filter(where_document: dict[str, Any]) -> Callable[[str], bool]:
+    """
+    Build a predicate over document text.
+    
+    Supports {"$contains": str}, {"$not_contains": str} and
+    {"$contains_any": [str, ...]}; multiple operators are ANDed.
+    """
+    required: list[str] = []
+    forbidden: list[str] = []
+    patterns: list[re.Pattern[str]] = []
+    for op, operand in where_document.items():
+        if op == "$contains":
+            required.append(operand)
+        elif op == "$not_contains":
+            forbidden.append(operand)
+        elif op == "$contains_any":
+            if not operand:
+                return lambda text: False
+            patterns.append(_contains_any_pattern(tuple(operand)))
+        else:
+            raise ValueError(f"Unsupported where_document operator: {op}")
+    return lambda text: (
+        all(sub in text for sub in required)
+        and not any(sub in text for sub in forbidden)
+        and all(pattern.search(text) is not None for pattern in patterns)
+    )
 
 
 class VectorStore:
@@ -27,30 +150,55 @@ class VectorStore:
     File-based vector store for document embeddings.
     
     Features:
-    - Local persistent storage (JSON files)
+    - Local persistent storage (JSON files + append-only write log, base64 embeddings)
     - Automatic embedding generation
-    - Semantic similarity search (cosine similarity)
-    - Metadata filtering
+    - Semantic similarity search (cosine similarity over unit vectors, fp16 search matrix)
+    - Metadata filtering (backed by an inverted metadata index)
     - Multiple collections
     """
     
     DEFAULT_COLLECTION = "documents"
     
+    # Log records allowed to accumulate before the base file is rewritten
+    COMPACT_THRESHOLD = 1000
+    
+    # Normalized query embeddings kept for repeated searches
+    QUERY_CACHE_SIZE = 256
+    
     def __init__(
         self,
         persist_directory: str | Path | None = None,
         embeddings: LocalEmbeddings | None = None,
+        embedding_dtype: str = "float16",
     ):
-        self.persist_directory = Path(persist_directory or "~/.wingman/vector_store").expanduser()
+        self.persist_directory = Path(persist_directory or VECTOR_STORE_DIR).expanduser()
         self.persist_directory.mkdir(parents=True, exist_ok=True)
         
         self.embeddings = embeddings or get_embeddings()
+        # Precision embeddings are held and persisted at; fp16 halves memory and file size
+        self.embedding_dtype = np.dtype(embedding_dtype)
         self._collections: dict[str, dict] = {}
+        # Records appended to each collection's log since its last compaction
+        self._log_records: dict[str, int] = {}
+        # Dense (ids, id -> row, embedding matrix) per collection, rebuilt lazily after writes
+        self._matrices: dict[str, tuple[list[str], dict[str, int], np.ndarray]] = {}
+        # collection -> metadata key -> value -> doc ids; built on first filter, then maintained
+        self._meta_index: dict[str, dict[str, dict[Any, set[str]]]] = {}
+        # (model name, query text) -> normalized query embedding, least recently used first
+        self._query_cache: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        # Writes applied to each collection by this instance; result caches key on it
+        self._write_gen: dict[str, int] = {}
+        # Guards all of the above; tools call the store from worker threads
+        self._lock = threading.RLock()
     
     def _get_collection_path(self, name: str) -> Path:
         """Get path to collection file."""
         return self.persist_directory / f"{name}.json"
     
+    def _get_log_path(self, name: str) -> Path:
+        """Get path to the collection's append-only write log."""
+        return self.persist_directory / f"{name}.jsonl"
+    
     def _load_collection(self, name: str) -> dict:
         """Load a collection from disk."""
         if name in self._collections:
@@ -58,16 +206,100 @@ class VectorStore:
         
         path = self._get_collection_path(name)
         if path.exists():
-            with open(path, 'r') as f:
-                self._collections[name] = json.load(f)
+            data = path.read_bytes()
+            self._collections[name] = orjson.loads(data) if orjson else json.loads(data)
         else:
             self._collections[name] = {
                 "documents": {},
                 "metadata": {"dimension": self.embeddings.dimension},
             }
         
+        self._log_records[name] = self._replay_log(name, self._collections[name])
+        
+        # Decode every embedding once; from here on they stay ndarrays of embedding_dtype
+        for doc in self._collections[name]["documents"].values():
+            doc["embedding"] = _decode_embedding(doc["embedding"], self.embedding_dtype)
+        
         return self._collections[name]
     
+    def _replay_log(self, name: str, coll: dict) -> int:
+        """Apply writes recorded in the collection log on top of the base file."""
+        log_path = self._get_log_path(name)
+        if not log_path.exists():
+            return 0
+        
+        replayed = 0
+        with open(log_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line) if orjson else json.loads(line)
+                except ValueError:
+                    # A torn trailing write from a crash; everything before it is intact
+                    logger.warning(f"Skipping corrupt record in {log_path.name}")
+                    continue
+                
+                if record.get("op") == "add":
+                    coll["documents"][record["id"]] = record["doc"]
+                    if "next_id" in record:
+                        # Keep the counter past IDs that were issued and since deleted
+                        coll["next_id"] = max(coll.get("next_id", 0), record["next_id"])
+                elif record.get("op") == "delete":
+                    for doc_id in record["ids"]:
+                        coll["documents"].pop(doc_id, None)
+                replayed += 1
+        
+        return replayed
+    
+    def _append_log(self, name: str, records: list[dict[str, Any]]) -> None:
+        """Append write records to the collection log, compacting when it grows large."""
+        if not records:
+            return
+        
+        if orjson:
+            payload = b"".join(
+                orjson.dumps(r, default=_log_default) + b"\n"
+                for r in records
+            )
+        else:
+            payload = "".join(json.dumps(r, default=_log_default) + "\n" for r in records).encode()
+        
+        with open(self._get_log_path(name), 'ab') as f:
+            f.write(payload)
+        
+        self._write_gen[name] = self._write_gen.get(name, 0) + 1
+        self._matrices.pop(name, None)
+        self._log_records[name] = self._log_records.get(name, 0) + len(records)
+        if self._log_records[name] >= self.COMPACT_THRESHOLD:
+            self.compact(name)
+    
+    def write_generation(self, collection: str = DEFAULT_COLLECTION) -> int:
+        """
+        Counter bumped by every write to a collection through this store.
+        
+        Callers caching search results or counts key them on it, so any
+        writer (tools, uploads, scripts) invalidates those caches.
+        """
+        return self._write_gen.get(collection, 0)
+    
+    def compact(self, name: str = DEFAULT_COLLECTION) -> None:
+        """Rewrite the collection's base file and truncate its write log."""
+        with self._lock:
+            if name not in self._collections:
+                return
+            
+            self._save_collection(name)
+            self._get_log_path(name).unlink(missing_ok=True)
+            self._log_records[name] = 0
+    
+    def close(self) -> None:
+        """Compact every loaded collection that has pending log records."""
+        with self._lock:
+            for name, pending in list(self._log_records.items()):
+                if pending:
+                    self.compact(name)
+    
     def _save_collection(self, name: str) -> None:
         """Save a collection to disk. Non-serializable metadata falls back to repr."""
         if name not in self._collections:
@@ -75,7 +307,9 @@ class VectorStore:
 
         path = self._get_collection_path(name)
 
-        def _safe_default(obj: Any) -> str:
+        def _safe_default(obj: Any) -> Any:
+            if isinstance(obj, np.ndarray):
+                return _encode_array(obj)
             # Last-resort fallback: log what went unserialized and stringify it
             logger.warning(
                 "Non-serializable value in collection %s: %s (type=%s)",
@@ -85,8 +319,15 @@ class VectorStore:
 
         tmp_path = path.with_suffix(path.suffix + ".tmp")
         try:
-            with open(tmp_path, 'w') as f:
-                json.dump(self._collections[name], f, default=_safe_default)
+            if orjson:
+                tmp_path.write_bytes(orjson.dumps(
+                    self._collections[name],
+                    default=_safe_default,
+                    option=orjson.OPT_NON_STR_KEYS,
+                ))
+            else:
+                with open(tmp_path, 'w') as f:
+                    json.dump(self._collections[name], f, default=_safe_default)
             tmp_path.replace(path)  # atomic
         except Exception as e:
             logger.error(f"Failed to save collection {name}: {e}")
@@ -112,31 +353,29 @@ class VectorStore:
         Returns:
             The document ID
         """
-        coll = self._load_collection(collection)
-        
-        # Generate ID if not provided
+        # Generate ID if not provided. Content-derived, so re-adding the same text
+        # replaces rather than duplicates (stable across runs, unlike hash())
         if not doc_id:
-            doc_id = f"doc_{hash(text) % 1000000:06d}"
+            doc_id = f"doc_{hashlib.blake2b(text.encode(), digest_size=8).hexdigest()}"
         
-        # Generate embedding
-        embedding = self.embeddings.embed(text)
+        # Generate embedding, normalized once here so search is a plain dot product
+        # (outside the lock, so other threads keep searching meanwhile)
+        embedding = _normalize_rows(
+            np.array(self.embeddings.embed(text), dtype=np.float32)
+        ).astype(self.embedding_dtype, copy=False)
         
-        # Clean metadata
-        clean_metadata = {}
-        if metadata:
-            for k, v in metadata.items():
-                if isinstance(v, (str, int, float, bool)):
-                    clean_metadata[k] = v
-                elif v is not None:
-                    clean_metadata[k] = str(v)
-        
-        coll["documents"][doc_id] = {
+        doc = {
             "text": text,
             "embedding": embedding,
-            "metadata": clean_metadata,
+            "metadata": _clean_metadata(metadata),
         }
-        
-        self._save_collection(collection)
+        with self._lock:
+            coll = self._load_collection(collection)
+            self._unindex_doc(collection, doc_id, coll["documents"].get(doc_id))
+            coll["documents"][doc_id] = doc
+            self._index_doc(collection, doc_id, doc)
+            
+            self._append_log(collection, [{"op": "add", "id": doc_id, "doc": doc}])
         return doc_id
     
     def add_batch(
@@ -147,43 +386,160 @@ class VectorStore:
         collection: str = DEFAULT_COLLECTION,
     ) -> list[str]:
         """Add multiple documents in batch."""
-        coll = self._load_collection(collection)
+        # Generate embeddings in batch, normalized once here so search is a plain dot product
+        # (one array for the whole batch; each document keeps a row view of it). Done
+        # outside the lock, so other threads keep searching meanwhile
+        embeddings = _normalize_rows(
+            np.array(self.embeddings.embed_batch(texts), dtype=np.float32)
+        ).astype(self.embedding_dtype, copy=False)
         
-        # Generate IDs if not provided
-        if not doc_ids:
-            doc_ids = [f"doc_{hash(t) % 1000000:06d}_{i}" for i, t in enumerate(texts)]
-        
-        # Generate embeddings in batch
-        embeddings = self.embeddings.embed_batch(texts)
-        
-        for i, (doc_id, text, embedding) in enumerate(zip(doc_ids, texts, embeddings)):
-            clean_metadata = {}
-            if metadatas and i < len(metadatas):
-                for k, v in metadatas[i].items():
-                    if isinstance(v, (str, int, float, bool)):
-                        clean_metadata[k] = v
-                    elif v is not None:
-                        clean_metadata[k] = str(v)
+        metadatas = metadatas or []
+        with self._lock:
+            coll = self._load_collection(collection)
             
-            coll["documents"][doc_id] = {
-                "text": text,
-                "embedding": embedding,
-                "metadata": clean_metadata,
-            }
-        
-        self._save_collection(collection)
+            # Generate IDs if not provided; the advanced counter goes into the log records
+            # so a restart never reissues an ID whose document was deleted
+            counter = {}
+            if not doc_ids:
+                doc_ids = self._next_ids(coll, len(texts))
+                counter = {"next_id": coll["next_id"]}
+            
+            docs = coll["documents"]
+            records = []
+            for i, (doc_id, text, embedding) in enumerate(zip(doc_ids, texts, embeddings, strict=True)):
+                doc = {
+                    "text": text,
+                    "embedding": embedding,
+                    "metadata": _clean_metadata(metadatas[i] if i < len(metadatas) else None),
+                }
+                self._unindex_doc(collection, doc_id, docs.get(doc_id))
+                docs[doc_id] = doc
+                self._index_doc(collection, doc_id, doc)
+                records.append({"op": "add", "id": doc_id, "doc": doc, **counter})
+            
+            self._append_log(collection, records)
         return doc_ids
     
-    def _cosine_similarity(self, a: list[float], b: list[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        a = np.array(a)
-        b = np.array(b)
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        # Avoid division by zero
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return float(np.dot(a, b) / (norm_a * norm_b))
+    def _next_ids(self, coll: dict, count: int) -> list[str]:
+        """Allocate `count` unused sequential document IDs from the collection counter."""
+        docs = coll["documents"]
+        next_id = coll.get("next_id", len(docs))
+        ids: list[str] = []
+        while len(ids) < count:
+            doc_id = f"doc_{next_id:08x}"
+            next_id += 1
+            if doc_id not in docs:
+                ids.append(doc_id)
+        coll["next_id"] = next_id
+        return ids
+    
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embed and normalize a search query, reusing recent results."""
+        vector = self._cached_query_vector(query)
+        if vector is None:
+            vector = _normalize_rows(np.array(self.embeddings.embed(query), dtype=np.float32))
+            self._cache_query_vector(query, vector)
+        return vector
+    
+    def embed_queries(self, queries: list[str]) -> np.ndarray:
+        """Embed and normalize several queries; uncached ones go through one embed_batch call."""
+        vectors: dict[str, np.ndarray] = {}
+        missing = []
+        for query in dict.fromkeys(queries):
+            vector = self._cached_query_vector(query)
+            if vector is None:
+                missing.append(query)
+            else:
+                vectors[query] = vector
+        
+        if missing:
+            embedded = _normalize_rows(
+                np.array(self.embeddings.embed_batch(missing), dtype=np.float32)
+            )
+            for query, vector in zip(missing, embedded, strict=True):
+                vectors[query] = vector
+                self._cache_query_vector(query, vector)
+        
+        return np.stack([vectors[query] for query in queries])
+    
+    def _cached_query_vector(self, query: str) -> np.ndarray | None:
+        key = (self.embeddings.model_name, query)
+        with self._lock:
+            vector = self._query_cache.get(key)
+            if vector is not None:
+                self._query_cache.move_to_end(key)
+        return vector
+    
+    def _cache_query_vector(self, query: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._query_cache[(self.embeddings.model_name, query)] = vector
+            if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+    
+    def _get_meta_index(self, name: str) -> dict[str, dict[Any, set[str]]]:
+        """Get the collection's inverted metadata index, building it on first use."""
+        index = self._meta_index.get(name)
+        if index is None:
+            index = self._meta_index[name] = {}
+            for doc_id, doc in self._load_collection(name)["documents"].items():
+                for key, value in doc["metadata"].items():
+                    index.setdefault(key, {}).setdefault(value, set()).add(doc_id)
+        return index
+    
+    def _index_doc(self, name: str, doc_id: str, doc: dict) -> None:
+        """Add a document's metadata to the index (no-op until the index is built)."""
+        index = self._meta_index.get(name)
+        if index is None:
+            return
+        for key, value in doc["metadata"].items():
+            index.setdefault(key, {}).setdefault(value, set()).add(doc_id)
+    
+    def _unindex_doc(self, name: str, doc_id: str, doc: dict | None) -> None:
+        """Remove a document's metadata from the index (no-op until the index is built)."""
+        index = self._meta_index.get(name)
+        if index is None or doc is None:
+            return
+        for key, value in doc["metadata"].items():
+            ids = index.get(key, {}).get(value)
+            if ids is not None:
+                ids.discard(doc_id)
+                if not ids:
+                    del index[key][value]
+    
+    def _filter_ids(self, name: str, where: dict[str, Any]) -> set[str]:
+        """Get the IDs of documents whose metadata matches every key/value in `where`."""
+        index = self._get_meta_index(name)
+        matched: set[str] | None = None
+        for key, value in where.items():
+            values = index.get(key, {})
+            if value is None:
+                # Unset keys compare equal to None
+                present = set().union(*values.values())
+                ids = set(self._load_collection(name)["documents"]) - present
+            else:
+                try:
+                    ids = values.get(value, set())
+                except TypeError:  # unhashable filter value can't match stored metadata
+                    ids = set()
+            matched = set(ids) if matched is None else matched & ids
+            if not matched:
+                return set()
+        return matched if matched is not None else set(self._load_collection(name)["documents"])
+    
+    def _get_matrix(self, name: str) -> tuple[list[str], dict[str, int], np.ndarray]:
+        """Get the collection's document ids, their row numbers, and (N, D) embedding matrix."""
+        cached = self._matrices.get(name)
+        if cached is None:
+            docs = self._load_collection(name)["documents"]
+            ids = list(docs)
+            if ids:
+                # Embeddings are already normalized ndarrays; stacking is a plain memcpy
+                matrix = np.stack([docs[i]["embedding"] for i in ids])
+            else:
+                matrix = np.empty((0, self.embeddings.dimension), dtype=self.embedding_dtype)
+            rows = {doc_id: i for i, doc_id in enumerate(ids)}
+            cached = self._matrices[name] = (ids, rows, matrix)
+        return cached
     
     def search(
         self,
@@ -201,44 +557,156 @@ class VectorStore:
             n_results: Number of results to return
             collection: Collection to search
             where: Metadata filter (e.g., {"source": "file.pdf"})
-            where_document: Document content filter (not implemented)
+            where_document: Document content filter, e.g. {"$contains": "python"}
+                or {"$contains_any": ["rust", "go"]}
             
         Returns:
             List of results with text, metadata, and score
         """
+        with self._lock:
+            if not self._load_collection(collection)["documents"]:
+                return []
+        
+        # Generate query embedding (normalized; cached across repeated queries)
+        query_vector = self.embed_query(query)
+        return self.search_with_embedding(query_vector, n_results, collection, where, where_document)
+    
+    def search_with_embedding(
+        self,
+        query_vector: np.ndarray,
+        n_results: int = 5,
+        collection: str = DEFAULT_COLLECTION,
+        where: dict[str, Any] | None = None,
+        where_document: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search with a query already embedded by `embed_query` / `embed_queries`.
+        
+        Other arguments are as for `search`.
+        """
+        with self._lock:
+            if not self._load_collection(collection)["documents"]:
+                return []
+            return self._search_vector(query_vector, n_results, collection, where, where_document)
+    
+    def search_iter(
+        self,
+        query: str,
+        n_results: int = 5,
+        collection: str = DEFAULT_COLLECTION,
+        where: dict[str, Any] | None = None,
+        where_document: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Search for similar documents, yielding results best first.
+        
+        Arguments are as for `search`. Ranking happens on the first
+        `next()`; each result dict is built only when it is consumed.
+        """
+        with self._lock:
+            if not self._load_collection(collection)["documents"]:
+                return
+        
+        query_vector = self.embed_query(query)
+        with self._lock:
+            ranked = self._rank(query_vector, n_results, collection, where, where_document)
+        for doc_id, doc, similarity in ranked:
+            yield _make_result(doc_id, doc, similarity)
+    
+    def batch_search(
+        self,
+        queries: list[str],
+        n_results: int = 5,
+        collection: str = DEFAULT_COLLECTION,
+        where: dict[str, Any] | None = None,
+        where_document: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search for several queries at once.
+        
+        Queries are embedded in one batch; arguments are as for `search`.
+        
+        Returns:
+            One result list per query, in input order
+        """
+        with self._lock:
+            if not self._load_collection(collection)["documents"] or not queries:
+                return [[] for _ in queries]
+        
+        query_vectors = self.embed_queries(queries)
+        with self._lock:
+            return [
+                self._search_vector(query_vector, n_results, collection, where, where_document)
+                for query_vector in query_vectors
+            ]
+    
+    def _search_vector(
+        self,
+        query_vector: np.ndarray,
+        n_results: int,
+        collection: str,
+        where: dict[str, Any] | None,
+        where_document: dict[str, Any] | None,
+    ) -> list[dict[str, Any]]:
+        """Rank the collection's documents against a normalized query embedding (lock held)."""
+        return [
+            _make_result(doc_id, doc, similarity)
+            for doc_id, doc, similarity in self._rank(query_vector, n_results, collection, where, where_document)
+        ]
+    
+    def _rank(
+        self,
+        query_vector: np.ndarray,
+        n_results: int,
+        collection: str,
+        where: dict[str, Any] | None,
+        where_document: dict[str, Any] | None,
+    ) -> list[tuple[str, dict, float]]:
+        """Top (id, stored doc, similarity) triples for a normalized query embedding (lock held)."""
         coll = self._load_collection(collection)
         
-        if not coll["documents"]:
-            return []
+        # Rows are unit vectors, so cosine similarity is a single dot product
+        ids, row_of, matrix = self._get_matrix(collection)
+        matched = self._filter_ids(collection, where) if where else None
+        if where_document:
+            text_matches = _compile_document_filter(where_document)
+            docs = coll["documents"]
+            matched = {
+                doc_id for doc_id in (docs if matched is None else matched)
+                if text_matches(docs[doc_id]["text"])
+            }
+        
+        if matched is not None:
+            # Score only the rows that passed the filters
+            rows = np.fromiter(
+                (row_of[doc_id] for doc_id in matched), dtype=np.intp, count=len(matched)
+            )
+            rows.sort()
+            if _rows_dot is not None and matrix.dtype == np.float32:
+                # Score the rows in place with the JIT kernel (numba has no CPU fp16)
+                scores = _rows_dot(matrix, query_vector.astype(np.float32, copy=False), rows)
+            else:
+                # Stored at reduced precision; accumulate in fp32
+                scores = matrix[rows].astype(np.float32) @ query_vector
+        else:
+            rows = None
+            scores = matrix.astype(np.float32, copy=False) @ query_vector
         
-        # Generate query embedding
-        query_embedding = self.embeddings.embed(query)
+        k = min(n_results, len(scores))
+        if k <= 0:
+            return []
         
-        # Calculate similarities
-        results = []
-        for doc_id, doc in coll["documents"].items():
-            # Apply metadata filter
-            if where:
-                match = True
-                for key, value in where.items():
-                    if doc["metadata"].get(key) != value:
-                        match = False
-                        break
-                if not match:
-                    continue
-            
-            similarity = self._cosine_similarity(query_embedding, doc["embedding"])
-            results.append({
-                "id": doc_id,
-                "text": doc["text"],
-                "metadata": doc["metadata"],
-                "score": similarity,
-                "distance": 1 - similarity,
-            })
+        # Select the top k in O(N), then order just those k by similarity (descending)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
         
-        # Sort by similarity (descending) and return top n
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:n_results]
+        # Resolve only the k winners, as plain Python ids/floats
+        positions = rows[top] if rows is not None else top
+        docs = coll["documents"]
+        return [
+            (ids[position], docs[ids[position]], similarity)
+            for position, similarity in zip(positions.tolist(), scores[top].tolist(), strict=True)
+        ]
     
     def delete(
         self,
@@ -247,27 +715,24 @@ class VectorStore:
         collection: str = DEFAULT_COLLECTION,
     ) -> None:
         """Delete documents by ID or filter."""
-        coll = self._load_collection(collection)
-        
-        if doc_ids:
-            for doc_id in doc_ids:
-                coll["documents"].pop(doc_id, None)
-        
-        if where:
-            to_delete = []
-            for doc_id, doc in coll["documents"].items():
-                match = True
-                for key, value in where.items():
-                    if doc["metadata"].get(key) != value:
-                        match = False
-                        break
-                if match:
-                    to_delete.append(doc_id)
+        with self._lock:
+            coll = self._load_collection(collection)
+            deleted = []
             
-            for doc_id in to_delete:
-                coll["documents"].pop(doc_id, None)
-        
-        self._save_collection(collection)
+            if doc_ids:
+                for doc_id in doc_ids:
+                    doc = coll["documents"].pop(doc_id, None)
+                    if doc is not None:
+                        self._unindex_doc(collection, doc_id, doc)
+                        deleted.append(doc_id)
+            
+            if where:
+                for doc_id in self._filter_ids(collection, where):
+                    self._unindex_doc(collection, doc_id, coll["documents"].pop(doc_id))
+                    deleted.append(doc_id)
+            
+            if deleted:
+                self._append_log(collection, [{"op": "delete", "ids": deleted}])
     
     def get(
         self,
@@ -275,57 +740,69 @@ class VectorStore:
         collection: str = DEFAULT_COLLECTION,
     ) -> list[dict[str, Any]]:
         """Get documents by ID."""
-        coll = self._load_collection(collection)
-        
-        results = []
-        for doc_id in doc_ids:
-            if doc_id in coll["documents"]:
-                doc = coll["documents"][doc_id]
-                results.append({
-                    "id": doc_id,
-                    "text": doc["text"],
-                    "metadata": doc["metadata"],
-                })
-        
-        return results
+        with self._lock:
+            coll = self._load_collection(collection)
+            
+            results = []
+            for doc_id in doc_ids:
+                if doc_id in coll["documents"]:
+                    doc = coll["documents"][doc_id]
+                    results.append({
+                        "id": doc_id,
+                        "text": doc["text"],
+                        "metadata": doc["metadata"],
+                    })
+            
+            return results
     
-    def count(self, collection: str = DEFAULT_COLLECTION) -> int:
-        """Get total document count in collection."""
-        coll = self._load_collection(collection)
-        return len(coll["documents"])
+    def count(self, collection: str = DEFAULT_COLLECTION, where: dict[str, Any] | None = None) -> int:
+        """Get document count in collection, optionally only those matching a metadata filter."""
+        with self._lock:
+            if where:
+                return len(self._filter_ids(collection, where))
+            coll = self._load_collection(collection)
+            return len(coll["documents"])
     
     def list_collections(self) -> list[str]:
         """List all collections."""
-        collections = []
-        for path in self.persist_directory.glob("*.json"):
-            collections.append(path.stem)
-        return collections
+        collections = {path.stem for path in self.persist_directory.glob("*.json")}
+        # Collections written since creation may only exist as a log so far
+        collections.update(path.stem for path in self.persist_directory.glob("*.jsonl"))
+        return sorted(collections)
     
     def delete_collection(self, name: str) -> None:
         """Delete a collection."""
-        path = self._get_collection_path(name)
-        if path.exists():
-            path.unlink()
-        if name in self._collections:
-            del self._collections[name]
+        with self._lock:
+            path = self._get_collection_path(name)
+            if path.exists():
+                path.unlink()
+            self._get_log_path(name).unlink(missing_ok=True)
+            if name in self._collections:
+                del self._collections[name]
+            self._log_records.pop(name, None)
+            self._matrices.pop(name, None)
+            self._meta_index.pop(name, None)
+            self._write_gen[name] = self._write_gen.get(name, 0) + 1
     
     def get_stats(self, collection: str = DEFAULT_COLLECTION) -> dict[str, Any]:
         """Get statistics about a collection."""
-        coll = self._load_collection(collection)
-        return {
-            "collection": collection,
-            "count": len(coll["documents"]),
-            "embedding_dimension": self.embeddings.dimension,
-            "embedding_model": self.embeddings.model_name,
-            "persist_directory": str(self.persist_directory),
-        }
+        with self._lock:
+            coll = self._load_collection(collection)
+            return {
+                "collection": collection,
+                "count": len(coll["documents"]),
+                "embedding_dimension": self.embeddings.dimension,
+                "embedding_model": self.embeddings.model_name,
+                "persist_directory": str(self.persist_directory),
+            }
 
 
-def get_vector_store(persist_directory: str | None = None) -> VectorStore:
-    """Get or create a singleton vector store instance."""
-    global _vector_store_instance
+def get_vector_store(persist_directory: str | Path | None = None) -> VectorStore:
+    """Get or create the shared vector store instance for a persist directory."""
+    key = Path(persist_directory or VECTOR_STORE_DIR).expanduser().resolve()
     
-    if _vector_store_instance is None:
-        _vector_store_instance = VectorStore(persist_directory=persist_directory)
+    store = _vector_store_instances.get(key)
+    if store is None:
+        store = _vector_store_instances[key] = VectorStore(persist_directory=key)
     
-    return _vector_store_instance
+    return store
@@ -10,13 +10,64 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
+from collections.abc import Iterator
 from datetime import datetime
 from enum import Enum
+from io import FileIO
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of queued events written per file open
+MAX_WRITE_BATCH = 64
+
+# Bound on events waiting for the writer task; INFO events beyond it are dropped
+MAX_QUEUE_SIZE = 10000
+
+
+def _encode_event(event: dict[str, Any]) -> bytes:
+    """Serialize an event dict to one JSONL line."""
+    if orjson:
+        # Non-str keys (e.g. ints in details) are stringified, as json.dumps does
+        return orjson.dumps(event, default=str, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return (json.dumps(event, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def _encode_events(events: list[dict[str, Any]]) -> bytes:
+    """Serialize events one at a time, so an unserializable event only loses itself."""
+    lines = []
+    for event in events:
+        try:
+            lines.append(_encode_event(event))
+        except Exception as e:
+            logger.error(f"Failed to encode audit event {event.get('event_type')}: {e}")
+    return b"".join(lines)
+
+
+def _iter_lines_reverse(path: Path, chunk_size: int = 65536) -> Iterator[bytes]:
+    """Yield the lines of a file last-to-first, reading backwards in fixed-size chunks."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            # The first piece may be the tail of a line that starts in an earlier chunk
+            remainder = lines.pop(0)
+            yield from reversed(lines)
+        if remainder:
+            yield remainder
+
 
 class AuditSeverity(str, Enum):
     """Security event severity levels."""
@@ -70,16 +121,22 @@ class SecurityAudit:
         self.audit_dir.mkdir(parents=True, exist_ok=True)
         self.audit_file = self.audit_dir / "audit.jsonl"
         
+        # Append handle for sync writes when no writer task is running; opened on first use
+        self._sync_fh: FileIO | None = None
+        
+        # INFO events discarded because the write queue was full
+        self.dropped_events = 0
+        
         # Queue for async writes
         self._write_queue: asyncio.Queue | None = None
-        self._writer_task = None
+        self._writer_task: asyncio.Task[None] | None = None
         self._start_writer()
     
     def _start_writer(self) -> None:
         """Start background writer task."""
         try:
             loop = asyncio.get_event_loop()
-            self._write_queue = asyncio.Queue()
+            self._write_queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
             if not self._writer_task or self._writer_task.done():
                 self._writer_task = loop.create_task(self._write_worker())
         except RuntimeError:
@@ -87,24 +144,66 @@ class SecurityAudit:
     
     async def _write_worker(self) -> None:
         """Background worker for writing audit events."""
+        queue = self._write_queue
+        if queue is None:
+            return
         while True:
             try:
-                event = await self._write_queue.get()
+                event = await queue.get()
                 if event is None:
                     break
                 
+                # Drain whatever else is already queued so a burst costs one open/write
+                events = [event]
+                stop = False
+                while len(events) < MAX_WRITE_BATCH and not queue.empty():
+                    queued = queue.get_nowait()
+                    if queued is None:
+                        queue.task_done()
+                        stop = True
+                        break
+                    events.append(queued)
+                
                 try:
-                    with open(self.audit_file, "a") as f:
-                        f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    data = _encode_events(events)
+                    with open(self.audit_file, "ab") as f:
+                        f.write(data)
                 except Exception as e:
                     logger.error(f"Failed to write audit event: {e}")
                 finally:
-                    self._write_queue.task_done()
+                    for _ in events:
+                        queue.task_done()
+                
+                if stop:
+                    break
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Audit writer error: {e}")
     
+    def _write_sync(self, data: bytes) -> None:
+        """Append encoded events directly; unbuffered so each write lands immediately."""
+        if self._sync_fh is None or self._sync_fh.closed:
+            self._sync_fh = open(self.audit_file, "ab", buffering=0)
+        self._sync_fh.write(data)
+    
+    def _drain_queue(self) -> None:
+        """Synchronously write every queued event, in order.
+        
+        The writer only yields while waiting on an empty queue, so from the
+        event loop's thread there is never a half-written batch in flight.
+        """
+        queue = self._write_queue
+        if queue is None or queue.empty():
+            return
+        events = []
+        while not queue.empty():
+            queued = queue.get_nowait()
+            queue.task_done()
+            if queued is not None:
+                events.append(queued)
+        self._write_sync(_encode_events(events))
+    
     def log_event(self, event: AuditEvent) -> None:
         """Log a security event."""
         event_dict = event.to_dict()
@@ -120,11 +219,18 @@ class SecurityAudit:
         # Queue for async write
         try:
             if self._write_queue and self._writer_task and not self._writer_task.done():
-                self._write_queue.put_nowait(event_dict)
-            else:
-                # Fallback to sync write
-                with open(self.audit_file, "a") as f:
-                    f.write(json.dumps(event_dict, ensure_ascii=False) + "\n")
+                try:
+                    self._write_queue.put_nowait(event_dict)
+                    return
+                except asyncio.QueueFull:
+                    # Under a flood, shed INFO noise; warnings and criticals are never lost
+                    if event.severity == AuditSeverity.INFO:
+                        self.dropped_events += 1
+                        return
+            
+            # Fallback to sync write, behind anything still queued so the log stays in order
+            self._drain_queue()
+            self._write_sync(_encode_event(event_dict))
         except Exception as e:
             logger.error(f"Failed to log audit event: {e}")
     
@@ -182,32 +288,35 @@ class SecurityAudit:
         severity: AuditSeverity | None = None,
         event_type: str | None = None,
     ) -> list[dict]:
-        """Read audit events with optional filters."""
+        """Read the most recent audit events (oldest first) with optional filters."""
         events = []
         
         if not self.audit_file.exists():
             return events
         
-        with open(self.audit_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                try:
-                    event = json.loads(line)
-                    
-                    # Apply filters
-                    if severity and event.get("severity") != severity.value:
-                        continue
-                    if event_type and event.get("event_type") != event_type:
-                        continue
-                    
-                    events.append(event)
-                except json.JSONDecodeError:
-                    continue
+        # Walk backwards from the end so only the tail of a large log is read
+        for line in _iter_lines_reverse(self.audit_file):
+            line = line.strip()
+            if not line:
+                continue
+            
+            try:
+                event = orjson.loads(line) if orjson else json.loads(line)
+            except ValueError:
+                continue
+            
+            # Apply filters
+            if severity and event.get("severity") != severity.value:
+                continue
+            if event_type and event.get("event_type") != event_type:
+                continue
+            
+            events.append(event)
+            if len(events) >= limit > 0:
+                break
         
-        return events[-limit:]
+        events.reverse()
+        return events
     
     async def flush(self) -> None:
         """Wait for all queued events to be written."""
@@ -216,14 +325,24 @@ class SecurityAudit:
     
     def close(self) -> None:
         """Close the audit logger."""
+        # close() can't wait for the writer task, so write the backlog here
+        try:
+            self._drain_queue()
+        except Exception as e:
+            logger.error(f"Failed to write queued audit events: {e}")
+        
         if self._write_queue:
             try:
                 self._write_queue.put_nowait(None)
-            except:
-                pass
+            except asyncio.QueueFull:
+                pass  # The writer is cancelled below either way
         
         if self._writer_task and not self._writer_task.done():
             self._writer_task.cancel()
+        
+        if self._sync_fh is not None:
+            self._sync_fh.close()
+            self._sync_fh = None
 
 
 # Global audit instance
@@ -9,17 +9,87 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import importlib
 import json
 import logging
-import shutil
-from dataclasses import dataclass, field
+import os
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, ClassVar
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None  # type: ignore[assignment]
+
+try:
+    from watchdog.events import PatternMatchingEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Reload detection doesn't need collision resistance, so prefer the
+# SIMD-accelerated BLAKE3 and fall back to stdlib BLAKE2b
+_new_hasher: Callable[..., Any] = blake3.blake3 if blake3 is not None else hashlib.blake2b
+
+# Files whose modification should trigger a skill reload
+WATCHED_PATTERNS = ["*.py", "manifest.json"]
+
+# Seconds to wait after the first change event so editor save storms
+# (write temp file, rename, touch) collapse into a single reload
+EVENT_DEBOUNCE_SECONDS = 0.2
+
+# Polling fallback: start fast and back off exponentially while idle
+POLL_BASE_INTERVAL = 0.25
+POLL_MAX_INTERVAL = 30.0
+
+
+def _hash_file(path: str | Path) -> str:
+    """Hex digest of a file's contents, or "" if it can't be read."""
+    try:
+        # file_digest streams through a reusable buffer instead of
+        # materialising the whole file as one bytes object
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, _new_hasher).hexdigest()
+    except OSError:
+        return ""
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """
+    copytree copy_function that lets the kernel do the copy.
+    
+    os.copy_file_range clones extents on reflink-capable filesystems
+    (Btrfs, XFS, overlayfs) and copies in-kernel elsewhere; platforms or
+    filesystems without it fall back to shutil.copy2.
+    """
+    import shutil
+    
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    
+    return shutil.copy2(src, dst)
+
 
 @dataclass
 class SkillManifest:
@@ -36,10 +106,13 @@ class SkillManifest:
     license: str = "MIT"
     repository: str = ""
     
+    # Known manifest keys; unknown keys in manifest.json are ignored
+    _FIELDS: ClassVar[frozenset[str]]
+    
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> SkillManifest:
         """Create manifest from dictionary."""
-        return cls(**{k: v for k, v in data.items() if k in cls.__annotations__})
+        return cls(**{k: v for k, v in data.items() if k in cls._FIELDS})
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -57,6 +130,9 @@ class SkillManifest:
         }
 
 
+SkillManifest._FIELDS = frozenset(f.name for f in fields(SkillManifest))
+
+
 @dataclass
 class Skill:
     """A loaded skill with metadata."""
@@ -64,15 +140,32 @@ class Skill:
     manifest: SkillManifest
     module: Any
     path: Path
-    loaded_at: datetime = field(default_factory=datetime.now)
+    loaded_at: int = field(default_factory=time.time_ns)  # Epoch nanoseconds
     enabled: bool = True
+    _stat_cache: tuple[int, int] | None = field(default=None, repr=False, compare=False)
+    _digest_cache: str = field(default="", repr=False, compare=False)
     
     def get_checksum(self) -> str:
-        """Get file checksum for hot-reload detection."""
-        if not self.path.exists():
+        """
+        Get file checksum for hot-reload detection.
+        
+        The digest is only recomputed when the file's (mtime_ns, size)
+        changes, so an unchanged skill costs a single stat() call.
+        """
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            self._stat_cache = None
+            self._digest_cache = ""
             return ""
-        content = self.path.read_bytes()
-        return hashlib.sha256(content).hexdigest()
+        
+        key = (st.st_mtime_ns, st.st_size)
+        if key == self._stat_cache:
+            return self._digest_cache
+        
+        self._digest_cache = _hash_file(self.path)
+        self._stat_cache = key
+        return self._digest_cache
 
 
 class SkillHub:
@@ -92,9 +185,22 @@ class SkillHub:
         
         self._loaded_skills: dict[str, Skill] = {}
         self._file_checksums: dict[str, str] = {}
+        self._manifest_cache: dict[Path, tuple[int, SkillManifest]] = {}
         self._hot_reload_enabled = True
         self._watcher_task: asyncio.Task | None = None
     
+    def _read_manifest(self, manifest_path: Path) -> SkillManifest:
+        """Parse a manifest.json, reusing the last result while its mtime is unchanged."""
+        mtime_ns = manifest_path.stat().st_mtime_ns
+        cached = self._manifest_cache.get(manifest_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        data = manifest_path.read_bytes()
+        manifest = SkillManifest.from_dict(orjson.loads(data) if orjson else json.loads(data))
+        self._manifest_cache[manifest_path] = (mtime_ns, manifest)
+        return manifest
+    
     def discover_local_skills(self) -> list[SkillManifest]:
         """Discover skills installed locally."""
         manifests = []
@@ -106,24 +212,26 @@ class SkillHub:
             manifest_path = skill_dir / "manifest.json"
             if manifest_path.exists():
                 try:
-                    data = json.loads(manifest_path.read_text())
-                    manifest = SkillManifest.from_dict(data)
-                    manifests.append(manifest)
+                    manifests.append(self._read_manifest(manifest_path))
                 except Exception as e:
                     logger.error(f"Failed to load manifest for {skill_dir.name}: {e}")
         
         return manifests
     
-    def load_skill(self, skill_name: str) -> Skill:
+    def load_skill(self, skill_name: str, lazy: bool = True) -> Skill:
         """
         Load a skill by name.
         
         Args:
             skill_name: Name of the skill to load
+            lazy: Defer running the module body until first attribute access.
+                Errors in it (even a SyntaxError) then surface only at that point
             
         Returns:
             Loaded Skill instance
         """
+        import importlib.util
+        
         skill_dir = self.skills_dir / skill_name
         if not skill_dir.exists():
             raise FileNotFoundError(f"Skill not found: {skill_name}")
@@ -133,8 +241,7 @@ class SkillHub:
         if not manifest_path.exists():
             raise FileNotFoundError(f"Manifest not found for skill: {skill_name}")
         
-        manifest_data = json.loads(manifest_path.read_text())
-        manifest = SkillManifest.from_dict(manifest_data)
+        manifest = self._read_manifest(manifest_path)
         
         # Load Python module
         init_file = skill_dir / "__init__.py"
@@ -145,6 +252,12 @@ class SkillHub:
             f"wingman.skills.{skill_name}",
             init_file
         )
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load skill module: {init_file}")
+        if lazy:
+            # Defer executing the module body (and its heavy imports) until the
+            # first attribute access, e.g. when its tools are registered
+            spec.loader = importlib.util.LazyLoader(spec.loader)
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
         
@@ -171,10 +284,10 @@ class SkillHub:
             logger.info(f"Unloaded skill: {skill_name}")
     
     def reload_skill(self, skill_name: str) -> Skill:
-        """Reload a skill (hot-reload)."""
+        """Reload a skill (hot-reload). Runs the module eagerly, so a broken edit raises here."""
         logger.info(f"Reloading skill: {skill_name}")
         self.unload_skill(skill_name)
-        return self.load_skill(skill_name)
+        return self.load_skill(skill_name, lazy=False)
     
     def register_skill_tools(self, skill_name: str, registry: Any) -> None:
         """
@@ -207,13 +320,58 @@ class SkillHub:
         Returns:
             Dict mapping skill names to whether they changed
         """
-        changes = {}
+        # One directory walk + one stat per skill; only skills whose
+        # (mtime_ns, size) moved since the last hash go to the hasher
+        present: dict[str, str] = {}
+        try:
+            with os.scandir(self.skills_dir) as entries:
+                for entry in entries:
+                    if entry.name in self._loaded_skills and entry.is_dir():
+                        present[entry.name] = entry.path
+        except FileNotFoundError:
+            # Skills directory removed (e.g. mid-redeploy); nothing to reload from
+            return {}
         
+        checksums: dict[str, str] = {}
+        # Stale skills grouped by (st_dev, st_ino) so hard-linked or
+        # deduplicated modules are hashed once per tick
+        stale: dict[Any, list[tuple[str, Skill]]] = {}
         for skill_name, skill in self._loaded_skills.items():
             if not skill.enabled:
                 continue
             
-            current_checksum = skill.get_checksum()
+            dir_path = present.get(skill_name)
+            try:
+                st = os.stat(os.path.join(dir_path, "__init__.py")) if dir_path else None
+            except FileNotFoundError:
+                st = None
+            
+            if st is not None and (st.st_mtime_ns, st.st_size) == skill._stat_cache:
+                checksums[skill_name] = skill._digest_cache
+            else:
+                key = (st.st_dev, st.st_ino) if st is not None else skill_name
+                stale.setdefault(key, []).append((skill_name, skill))
+        
+        # Hash on the default thread pool so N changed skills cost
+        # max(per-skill) instead of sum(per-skill)
+        groups = list(stale.values())
+        digests = await asyncio.gather(
+            *(asyncio.to_thread(members[0][1].get_checksum) for members in groups)
+        )
+        for members, digest in zip(groups, digests, strict=True):
+            leader = members[0][1]
+            for skill_name, skill in members:
+                if skill is not leader:
+                    skill._stat_cache = leader._stat_cache
+                    skill._digest_cache = digest
+                checksums[skill_name] = digest
+        
+        changes = {}
+        for skill_name in self._loaded_skills:
+            if skill_name not in checksums:
+                continue
+            
+            current_checksum = checksums[skill_name]
             old_checksum = self._file_checksums.get(skill_name, "")
             
             if current_checksum != old_checksum:
@@ -224,15 +382,101 @@ class SkillHub:
         
         return changes
     
-    async def hot_reload_watcher(self, check_interval: int = 5) -> None:
+    async def hot_reload_watcher(self, check_interval: float = POLL_MAX_INTERVAL) -> None:
         """
         Background task that watches for skill file changes and hot-reloads.
         
+        Uses filesystem notifications (inotify/FSEvents/ReadDirectoryChangesW)
+        via watchdog when installed, otherwise polls checksums.
+        
         Args:
-            check_interval: Seconds between checks (default: 5)
+            check_interval: Longest idle gap between checks when polling;
+                the interval resets to POLL_BASE_INTERVAL on any change
         """
         logger.info("Starting skill hot-reload watcher")
         
+        if WATCHDOG_AVAILABLE:
+            await self._watch_skill_events()
+        else:
+            await self._poll_skill_changes(check_interval)
+        
+        logger.info("Stopped skill hot-reload watcher")
+    
+    async def _watch_skill_events(self) -> None:
+        """Reload skills as filesystem change events arrive."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[tuple[str, bool]] = asyncio.Queue()
+        skills_root = self.skills_dir.resolve()
+        
+        def enqueue(event: Any) -> None:
+            # Runs on the observer thread; hand off to the event loop
+            for raw_path in (event.src_path, getattr(event, "dest_path", "")):
+                if not raw_path:
+                    continue
+                path = Path(os.fsdecode(raw_path)).resolve()
+                try:
+                    relative = path.relative_to(skills_root)
+                except ValueError:
+                    continue
+                if len(relative.parts) > 1:
+                    item = (relative.parts[0], path.name == "manifest.json")
+                    loop.call_soon_threadsafe(queue.put_nowait, item)
+        
+        class Handler(PatternMatchingEventHandler):
+            # Only content-changing events: open/close events would fire on
+            # our own checksum reads and feed back into the queue
+            def on_created(self, event: Any) -> None:
+                enqueue(event)
+            
+            def on_modified(self, event: Any) -> None:
+                enqueue(event)
+            
+            def on_deleted(self, event: Any) -> None:
+                enqueue(event)
+            
+            def on_moved(self, event: Any) -> None:
+                enqueue(event)
+        
+        handler = Handler(patterns=WATCHED_PATTERNS, ignore_directories=True)
+        
+        observer = Observer()
+        observer.schedule(handler, str(skills_root), recursive=True)
+        observer.start()
+        
+        try:
+            while self._hot_reload_enabled:
+                pending = dict([await queue.get()])
+                await asyncio.sleep(EVENT_DEBOUNCE_SECONDS)
+                while not queue.empty():
+                    skill_name, manifest_changed = queue.get_nowait()
+                    pending[skill_name] = pending.get(skill_name, False) or manifest_changed
+                
+                for skill_name, manifest_changed in pending.items():
+                    skill = self._loaded_skills.get(skill_name)
+                    if skill is None or not skill.enabled:
+                        continue
+                    # Checksum doubles as a debounce: touches and rewrites
+                    # with identical content don't trigger a reload
+                    if not manifest_changed and (
+                        skill.get_checksum() == self._file_checksums.get(skill_name, "")
+                    ):
+                        continue
+                    logger.info(f"Detected changes in skill: {skill_name}")
+                    try:
+                        self.reload_skill(skill_name)
+                    except Exception as e:
+                        logger.error(f"Failed to reload skill {skill_name}: {e}")
+        except asyncio.CancelledError:
+            pass
+        finally:
+            observer.stop()
+            observer.join(timeout=1)
+    
+    async def _poll_skill_changes(self, check_interval: float) -> None:
+        """Fallback watcher that polls checksums when watchdog is missing."""
+        ceiling = max(check_interval, POLL_BASE_INTERVAL)
+        delay = POLL_BASE_INTERVAL
+        
         while self._hot_reload_enabled:
             try:
                 changes = await self.check_for_updates()
@@ -244,17 +488,20 @@ class SkillHub:
                         except Exception as e:
                             logger.error(f"Failed to reload skill {skill_name}: {e}")
                 
-                await asyncio.sleep(check_interval)
+                if any(changes.values()):
+                    delay = POLL_BASE_INTERVAL
+                else:
+                    delay = min(delay * 2, ceiling)
+                await asyncio.sleep(delay)
             
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Hot-reload watcher error: {e}")
-                await asyncio.sleep(check_interval)
-        
-        logger.info("Stopped skill hot-reload watcher")
+                delay = ceiling
+                await asyncio.sleep(delay)
     
-    def start_hot_reload(self, check_interval: int = 5) -> None:
+    def start_hot_reload(self, check_interval: float = POLL_MAX_INTERVAL) -> None:
         """Start the hot-reload watcher."""
         if self._watcher_task and not self._watcher_task.done():
             logger.warning("Hot-reload watcher already running")
@@ -290,7 +537,7 @@ class SkillHub:
             "dependencies": skill.manifest.dependencies,
             "tags": skill.manifest.tags,
             "enabled": skill.enabled,
-            "loaded_at": skill.loaded_at.isoformat(),
+            "loaded_at": datetime.fromtimestamp(skill.loaded_at / 1e9).isoformat(),
             "path": str(skill.path),
         }
     
@@ -314,8 +561,10 @@ class SkillHub:
         if dest_path.exists():
             raise FileExistsError(f"Skill already installed: {skill_name}")
         
+        import shutil
+        
         # Copy skill files
-        shutil.copytree(source_path, dest_path)
+        shutil.copytree(source_path, dest_path, copy_function=_clone_file)
         logger.info(f"Installed skill: {skill_name} from {source_path}")
     
     def uninstall_skill(self, skill_name: str) -> None:
@@ -327,6 +576,8 @@ class SkillHub:
         # Remove files
         skill_dir = self.skills_dir / skill_name
         if skill_dir.exists():
+            import shutil
+            
             shutil.rmtree(skill_dir)
             logger.info(f"Uninstalled skill: {skill_name}")
 
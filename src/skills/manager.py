@@ -13,12 +13,60 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# ---<frontmatter>---<body>; the first "---" after the opening one closes it
+_FRONTMATTER_RE = re.compile(r"\A---(.*?)---(.*)\Z", re.DOTALL)
+
+# "key: value" lines inside the frontmatter block
+_FIELD_RE = re.compile(r"^([^:\n]*):(.*)$", re.MULTILINE)
+
+# Threads used to read SKILL.md / config.json files concurrently on load
+LOAD_WORKERS = 8
+
+
+def parse_frontmatter(text: str) -> tuple[str, list[str], list[str], str]:
+    """
+    Split a SKILL.md into its frontmatter fields and instruction body.
+    
+    Kept as a standalone, fully annotated function with no dynamic features
+    so it can be compiled with mypyc if skill loading ever becomes hot.
+    
+    Returns:
+        (description, triggers, tools, instructions)
+    """
+    description = ""
+    triggers: list[str] = []
+    tools: list[str] = []
+    
+    # Parse frontmatter if present (---\n...\n---)
+    match = _FRONTMATTER_RE.match(text)
+    if match is None:
+        return description, triggers, tools, text
+    
+    frontmatter: str = match.group(1)
+    body: str = match.group(2)
+    
+    # Parse YAML-like frontmatter
+    for field_match in _FIELD_RE.finditer(frontmatter):
+        key: str = field_match.group(1).strip().lower()
+        value: str = field_match.group(2).strip()
+        
+        if key == "description":
+            description = value
+        elif key == "triggers":
+            triggers = [t.strip() for t in value.split(",")]
+        elif key == "tools":
+            tools = [t.strip() for t in value.split(",")]
+    
+    return description, triggers, tools, body.strip()
+
 
 @dataclass
 class Skill:
@@ -39,30 +87,7 @@ class Skill:
         
         instructions = skill_md.read_text()
         
-        # Parse frontmatter if present (---\n...\n---)
-        description = ""
-        triggers: list[str] = []
-        tools: list[str] = []
-        
-        if instructions.startswith("---"):
-            parts = instructions.split("---", 2)
-            if len(parts) >= 3:
-                frontmatter = parts[1].strip()
-                instructions = parts[2].strip()
-                
-                # Parse YAML-like frontmatter
-                for line in frontmatter.split("\n"):
-                    if ":" in line:
-                        key, value = line.split(":", 1)
-                        key = key.strip().lower()
-                        value = value.strip()
-                        
-                        if key == "description":
-                            description = value
-                        elif key == "triggers":
-                            triggers = [t.strip() for t in value.split(",")]
-                        elif key == "tools":
-                            tools = [t.strip() for t in value.split(",")]
+        description, triggers, tools, instructions = parse_frontmatter(instructions)
         
         # Load config if exists
         config: dict[str, Any] = {}
@@ -95,6 +120,8 @@ class SkillManager:
         self.skills_dir = skills_dir
         self.skills_dir.mkdir(parents=True, exist_ok=True)
         self._skills: dict[str, Skill] = {}
+        self._trigger_re: re.Pattern[str] | None = None
+        self._trigger_ranks: dict[str, int] = {}
         self._load_skills()
 
     def _load_skills(self) -> None:
@@ -104,15 +131,38 @@ class SkillManager:
         if not self.skills_dir.exists():
             return
         
-        for skill_dir in self.skills_dir.iterdir():
-            if skill_dir.is_dir():
-                skill = Skill.from_path(skill_dir)
+        skill_dirs = [d for d in self.skills_dir.iterdir() if d.is_dir()]
+        if skill_dirs:
+            # Each skill is a couple of small reads; overlap the disk I/O
+            with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(skill_dirs))) as pool:
+                loaded = list(pool.map(Skill.from_path, skill_dirs))
+            
+            for skill in loaded:
                 if skill:
                     self._skills[skill.name] = skill
                     logger.debug(f"Loaded skill: {skill.name}")
         
+        self._build_trigger_index()
         logger.info(f"Loaded {len(self._skills)} skills")
 
+    def _build_trigger_index(self) -> None:
+        """Compile every skill trigger into a single matcher."""
+        ranks: dict[str, int] = {}
+        for rank, skill in enumerate(self._skills.values()):
+            for trigger in skill.triggers:
+                ranks.setdefault(trigger.lower(), rank)
+        
+        self._trigger_ranks = ranks
+        if not ranks:
+            self._trigger_re = None
+            return
+        
+        # A zero-width lookahead reports a match at every start position, and
+        # alternatives are listed in skill order, so the alternative chosen at
+        # each position belongs to the earliest skill with a trigger there
+        alternation = "|".join(re.escape(trigger) for trigger in ranks)
+        self._trigger_re = re.compile(f"(?=({alternation}))")
+
     def get_skill(self, name: str) -> Skill | None:
         """Get a skill by name."""
         return self._skills.get(name)
@@ -130,14 +180,20 @@ class SkillManager:
         Find a skill that matches the input text based on triggers.
         Returns the first matching skill or None.
         """
-        text_lower = text.lower()
+        if self._trigger_re is None:
+            return None
         
-        for skill in self._skills.values():
-            for trigger in skill.triggers:
-                if trigger.lower() in text_lower:
-                    return skill
+        best: int | None = None
+        for match in self._trigger_re.finditer(text.lower()):
+            rank = self._trigger_ranks[match.group(1)]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
         
-        return None
+        if best is None:
+            return None
+        return list(self._skills.values())[best]
 
     def create_skill(
         self,
@@ -6,10 +6,22 @@ Provides utilities for testing agents, tools, and workflows.
 
 from __future__ import annotations
 
-from .agent_test import AgentTester, AgentTestCase, AgentTestResult
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent_test import AgentTester, AgentTestCase, AgentTestResult
 
 __all__ = [
     "AgentTester",
     "AgentTestCase",
     "AgentTestResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer importing the framework until one of its classes is used
+    if name in __all__:
+        from . import agent_test
+        
+        return getattr(agent_test, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,15 +9,35 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from dataclasses import dataclass, field
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
-import pytest
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile keywords into one alternation; the lookahead reports overlapping hits."""
+    alternation = "|".join(re.escape(k) for k in sorted(set(keywords), key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))")
+
+
+def _missing_keywords(keywords: tuple[str, ...], text: str) -> set[str]:
+    """Return the keywords that don't occur in text, in a single regex sweep."""
+    hits = {m.group(1) for m in _keyword_pattern(keywords).finditer(text)}
+    # Only one alternative is captured per position, so confirm the rest directly
+    return {k for k in keywords if k not in hits and k not in text}
+
+
 @dataclass
 class AgentTestCase:
     """Test case for agent."""
@@ -60,6 +80,18 @@ class AgentTester:
         """
         self.settings = settings
         self.results: List[AgentTestResult] = []
+        
+        # Running totals so get_summary() doesn't rescan results
+        self._passed_count = 0
+        self._total_duration = 0.0
+        self._total_iterations = 0
+    
+    def _record(self, result: AgentTestResult) -> None:
+        """Append a result and fold it into the running totals."""
+        self.results.append(result)
+        self._passed_count += result.passed
+        self._total_duration += result.duration_seconds
+        self._total_iterations += result.iterations
     
     async def run_test(
         self,
@@ -76,9 +108,8 @@ class AgentTester:
         Returns:
             Test result
         """
-        import time
-        
-        start_time = time.time()
+        # Monotonic integer clock: immune to wall-clock jumps, no float/datetime churn
+        start_ns = time.monotonic_ns()
         
         try:
             # Process message through agent
@@ -87,7 +118,7 @@ class AgentTester:
                 max_iterations=test_case.max_iterations,
             )
             
-            duration = time.time() - start_time
+            duration = (time.monotonic_ns() - start_ns) / 1e9
             
             # Extract tools used (from session state)
             tools_used = getattr(session, "_tools_used", [])
@@ -97,22 +128,33 @@ class AgentTester:
             passed = True
             error = None
             
+            # Fold case once; casefold() also matches e.g. "ß" against "ss"
+            response_cf = response.casefold()
+            
             if test_case.expected_output:
-                if test_case.expected_output.lower() not in response.lower():
+                if test_case.expected_output.casefold() not in response_cf:
                     passed = False
                     error = f"Expected '{test_case.expected_output}' in output"
             
+            # Each check reports its last failure, as the per-item loops did
             if test_case.expected_tools:
-                for tool in test_case.expected_tools:
-                    if tool not in tools_used:
-                        passed = False
-                        error = f"Expected tool '{tool}' not used"
+                missing_tools = set(test_case.expected_tools).difference(tools_used)
+                if missing_tools:
+                    passed = False
+                    tool = next(t for t in reversed(test_case.expected_tools) if t in missing_tools)
+                    error = f"Expected tool '{tool}' not used"
             
             if test_case.expected_keywords:
-                for keyword in test_case.expected_keywords:
-                    if keyword.lower() not in response.lower():
-                        passed = False
-                        error = f"Expected keyword '{keyword}' not in output"
+                missing_keywords = _missing_keywords(
+                    tuple(k.casefold() for k in test_case.expected_keywords), response_cf
+                )
+                if missing_keywords:
+                    passed = False
+                    keyword = next(
+                        k for k in reversed(test_case.expected_keywords)
+                        if k.casefold() in missing_keywords
+                    )
+                    error = f"Expected keyword '{keyword}' not in output"
             
             result = AgentTestResult(
                 test_name=test_case.name,
@@ -125,11 +167,11 @@ class AgentTester:
                 metadata=test_case.metadata,
             )
             
-            self.results.append(result)
+            self._record(result)
             return result
         
         except asyncio.TimeoutError:
-            duration = time.time() - start_time
+            duration = (time.monotonic_ns() - start_ns) / 1e9
             result = AgentTestResult(
                 test_name=test_case.name,
                 passed=False,
@@ -139,11 +181,11 @@ class AgentTester:
                 duration_seconds=duration,
                 error=f"Test timeout after {test_case.timeout_seconds}s",
             )
-            self.results.append(result)
+            self._record(result)
             return result
         
         except Exception as e:
-            duration = time.time() - start_time
+            duration = (time.monotonic_ns() - start_ns) / 1e9
             result = AgentTestResult(
                 test_name=test_case.name,
                 passed=False,
@@ -153,21 +195,50 @@ class AgentTester:
                 duration_seconds=duration,
                 error=str(e),
             )
-            self.results.append(result)
+            self._record(result)
             return result
     
     async def run_test_suite(
         self,
         test_cases: List[AgentTestCase],
         session=None,
+        session_factory: Callable[[], Any] | None = None,
+        concurrency: int = 4,
     ) -> List[AgentTestResult]:
-        """Run multiple test cases."""
-        results = []
+        """
+        Run multiple test cases.
+        
+        With a shared ``session`` tests run one after another. With a
+        ``session_factory`` each test gets its own session and up to
+        ``concurrency`` tests run at once.
+        
+        Args:
+            test_cases: Test cases to run
+            session: Agent session shared by all tests
+            session_factory: Callable (sync or async) returning a fresh session
+            concurrency: Maximum tests in flight when using session_factory
         
-        for test_case in test_cases:
-            logger.info(f"Running test: {test_case.name}")
-            result = await self.run_test(test_case, session)
-            results.append(result)
+        Returns:
+            Results in the same order as test_cases
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency) if session_factory else 1)
+        
+        async def run_one(test_case: AgentTestCase) -> AgentTestResult:
+            async with semaphore:
+                logger.info(f"Running test: {test_case.name}")
+                test_session = session
+                if session_factory is not None:
+                    test_session = session_factory()
+                    if hasattr(test_session, "__await__"):
+                        test_session = await test_session
+                
+                try:
+                    result = await self.run_test(test_case, test_session)
+                finally:
+                    if session_factory is not None and hasattr(test_session, "close"):
+                        closed = test_session.close()
+                        if hasattr(closed, "__await__"):
+                            await closed
             
             status = "✓" if result.passed else "✗"
             logger.info(
@@ -175,18 +246,19 @@ class AgentTester:
                 f"{result.duration_seconds:.2f}s, "
                 f"{result.iterations} iterations"
             )
+            return result
         
-        return results
+        return list(await asyncio.gather(*(run_one(tc) for tc in test_cases)))
     
     def get_summary(self) -> dict:
         """Get test summary statistics."""
         total = len(self.results)
-        passed = sum(1 for r in self.results if r.passed)
+        passed = self._passed_count
         failed = total - passed
         
         if total > 0:
-            avg_duration = sum(r.duration_seconds for r in self.results) / total
-            avg_iterations = sum(r.iterations for r in self.results) / total
+            avg_duration = self._total_duration / total
+            avg_iterations = self._total_iterations / total
         else:
             avg_duration = 0
             avg_iterations = 0
@@ -204,38 +276,32 @@ class AgentTester:
         """Save test results to JSON file."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        data = {
-            "summary": self.get_summary(),
-            "results": [
-                {
-                    "test_name": r.test_name,
-                    "passed": r.passed,
-                    "output": r.output,
-                    "tools_used": r.tools_used,
-                    "iterations": r.iterations,
-                    "duration_seconds": r.duration_seconds,
-                    "error": r.error,
-                    "metadata": r.metadata,
-                }
-                for r in self.results
-            ],
-        }
-        
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        if orjson:
+            # orjson serializes the result dataclasses natively, so no
+            # intermediate list of dicts is built
+            data = {"summary": self.get_summary(), "results": self.results}
+            output_path.write_bytes(orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS,
+            ))
+        else:
+            data = {
+                "summary": self.get_summary(),
+                "results": [asdict(r) for r in self.results],
+            }
+            with open(output_path, "w") as f:
+                json.dump(data, f, indent=2)
         
         logger.info(f"Saved test results to {output_path}")
 
 
 # Pytest fixtures
-@pytest.fixture
-def agent_tester(settings=None):
+def _agent_tester_fixture(settings=None):
     """Pytest fixture for agent tester."""
     return AgentTester(settings=settings)
 
 
-@pytest.fixture
-async def agent_session(settings=None):
+async def _agent_session_fixture(settings=None):
     """Pytest fixture for agent session."""
     from src.core.session import AgentSession
     
@@ -250,6 +316,28 @@ async def agent_session(settings=None):
     await session.close()
 
 
+_FIXTURES = {
+    "agent_tester": _agent_tester_fixture,
+    "agent_session": _agent_session_fixture,
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Fixtures are wrapped on first access so importing this module
+    # doesn't pull in pytest for non-test callers
+    if name in _FIXTURES:
+        import pytest
+        
+        fixture = pytest.fixture(name=name)(_FIXTURES[name])
+        globals()[name] = fixture
+        return fixture
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_FIXTURES))
+
+
 # Example test cases
 EXAMPLE_TEST_CASES = [
     AgentTestCase(
@@ -0,0 +1,79 @@
+"""
+On-disk response cache for browser extraction tools.
+
+Entries live under ``<workspace>/browser_cache/<key[:2]>/<key>.json`` as
+``{"value": ..., "expires_at": <epoch seconds>}``. Keys are SHA-256 hex
+digests built by the caller with `make_key`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any
+
+from src.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Default time-to-live for cached extractions (7 days)
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def _get_cache_dir() -> Path:
+    """Get the browser cache directory inside the workspace."""
+    return get_settings().workspace_path / "browser_cache"
+
+
+def _entry_path(key: str) -> Path:
+    return _get_cache_dir() / key[:2] / f"{key}.json"
+
+
+def make_key(*parts: str) -> str:
+    """Build a cache key from the request components."""
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> Any | None:
+    """Return the cached value for key, or None if missing or expired."""
+    path = _entry_path(key)
+    try:
+        entry = json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.debug(f"Discarding unreadable browser cache entry {key}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+
+    if entry.get("expires_at", 0) < time.time():
+        path.unlink(missing_ok=True)
+        return None
+    return entry.get("value")
+
+
+def set(key: str, value: Any, ttl: float = DEFAULT_TTL_SECONDS) -> None:
+    """Store value under key for ttl seconds."""
+    path = _entry_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps({"value": value, "expires_at": time.time() + ttl}, default=str)
+
+    # Write-then-rename so readers never see a half-written entry
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(payload)
+    os.replace(tmp_path, path)
+
+
+def clear() -> int:
+    """Remove every cached entry. Returns the number of entries removed."""
+    cache_dir = _get_cache_dir()
+    if not cache_dir.exists():
+        return 0
+    count = sum(1 for _ in cache_dir.glob("*/*.json"))
+    shutil.rmtree(cache_dir)
+    return count
@@ -0,0 +1,134 @@
+"""
+Persistent osascript host shared by the macOS and desktop tools.
+
+One long-lived ``osascript`` process runs every AppleScript the tools send,
+so repeat calls skip process start-up and reuse compiled scripts.
+"""
+
+from __future__ import annotations
+
+import json
+import select
+import subprocess
+import threading
+import time
+from typing import Any
+
+_pipe: "OsaPipe | None" = None
+
+# JXA host run by one long-lived osascript process. It reads one JSON-encoded
+# AppleScript source per stdin line, runs it with NSAppleScript (keeping
+# compiled scripts for reuse) and answers with one JSON line per request.
+_SERVER_JS = r"""
+ObjC.import('Foundation');
+function unpack(d) {
+  if (!d || d.isNil()) return null;
+  const n = d.numberOfItems;
+  if (n > 0 && d.stringValue.isNil()) {
+    const items = [];
+    for (let i = 1; i <= n; i++) items.push(unpack(d.descriptorAtIndex(i)));
+    return items;
+  }
+  const s = d.stringValue;
+  return s.isNil() ? null : s.js;
+}
+function reply(obj) {
+  $.NSFileHandle.fileHandleWithStandardOutput.writeData(
+    $(JSON.stringify(obj) + '\n').dataUsingEncoding($.NSUTF8StringEncoding));
+}
+const stdin = $.NSFileHandle.fileHandleWithStandardInput;
+let compiled = {};
+let pending = '';
+for (;;) {
+  const data = stdin.availableData;
+  if (data.length === 0) break;
+  pending += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+  let nl;
+  while ((nl = pending.indexOf('\n')) >= 0) {
+    const source = JSON.parse(pending.slice(0, nl));
+    pending = pending.slice(nl + 1);
+    if (Object.keys(compiled).length > 64) compiled = {};
+    const script = compiled[source] || (compiled[source] = $.NSAppleScript.alloc.initWithSource(source));
+    const error = Ref();
+    const result = script.executeAndReturnError(error);
+    if (result.isNil()) {
+      const info = ObjC.deepUnwrap(error[0]) || {};
+      reply({error: String(info.NSAppleScriptErrorMessage || 'AppleScript error')});
+    } else {
+      reply({result: unpack(result)});
+    }
+  }
+}
+"""
+
+
+class OsaPipe:
+    """
+    Long-lived osascript process that AppleScript is piped through.
+    
+    Spawning osascript per call pays fork/exec plus AppleScript start-up
+    (~100-300 ms); one persistent host brings repeat calls down to the
+    script's own run time. Lists come back as Python lists of strings.
+    """
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> subprocess.Popen[bytes]:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["osascript", "-l", "JavaScript", "-e", _SERVER_JS],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def run(self, script: str, timeout: float = 3) -> Any:
+        """
+        Run an AppleScript and return its result; raises on error or timeout.
+        
+        The host runs one script at a time, so callers queue on a lock; the
+        timeout covers that wait as well as the script itself.
+        """
+        deadline = time.monotonic() + timeout
+        if not self._lock.acquire(timeout=timeout):
+            raise TimeoutError(f"osascript host still busy after {timeout}s")
+        try:
+            proc = self._ensure_started()
+            stdin, stdout = proc.stdin, proc.stdout
+            assert stdin is not None and stdout is not None  # both opened as PIPE
+            stdin.write(json.dumps(script).encode() + b"\n")
+            stdin.flush()
+            
+            ready, _, _ = select.select([stdout], [], [], max(deadline - time.monotonic(), 0))
+            if not ready:
+                # The host is stuck on this script; restart it next call
+                self.close()
+                raise TimeoutError(f"AppleScript did not finish within {timeout}s")
+            line = stdout.readline()
+        finally:
+            self._lock.release()
+        
+        if not line:
+            raise RuntimeError("osascript exited unexpectedly")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        return reply.get("result")
+
+    def close(self) -> None:
+        """Terminate the osascript host if it's running."""
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+
+def get_osa_pipe() -> OsaPipe:
+    """Return the process-wide osascript host (started lazily on first run)."""
+    global _pipe
+    if _pipe is None:
+        _pipe = OsaPipe()
+    return _pipe
@@ -0,0 +1,110 @@
+"""
+In-memory LRU + TTL cache for knowledge-base search results.
+
+Document tools look up `(collection, query digest, n_results, write
+generation)` here before running an embedding + similarity search. The
+generation is the vector store's per-collection write counter, so entries
+made before any write to the collection simply stop matching. Size and lifetime are configured with the
+``WINGMAN_QCACHE_SIZE`` (default 1024) and ``WINGMAN_QCACHE_TTL`` (seconds,
+default 300) environment variables.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+DEFAULT_SIZE = 1024
+DEFAULT_TTL_SECONDS = 300.0
+
+_cache: "QueryCache | None" = None
+
+# (collection, query digest, n_results, write generation); see make_key
+CacheKey = tuple[str, bytes, int, int]
+
+
+def make_key(
+    collection: str,
+    query: str,
+    n_results: int,
+    generation: int = 0,
+) -> CacheKey:
+    """Build a cache key; the query is hashed so long queries stay cheap to compare."""
+    digest = hashlib.blake2b(query.encode("utf-8"), digest_size=16).digest()
+    return (collection, digest, n_results, generation)
+
+
+class QueryCache:
+    """Thread-safe LRU cache whose entries also expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int = DEFAULT_SIZE, ttl: float = DEFAULT_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expiry on the monotonic clock, value), least recently used first
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: CacheKey) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries if full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, collection: str) -> None:
+        """Drop every entry for a collection (keys start with the collection name)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == collection]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def get_query_cache() -> QueryCache:
+    """Return the process-wide query cache, creating it from the environment on first use."""
+    global _cache
+    if _cache is None:
+        _cache = QueryCache(
+            maxsize=int(os.getenv("WINGMAN_QCACHE_SIZE", DEFAULT_SIZE)),
+            ttl=float(os.getenv("WINGMAN_QCACHE_TTL", DEFAULT_TTL_SECONDS)),
+        )
+    return _cache
@@ -0,0 +1,181 @@
+"""
+Similarity cache for knowledge-base search results.
+
+Sits behind the exact-match query cache: stores normalized query embeddings
+with their results, and answers a new query from the closest cached one
+(same collection, result count and collection write generation) when their
+cosine similarity reaches that slot's threshold. Paraphrases of a recent query then cost one
+matrix-vector product over the cache instead of a full similarity search.
+
+Thresholds adapt per slot. A sample of hits is re-checked against the real
+search; a slot whose cached results matched is loosened slightly, one that
+missed is tightened, each as an exponential moving average toward the
+threshold bounds.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+DEFAULT_CAPACITY = 2048
+DEFAULT_THRESHOLD = 0.95
+MIN_THRESHOLD = 0.90
+MAX_THRESHOLD = 0.995
+
+# Weight of each verification in a slot's threshold moving average
+THRESHOLD_EMA = 0.2
+
+# Fraction of hits re-run against the vector store to adapt thresholds
+VERIFY_RATE = 0.1
+
+_cache: "SemanticCache | None" = None
+
+
+@dataclass
+class SemanticHit:
+    """A cached result set close enough to the query to reuse."""
+    slot: int
+    similarity: float
+    results: list[dict[str, Any]]
+
+
+class SemanticCache:
+    """Fixed-capacity, thread-safe cache of query embeddings and their results."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, threshold: float = DEFAULT_THRESHOLD):
+        self.capacity = capacity
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        # (capacity, dim) unit query vectors; allocated on first insert
+        self._keys: np.ndarray | None = None
+        self._occupied = np.zeros(capacity, dtype=bool)
+        self._collections = np.full(capacity, -1, dtype=np.int32)
+        self._n_results = np.zeros(capacity, dtype=np.int32)
+        # Vector-store write generation each entry was computed at
+        self._generations = np.zeros(capacity, dtype=np.int64)
+        self._thresholds = np.full(capacity, threshold, dtype=np.float32)
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._results: list[list[dict[str, Any]] | None] = [None] * capacity
+        self._collection_ids: dict[str, int] = {}
+        self._clock = 0
+
+    def lookup(
+        self,
+        collection: str,
+        n_results: int,
+        query_vector: np.ndarray,
+        generation: int = 0,
+    ) -> SemanticHit | None:
+        """Return the most similar cached entry if it clears its slot's threshold."""
+        with self._lock:
+            coll_id = self._collection_ids.get(collection)
+            if self._keys is None or coll_id is None or len(query_vector) != self._keys.shape[1]:
+                return None
+            mask = (
+                self._occupied
+                & (self._collections == coll_id)
+                & (self._n_results == n_results)
+                & (self._generations == generation)
+            )
+            if not mask.any():
+                return None
+
+            sims = self._keys @ query_vector.astype(np.float32, copy=False)
+            sims[~mask] = -np.inf
+            slot = int(np.argmax(sims))
+            similarity = float(sims[slot])
+            if similarity < self._thresholds[slot]:
+                return None
+
+            results = self._results[slot]
+            if results is None:
+                return None
+
+            self._clock += 1
+            self._last_used[slot] = self._clock
+            return SemanticHit(slot, similarity, results)
+
+    def should_verify(self) -> bool:
+        """Whether this hit should be re-checked against the real search."""
+        return random.random() < VERIFY_RATE
+
+    def feedback(self, hit: SemanticHit, fresh_results: list[dict[str, Any]]) -> bool:
+        """
+        Adapt a slot's threshold from a verified hit.
+
+        Returns True if the cached results matched the fresh ones.
+        """
+        matched = [r["id"] for r in hit.results] == [r["id"] for r in fresh_results]
+        with self._lock:
+            if self._results[hit.slot] is not hit.results:
+                return matched  # Slot was evicted or invalidated meanwhile
+            tau = float(self._thresholds[hit.slot])
+            if matched:
+                tau += THRESHOLD_EMA * (MIN_THRESHOLD - tau)
+            else:
+                # Also make sure this query no longer hits the slot
+                tau = max(tau + THRESHOLD_EMA * (MAX_THRESHOLD - tau), min(hit.similarity + 1e-4, MAX_THRESHOLD))
+            self._thresholds[hit.slot] = tau
+        return matched
+
+    def put(
+        self,
+        collection: str,
+        n_results: int,
+        query_vector: np.ndarray,
+        results: list[dict[str, Any]],
+        generation: int = 0,
+    ) -> None:
+        """Cache results for a query embedding, evicting the least recently used slot if full."""
+        if self.capacity <= 0:
+            return
+        vector = np.asarray(query_vector, dtype=np.float32)
+        with self._lock:
+            if self._keys is None or self._keys.shape[1] != len(vector):
+                # First insert, or the embedding model changed: start over
+                self._keys = np.zeros((self.capacity, len(vector)), dtype=np.float32)
+                self._occupied[:] = False
+                self._results = [None] * self.capacity
+
+            coll_id = self._collection_ids.setdefault(collection, len(self._collection_ids))
+            # Entries from before the collection's latest write can never hit again
+            stale = self._occupied & (self._collections == coll_id) & (self._generations < generation)
+            for stale_slot in np.flatnonzero(stale):
+                self._results[stale_slot] = None
+            self._occupied &= ~stale
+
+            free = np.flatnonzero(~self._occupied)
+            slot = int(free[0]) if len(free) else int(np.argmin(self._last_used))
+
+            self._clock += 1
+            self._keys[slot] = vector
+            self._occupied[slot] = True
+            self._collections[slot] = coll_id
+            self._n_results[slot] = n_results
+            self._generations[slot] = generation
+            self._thresholds[slot] = self.threshold
+            self._last_used[slot] = self._clock
+            self._results[slot] = results
+
+    def invalidate(self, collection: str) -> None:
+        """Drop every entry for a collection."""
+        with self._lock:
+            coll_id = self._collection_ids.get(collection)
+            if coll_id is None:
+                return
+            for slot in np.flatnonzero(self._occupied & (self._collections == coll_id)):
+                self._results[slot] = None
+            self._occupied &= self._collections != coll_id
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Return the process-wide similarity cache."""
+    global _cache
+    if _cache is None:
+        _cache = SemanticCache()
+    return _cache
@@ -19,16 +19,209 @@ Installation:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import importlib
 import json
 import logging
+import re
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
 from src.config.settings import get_settings
+from src.tools import _browser_cache
 from src.tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None  # type: ignore[assignment,misc]
+
+# Tool results whose compact JSON is at least this long aren't pretty-printed
+PRETTY_JSON_MAX_CHARS = 4096
+
+# First non-whitespace character of a task's output
+_FIRST_CHAR_RE = re.compile(r"\S")
+
+# max_steps upper bounds for run_tasks bins; anything larger gets its own bin
+STEP_BINS = (10, 30, 50)
+
+# Model used for each LLM provider
+PROVIDER_MODELS = {
+    "browser_use": "",
+    "openai": "gpt-4o",
+    "anthropic": "claude-3-5-sonnet-20241022",
+    "gemini": "gemini-2.5-flash",
+}
+
+# Upper bound on the fill_form task prompt sent to the LLM
+MAX_FORM_PROMPT_CHARS = 8192
+
+# (module, class, pip package) of the chat model for each LLM provider
+PROVIDER_CLASSES = {
+    "browser_use": ("browser_use", "ChatBrowserUse", "browser-use"),
+    "openai": ("langchain_openai", "ChatOpenAI", "langchain-openai"),
+    "anthropic": ("langchain_anthropic", "ChatAnthropic", "langchain-anthropic"),
+    "gemini": ("langchain_google_genai", "ChatGoogleGenerativeAI", "langchain-google-genai"),
+}
+
+# (settings.providers entry, constructor kwarg) for providers given an API key
+PROVIDER_KEY_ARGS = {
+    "openai": ("openai", "api_key"),
+    "gemini": ("gemini", "google_api_key"),
+}
+
+# Constructor kwarg taking an httpx.AsyncClient, for providers that accept one;
+# they get the process-wide provider client so TLS connections are reused
+PROVIDER_HTTP_CLIENT_ARGS = {
+    "openai": "http_async_client",
+}
+
+# Constructed LLM clients keyed by (provider, model, api_key, id of the shared
+# HTTP client), so repeated tool calls reuse one client and its connection pool
+_LLM_CACHE: dict[tuple[str, str, str | None, int | None], Any] = {}
+
+
+def _cached_llm(key: tuple[str, str, str | None, int | None], build: Callable[[], Any]) -> Any:
+    """Return the cached LLM client for key, building it on first use."""
+    llm = _LLM_CACHE.get(key)
+    if llm is None:
+        llm = _LLM_CACHE[key] = build()
+    return llm
+
+
+def _smart_dumps(obj: Any) -> str:
+    """Serialize a tool result: indented when small, compact when large."""
+    if orjson:
+        compact = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    else:
+        compact = json.dumps(obj, separators=(",", ":"))
+    if len(compact) < PRETTY_JSON_MAX_CHARS:
+        return json.dumps(obj, indent=2)
+    return compact
+
+
+@functools.lru_cache(maxsize=None)
+def _provider_factory(name: str) -> type:
+    """Import and return the chat model class for an LLM provider."""
+    try:
+        module_name, class_name, package = PROVIDER_CLASSES[name]
+    except KeyError:
+        raise ValueError(f"Unsupported LLM provider: {name}") from None
+    try:
+        chat_cls: type = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError):
+        raise ImportError(f"{package} not installed. Run: pip install {package}") from None
+    return chat_cls
+
+
+async def _close_browser(browser: Any) -> None:
+    """Shut a browser session down, logging rather than raising on failure."""
+    close = getattr(browser, "kill", None) or getattr(browser, "close", None)
+    if close is not None:
+        try:
+            await close()
+        except Exception as e:
+            logger.warning(f"Failed to close browser: {e}")
+
+
+@functools.lru_cache(maxsize=256)
+def _form_template(fields: tuple[str, ...]) -> str:
+    """Render the fill_form instruction skeleton for a form's field names.
+
+    Values are substituted positionally per call; field names come from the
+    LLM, so the cache is bounded.
+    """
+    return "\n".join(
+        f"- Fill '{name.replace('{', '{{').replace('}', '}}')}' with '{{{i}}}'"
+        for i, name in enumerate(fields)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _load_browser_use() -> tuple[Any, Any] | None:
+    """Import browser-use once per process; None if it isn't installed."""
+    try:
+        from browser_use import Agent, Browser
+    except ImportError:
+        return None
+    return Agent, Browser
+
+
+# Page fields browser_extract can answer from static HTML, by prompt term
+_FAST_FIELDS = {
+    "title": "title",
+    "meta description": "description",
+    "h1": "h1",
+    "canonical url": "canonical_url",
+}
+_FAST_FIELD_RE = re.compile(r"\b(title|meta description|h1|canonical url)\b", re.I)
+
+# Prompts made only of fast fields and these filler words skip the browser
+_FAST_PROMPT_RE = re.compile(
+    r"(?:\W|\b(?:title|meta description|h1|canonical url|the|and|or|of|from|"
+    r"page|get|extract|return|its)\b)*",
+    re.I,
+)
+
+# Timeout for the static-page fetch before falling back to the browser
+FAST_EXTRACT_TIMEOUT = 3.0
+
+
+async def _try_fast_extract(url: str, prompt: str) -> dict[str, Any] | None:
+    """
+    Answer simple extractions (title, meta description, h1, canonical url)
+    with one HTTP GET and an HTML parse.
+
+    Returns None whenever the browser is needed: selectolax isn't installed,
+    the prompt asks for anything else, the fetch fails, or a field is missing.
+    """
+    if HTMLParser is None or not _FAST_PROMPT_RE.fullmatch(prompt):
+        return None
+    wanted = dict.fromkeys(_FAST_FIELDS[m.lower()] for m in _FAST_FIELD_RE.findall(prompt))
+    if not wanted:
+        return None
+
+    import httpx
+
+    from src.providers._http import get_shared_client
+
+    try:
+        resp = await get_shared_client().get(url, follow_redirects=True, timeout=FAST_EXTRACT_TIMEOUT)
+    except (httpx.HTTPError, ValueError) as e:
+        logger.debug(f"Fast extract fetch failed for {url}: {e}")
+        return None
+    if resp.status_code != 200 or "html" not in resp.headers.get("content-type", ""):
+        return None
+
+    tree = HTMLParser(resp.text)
+    data: dict[str, Any] = {}
+    for key in wanted:
+        if key == "title":
+            node = tree.css_first("title")
+            value = node.text(strip=True) if node else None
+        elif key == "h1":
+            node = tree.css_first("h1")
+            value = node.text(strip=True) if node else None
+        elif key == "description":
+            node = tree.css_first('meta[name="description"]')
+            value = node.attributes.get("content") if node else None
+        else:
+            node = tree.css_first('link[rel="canonical"]')
+            value = node.attributes.get("href") if node else None
+        if not value:
+            return None
+        data[key] = value
+    return data
+
 
 @dataclass
 class BrowserTaskResult:
@@ -63,55 +256,60 @@ class BrowserAgent:
         self.headless = headless
         self._agent = None
         self._browser = None
+        self._browser_lock = asyncio.Lock()
+        # Held while an Agent drives the shared browser; two at once navigate over each other
+        self._browser_in_use = asyncio.Lock()
+
+    async def _get_browser(self, Browser: Any) -> Any:
+        """Launch the shared browser on first use and reuse it for later tasks."""
+        async with self._browser_lock:
+            if self._browser is None:
+                # keep_alive stops each Agent run from tearing the browser down
+                self._browser = Browser(headless=self.headless, keep_alive=True)
+            return self._browser
+
+    @contextlib.asynccontextmanager
+    async def _lease_browser(self, Browser: Any, browser: Any = None):
+        """Yield `browser` if given, else the shared browser held exclusively."""
+        if browser is not None:
+            yield browser
+            return
+        async with self._browser_in_use:
+            yield await self._get_browser(Browser)
+
+    async def aclose(self) -> None:
+        """Shut down the shared browser. Idempotent."""
+        async with self._browser_lock:
+            browser, self._browser = self._browser, None
+        if browser is not None:
+            await _close_browser(browser)
 
     async def _get_llm(self):
         """Get the LLM instance based on provider."""
         if self.llm_provider == "browser_use":
             # Use Browser-Use's optimized model
             try:
-                from browser_use import ChatBrowserUse
-                return ChatBrowserUse()
+                chat_cls = _provider_factory("browser_use")
+                return _cached_llm(("browser_use", PROVIDER_MODELS["browser_use"], None, None), chat_cls)
             except ImportError:
                 logger.warning("ChatBrowserUse not available, falling back to OpenAI")
                 self.llm_provider = "openai"
-        
-        if self.llm_provider == "openai":
-            try:
-                from langchain_openai import ChatOpenAI
-                return ChatOpenAI(
-                    model="gpt-4o",
-                    api_key=self.settings.providers.openai.api_key,
-                )
-            except ImportError:
-                raise ImportError(
-                    "langchain-openai not installed. Run: pip install langchain-openai"
-                )
-        
-        elif self.llm_provider == "anthropic":
-            try:
-                from langchain_anthropic import ChatAnthropic
-                return ChatAnthropic(
-                    model="claude-3-5-sonnet-20241022",
-                )
-            except ImportError:
-                raise ImportError(
-                    "langchain-anthropic not installed. Run: pip install langchain-anthropic"
-                )
-        
-        elif self.llm_provider == "gemini":
-            try:
-                from langchain_google_genai import ChatGoogleGenerativeAI
-                return ChatGoogleGenerativeAI(
-                    model="gemini-2.5-flash",
-                    google_api_key=self.settings.providers.gemini.api_key,
-                )
-            except ImportError:
-                raise ImportError(
-                    "langchain-google-genai not installed. Run: pip install langchain-google-genai"
-                )
-        
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
+
+        chat_cls = _provider_factory(self.llm_provider)
+        model = PROVIDER_MODELS[self.llm_provider]
+        kwargs: dict[str, Any] = {"model": model}
+        api_key = None
+        if self.llm_provider in PROVIDER_KEY_ARGS:
+            settings_name, kwarg = PROVIDER_KEY_ARGS[self.llm_provider]
+            api_key = kwargs[kwarg] = getattr(self.settings.providers, settings_name).api_key
+        client_id = None
+        if self.llm_provider in PROVIDER_HTTP_CLIENT_ARGS:
+            from src.providers._http import get_shared_client
+
+            # A recreated shared client (after aclose) gets a fresh LLM client
+            http_client = kwargs[PROVIDER_HTTP_CLIENT_ARGS[self.llm_provider]] = get_shared_client()
+            client_id = id(http_client)
+        return _cached_llm((self.llm_provider, model, api_key, client_id), lambda: chat_cls(**kwargs))
 
     async def run_task(
         self,
@@ -119,6 +317,7 @@ class BrowserAgent:
         url: str | None = None,
         max_steps: int = 50,
         save_screenshots: bool = False,
+        browser: Any = None,
     ) -> BrowserTaskResult:
         """
         Run a browser automation task.
@@ -128,13 +327,13 @@ class BrowserAgent:
             url: Optional starting URL
             max_steps: Maximum steps before timeout
             save_screenshots: Whether to capture screenshots
+            browser: Browser session to drive; defaults to the shared one
             
         Returns:
             BrowserTaskResult with output and any extracted data
         """
-        try:
-            from browser_use import Agent, Browser
-        except ImportError:
+        browser_use = _load_browser_use()
+        if browser_use is None:
             return BrowserTaskResult(
                 success=False,
                 error=(
@@ -144,30 +343,29 @@ class BrowserAgent:
                 ),
             )
 
+        Agent, Browser = browser_use
         steps_taken = []
         
         try:
             # Get LLM
             llm = await self._get_llm()
             
-            # Configure browser
-            browser_config = {
-                "headless": self.headless,
-            }
-            
             # Prepend URL to task if provided
             if url:
                 task = f"Go to {url}. Then: {task}"
             
-            # Create and run agent
-            agent = Agent(
-                task=task,
-                llm=llm,
-                max_steps=max_steps,
-            )
-            
-            # Run the task
-            result = await agent.run()
+            # Reuse one browser across tasks instead of launching Chromium per call
+            async with self._lease_browser(Browser, browser) as session:
+                # Create and run agent
+                agent = Agent(
+                    task=task,
+                    llm=llm,
+                    browser=session,
+                    max_steps=max_steps,
+                )
+                
+                # Run the task
+                result = await agent.run()
             
             # Extract result data
             output = ""
@@ -180,10 +378,12 @@ class BrowserAgent:
             else:
                 output = str(result)
             
-            # Try to parse as JSON if it looks like JSON
-            if output.strip().startswith('{') or output.strip().startswith('['):
+            # Try to parse as JSON if it looks like JSON; only the first
+            # non-whitespace character is inspected, without copying output
+            first = _FIRST_CHAR_RE.search(output)
+            if first and first.group() in "{[":
                 try:
-                    extracted_data = json.loads(output)
+                    extracted_data = orjson.loads(output) if orjson else json.loads(output)
                 except json.JSONDecodeError:
                     pass
             
@@ -202,10 +402,73 @@ class BrowserAgent:
                 steps_taken=steps_taken,
             )
 
+    def _cache_key(self, *parts: str) -> str:
+        """Cache key for a request made with this agent's provider and model."""
+        return _browser_cache.make_key(
+            self.llm_provider, PROVIDER_MODELS.get(self.llm_provider, ""), *parts
+        )
+
+    async def run_tasks(
+        self,
+        specs: list[dict[str, Any]],
+        max_concurrency: int = 4,
+    ) -> list[BrowserTaskResult]:
+        """
+        Run several independent browser tasks concurrently.
+        
+        Tasks are grouped into bins by max_steps and the bins run shortest
+        first, so quick extractions don't queue behind long multi-step tasks.
+        Each task in flight drives its own browser: the shared one plus up
+        to max_concurrency - 1 extra sessions, closed when the batch ends.
+        
+        Args:
+            specs: List of run_task keyword arguments (task, url, max_steps, ...)
+            max_concurrency: Maximum tasks in flight at once
+            
+        Returns:
+            BrowserTaskResults in the same order as specs
+        """
+        workers = max(1, min(max_concurrency, len(specs)))
+        browser_use = _load_browser_use()
+        extra = []
+        if browser_use is not None:
+            Browser = browser_use[1]
+            extra = [Browser(headless=self.headless, keep_alive=True) for _ in range(workers - 1)]
+        
+        # Idle browsers; None stands for the shared one. Without browser-use
+        # installed run_task fails fast, so one slot suffices
+        pool: asyncio.Queue[Any] = asyncio.Queue()
+        for browser in [None, *extra]:
+            pool.put_nowait(browser)
+        
+        async def run_one(spec: dict[str, Any]) -> BrowserTaskResult:
+            browser = await pool.get()
+            try:
+                return await self.run_task(**spec, browser=browser)
+            finally:
+                pool.put_nowait(browser)
+        
+        bins: dict[int, list[int]] = {}
+        for index, spec in enumerate(specs):
+            steps = spec.get("max_steps", 50)
+            limit = next((b for b in STEP_BINS if steps <= b), sys.maxsize)
+            bins.setdefault(limit, []).append(index)
+        
+        results: dict[int, BrowserTaskResult] = {}
+        try:
+            for _, indices in sorted(bins.items()):
+                batch = await asyncio.gather(*(run_one(specs[i]) for i in indices))
+                results.update(zip(indices, batch, strict=True))
+        finally:
+            for browser in extra:
+                await _close_browser(browser)
+        return [results[i] for i in range(len(specs))]
+
     async def extract_data(
         self,
         url: str,
         extraction_prompt: str,
+        no_cache: bool = False,
     ) -> dict[str, Any]:
         """
         Extract structured data from a webpage.
@@ -213,15 +476,29 @@ class BrowserAgent:
         Args:
             url: URL to extract from
             extraction_prompt: What data to extract
+            no_cache: Skip the on-disk response cache
             
         Returns:
             Extracted data as dictionary
         """
+        cache_key = self._cache_key("extract", url, extraction_prompt)
+        if not no_cache:
+            cached: dict[str, Any] | None = _browser_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        data = await _try_fast_extract(url, extraction_prompt)
+        if data is not None:
+            _browser_cache.set(cache_key, data)
+            return data
+        
         task = f"Go to {url}. Extract the following information: {extraction_prompt}. Return the data as JSON."
         result = await self.run_task(task)
         
         if result.success:
-            return result.extracted_data or {"raw_output": result.output}
+            data = result.extracted_data or {"raw_output": result.output}
+            _browser_cache.set(cache_key, data)
+            return data
         else:
             return {"error": result.error}
 
@@ -242,16 +519,16 @@ class BrowserAgent:
         Returns:
             BrowserTaskResult
         """
-        form_instructions = "\n".join([
-            f"- Fill '{field}' with '{value}'"
-            for field, value in form_data.items()
-        ])
-        
-        task = f"""Go to {url}. Fill out the form:
-{form_instructions}
-{"After filling all fields, submit the form." if submit else "Do not submit the form."}"""
-        
-        return await self.run_task(task)
+        form_instructions = _form_template(tuple(form_data)).format(*form_data.values())
+
+        header = f"Go to {url}. Fill out the form:\n"
+        footer = "\nAfter filling all fields, submit the form." if submit else "\nDo not submit the form."
+        budget = MAX_FORM_PROMPT_CHARS - len(header) - len(footer)
+        if len(form_instructions) > budget:
+            logger.warning(f"Form instructions truncated to {budget} characters")
+            form_instructions = form_instructions[:max(budget, 0)]
+
+        return await self.run_task(header + form_instructions + footer)
 
     async def take_screenshot(
         self,
@@ -278,6 +555,7 @@ class BrowserAgent:
         search_query: str,
         search_engine: str = "google",
         num_results: int = 5,
+        no_cache: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Search the web and extract results.
@@ -286,10 +564,17 @@ class BrowserAgent:
             search_query: What to search for
             search_engine: Search engine to use (google, bing, duckduckgo)
             num_results: Number of results to extract
+            no_cache: Skip the on-disk response cache
             
         Returns:
             List of search results with title, url, snippet
         """
+        cache_key = self._cache_key("search", search_engine, search_query, str(num_results))
+        if not no_cache:
+            cached: list[dict[str, Any]] | None = _browser_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         search_urls = {
             "google": "https://www.google.com",
             "bing": "https://www.bing.com",
@@ -310,12 +595,35 @@ Return as JSON array."""
         
         if result.success and result.extracted_data:
             if isinstance(result.extracted_data, list):
-                return result.extracted_data
-            return [result.extracted_data]
+                results = result.extracted_data
+            else:
+                results = [result.extracted_data]
+            _browser_cache.set(cache_key, results)
+            return results
         
         return []
 
 
+# Shared agent so tool calls reuse one browser and LLM client
+_browser_agent: BrowserAgent | None = None
+
+
+def get_shared_browser_agent() -> BrowserAgent:
+    """Return the process-wide headless BrowserAgent, creating it on first use."""
+    global _browser_agent
+    if _browser_agent is None:
+        _browser_agent = BrowserAgent(headless=True)
+    return _browser_agent
+
+
+async def aclose_shared_browser_agent() -> None:
+    """Close the shared agent's browser. Idempotent."""
+    global _browser_agent
+    if _browser_agent is not None:
+        await _browser_agent.aclose()
+    _browser_agent = None
+
+
 # Tool registration functions
 
 async def browser_task(
@@ -334,7 +642,7 @@ async def browser_task(
     Returns:
         Task result or extracted data
     """
-    agent = BrowserAgent(headless=True)
+    agent = get_shared_browser_agent()
     result = await agent.run_task(
         task=task,
         url=url if url else None,
@@ -343,15 +651,50 @@ async def browser_task(
     
     if result.success:
         if result.extracted_data:
-            return json.dumps(result.extracted_data, indent=2)
+            return _smart_dumps(result.extracted_data)
         return result.output
     else:
         return f"❌ Browser task failed: {result.error}"
 
 
+async def browser_batch(
+    tasks: list[dict[str, Any]],
+    max_concurrency: int = 4,
+) -> str:
+    """
+    Execute several independent browser tasks in parallel.
+    
+    Args:
+        tasks: List of {"task", "url", "max_steps"} objects
+        max_concurrency: Maximum tasks running at once (default: 4)
+        
+    Returns:
+        JSON array with one result per task, in input order
+    """
+    specs = []
+    for i, t in enumerate(tasks):
+        if not isinstance(t, dict) or not isinstance(t.get("task"), str) or not t["task"]:
+            return f"❌ Browser batch task {i} needs a non-empty \"task\" string"
+        max_steps = t.get("max_steps", 30)
+        if isinstance(max_steps, bool) or not isinstance(max_steps, int) or max_steps < 1:
+            return f"❌ Browser batch task {i} has invalid max_steps: {max_steps!r}"
+        specs.append({"task": t["task"], "url": t.get("url") or None, "max_steps": max_steps})
+    
+    agent = get_shared_browser_agent()
+    results = await agent.run_tasks(specs, max_concurrency=max_concurrency)
+    
+    return _smart_dumps([
+        {"success": True, "result": r.extracted_data or r.output}
+        if r.success else
+        {"success": False, "error": r.error}
+        for r in results
+    ])
+
+
 async def browser_extract(
     url: str,
     what_to_extract: str,
+    no_cache: bool = False,
 ) -> str:
     """
     Extract specific data from a webpage.
@@ -359,13 +702,20 @@ async def browser_extract(
     Args:
         url: URL to extract from
         what_to_extract: Description of data to extract
+        no_cache: Re-run the extraction even if a cached result exists
         
     Returns:
         Extracted data as JSON
     """
-    agent = BrowserAgent(headless=True)
-    data = await agent.extract_data(url, what_to_extract)
-    return json.dumps(data, indent=2)
+    agent = get_shared_browser_agent()
+    data = await agent.extract_data(url, what_to_extract, no_cache=no_cache)
+    return _smart_dumps(data)
+
+
+async def browser_cache_clear() -> str:
+    """Clear cached browser extraction results."""
+    removed = _browser_cache.clear()
+    return f"✅ Cleared {removed} cached browser result(s)"
 
 
 async def browser_form(
@@ -384,7 +734,7 @@ async def browser_form(
     Returns:
         Result message
     """
-    agent = BrowserAgent(headless=True)
+    agent = get_shared_browser_agent()
     result = await agent.fill_form(url, form_fields, submit)
     
     if result.success:
@@ -426,6 +776,48 @@ def register_browser_use_tools(registry: ToolRegistry) -> None:
         func=browser_task,
     )
     
+    registry.register(
+        name="browser_batch",
+        description=(
+            "Execute several independent browser automation tasks in parallel. "
+            "Use instead of repeated browser_task calls when the tasks don't depend on each other."
+        ),
+        parameters={
+            "type": "object",
+            "properties": {
+                "tasks": {
+                    "type": "array",
+                    "description": "Tasks to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "task": {
+                                "type": "string",
+                                "description": "Natural language description of the task",
+                            },
+                            "url": {
+                                "type": "string",
+                                "description": "Optional starting URL",
+                            },
+                            "max_steps": {
+                                "type": "integer",
+                                "description": "Maximum steps before timeout (default: 30)",
+                            },
+                        },
+                        "required": ["task"],
+                    },
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "description": "Maximum tasks running at once (default: 4)",
+                    "default": 4,
+                },
+            },
+            "required": ["tasks"],
+        },
+        func=browser_batch,
+    )
+    
     registry.register(
         name="browser_extract",
         description=(
@@ -443,12 +835,28 @@ def register_browser_use_tools(registry: ToolRegistry) -> None:
                     "type": "string",
                     "description": "Description of what data to extract (e.g., 'product name, price, and rating')",
                 },
+                "no_cache": {
+                    "type": "boolean",
+                    "description": "Re-run the extraction even if a cached result exists",
+                    "default": False,
+                },
             },
             "required": ["url", "what_to_extract"],
         },
         func=browser_extract,
     )
     
+    registry.register(
+        name="browser_cache_clear",
+        description="Clear cached browser extraction results so the next extraction re-fetches pages.",
+        parameters={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+        func=browser_cache_clear,
+    )
+    
     registry.register(
         name="browser_form",
         description=(
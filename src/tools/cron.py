@@ -1,48 +1,146 @@
 """
 Cron tool — schedule and manage recurring tasks.
 
-Uses a simple JSON-based job store in the workspace.
+Uses an append-only JSON Lines job log in the workspace; removals append
+tombstones and the log is compacted once enough garbage accumulates.
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
+import sys
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from src.config.settings import get_settings
 from src.tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from croniter import croniter
+except ImportError:
+    croniter = None
+
+
+# Rewrite the log once this fraction of its records are superseded/tombstones
+COMPACT_RATIO = 0.25
+
+
+def _encode_record(record: dict[str, Any]) -> bytes:
+    """Serialize a job or tombstone to one JSONL line."""
+    if orjson:
+        return orjson.dumps(record, default=str) + b"\n"
+    return (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def _decode(data: bytes | str) -> Any:
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+@contextmanager
+def _locked(db: Path) -> Iterator[None]:
+    """Hold an exclusive lock on the job log (via a sidecar .lock file)."""
+    fd = os.open(f"{db}.lock", os.O_CREAT | os.O_RDWR)
+    try:
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if sys.platform == "win32":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
 
 def _get_cron_db() -> Path:
-    """Get the path to the cron jobs database."""
+    """Get the path to the cron jobs log, migrating a legacy jobs.json."""
     settings = get_settings()
     workspace = settings.workspace_path
     cron_dir = workspace / "cron"
     cron_dir.mkdir(parents=True, exist_ok=True)
-    return cron_dir / "jobs.json"
+    db = cron_dir / "jobs.jsonl"
+
+    legacy = cron_dir / "jobs.json"
+    if legacy.exists() and not db.exists():
+        with _locked(db):
+            if legacy.exists():  # Another writer may have migrated it meanwhile
+                try:
+                    jobs = _decode(legacy.read_bytes())
+                except json.JSONDecodeError:
+                    jobs = []
+                _write_log(db, jobs)
+                legacy.unlink()
+
+    return db
+
 
+def _write_log(db: Path, jobs: list[dict[str, Any]]) -> None:
+    """Atomically rewrite the log so it holds exactly the given jobs.
 
-def _load_jobs() -> list[dict[str, Any]]:
-    """Load all cron jobs from the database."""
+    Callers must hold `_locked(db)`.
+    """
+    tmp = db.with_suffix(".jsonl.tmp")
+    tmp.write_bytes(b"".join(_encode_record(job) for job in jobs))
+    os.replace(tmp, db)
+
+
+def _append_records(records: list[dict[str, Any]]) -> None:
+    """Append job or tombstone records to the log."""
     db = _get_cron_db()
-    if db.exists():
-        try:
-            return json.loads(db.read_text())
-        except json.JSONDecodeError:
-            return []
-    return []
+    payload = b"".join(_encode_record(r) for r in records)
+    with _locked(db), db.open("ab") as f:
+        f.write(payload)
 
 
-def _save_jobs(jobs: list[dict[str, Any]]) -> None:
-    """Save jobs to the database."""
+def _read_log() -> tuple[dict[str, dict[str, Any]], int]:
+    """Replay the log into live jobs by id; also returns the record count."""
     db = _get_cron_db()
-    db.write_text(json.dumps(jobs, indent=2, default=str))
+    jobs: dict[str, dict[str, Any]] = {}
+    records = 0
+    if not db.exists():
+        return jobs, records
+
+    with db.open("rb") as f:
+        for line in f:
+            try:
+                record = _decode(line)
+            except json.JSONDecodeError:
+                continue  # Torn write from a crash mid-append
+            records += 1
+            if "_tombstone" in record:
+                jobs.pop(record["_tombstone"], None)
+            else:
+                jobs[record.get("id")] = record
+    return jobs, records
+
+
+def _load_jobs() -> dict[str, dict[str, Any]]:
+    """Load all cron jobs from the database, keyed by id."""
+    jobs, _ = _read_log()
+    return jobs
 
 
 async def cron_add(
@@ -60,8 +158,6 @@ async def cron_add(
         command: The command or action to execute.
         description: Optional description of what this task does.
     """
-    jobs = _load_jobs()
-
     job = {
         "id": str(uuid.uuid4())[:8],
         "name": name,
@@ -73,31 +169,58 @@ async def cron_add(
         "last_run": None,
     }
 
-    jobs.append(job)
-    _save_jobs(jobs)
+    _append_records([job])
 
     return f"✅ Scheduled task '{name}' (id: {job['id']})\n  Schedule: {schedule}\n  Command: {command}"
 
 
-async def cron_list() -> str:
-    """List all scheduled tasks."""
-    jobs = _load_jobs()
+@functools.lru_cache(maxsize=1024)
+def _next_run(schedule: str, now_minute: datetime) -> datetime | None:
+    """Next fire time for a cron expression; None if it can't be computed.
+
+    Cron resolution is one minute, so callers pass the current time truncated
+    to the minute and repeated listings reuse the parsed result.
+    """
+    if croniter is None:
+        return None
+    try:
+        next_time: datetime = croniter(schedule, now_minute).get_next(datetime)
+        return next_time
+    except (ValueError, KeyError):
+        return None  # Natural-language or malformed schedule
+
+
+async def cron_list(show_disabled: bool = True) -> str:
+    """
+    List scheduled tasks, soonest next run first.
+
+    Args:
+        show_disabled: Include disabled tasks in the listing.
+    """
+    jobs = list(_load_jobs().values())
+    if not show_disabled:
+        jobs = [j for j in jobs if j.get("enabled", True)]
     if not jobs:
         return "No scheduled tasks. Use cron_add to create one."
 
-    output = "📅 Scheduled Tasks\n" + "─" * 40 + "\n\n"
+    # Stable sort: jobs without a computable next run keep their order at the end
+    now_minute = datetime.now().replace(second=0, microsecond=0)
+    next_runs = {j["id"]: _next_run(j["schedule"], now_minute) for j in jobs}
+    jobs.sort(key=lambda j: (next_runs[j["id"]] is None, next_runs[j["id"]] or datetime.min))
+
+    parts = ["📅 Scheduled Tasks", "─" * 40, ""]
     for job in jobs:
         status = "🟢" if job.get("enabled", True) else "🔴"
-        output += f"{status} **{job['name']}** (id: {job['id']})\n"
-        output += f"   Schedule: {job['schedule']}\n"
-        output += f"   Command: {job['command']}\n"
+        parts.append(f"{status} **{job['name']}** (id: {job['id']})")
+        parts.append(f"   Schedule: {job['schedule']}")
+        parts.append(f"   Command: {job['command']}")
         if job.get("description"):
-            output += f"   Description: {job['description']}\n"
+            parts.append(f"   Description: {job['description']}")
         if job.get("last_run"):
-            output += f"   Last run: {job['last_run']}\n"
-        output += "\n"
+            parts.append(f"   Last run: {job['last_run']}")
+        parts.append("")
 
-    return output
+    return "\n".join(parts) + "\n"
 
 
 async def cron_remove(job_id: str) -> str:
@@ -107,14 +230,21 @@ async def cron_remove(job_id: str) -> str:
     Args:
         job_id: The ID of the task to remove.
     """
-    jobs = _load_jobs()
-    original_count = len(jobs)
-    jobs = [j for j in jobs if j.get("id") != job_id]
-
-    if len(jobs) == original_count:
-        return f"❌ No task found with id: {job_id}"
+    db = _get_cron_db()
+    # Hold the lock across read and write so a concurrent add can't be
+    # dropped by the compaction rewrite
+    with _locked(db):
+        jobs, records = _read_log()
+        if jobs.pop(job_id, None) is None:
+            return f"❌ No task found with id: {job_id}"
 
-    _save_jobs(jobs)
+        # Removal is an O(1) tombstone append; fold the log once garbage piles up
+        total = records + 1
+        if (total - len(jobs)) / total >= COMPACT_RATIO:
+            _write_log(db, list(jobs.values()))
+        else:
+            with db.open("ab") as f:
+                f.write(_encode_record({"_tombstone": job_id}))
     return f"✅ Removed task {job_id}"
 
 
@@ -154,7 +284,13 @@ def register_cron_tools(registry: ToolRegistry) -> None:
         description="List all scheduled tasks.",
         parameters={
             "type": "object",
-            "properties": {},
+            "properties": {
+                "show_disabled": {
+                    "type": "boolean",
+                    "description": "Include disabled tasks (default: true)",
+                    "default": True,
+                },
+            },
             "required": [],
         },
         func=cron_list,
@@ -4,39 +4,138 @@ Desktop Tools — Window management (snap, move, resize).
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import logging
-import subprocess
-from typing import Optional
+import re
+import string
+import time
+from typing import Any, Optional
 
+from src.tools._osascript import get_osa_pipe
 from src.tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+try:
+    from Quartz import CGDisplayBounds, CGGetActiveDisplayList, CGMainDisplayID
+    QUARTZ_AVAILABLE = True
+except ImportError:
+    QUARTZ_AVAILABLE = False
 
-def get_screen_dimensions(display: int = 0) -> tuple[int, int, int, int]:
+# Height reserved for the macOS menu bar
+MENU_BAR_HEIGHT = 25
+
+_OSA = get_osa_pipe()
+
+# Desktop calls get their own thread so a burst of them waits here instead of
+# occupying the event loop's default executor. One worker is enough: the shared
+# osascript host runs a single script at a time anyway
+_DESKTOP_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="desktop")
+
+
+async def _run_osa(script: str, timeout: float = 3) -> Any:
+    """Run an AppleScript on the desktop pool so the event loop stays free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_DESKTOP_EXEC, _OSA.run, script, timeout)
+
+# Scripts are module constants so the osascript host reuses their compiled
+# form; only the snap script varies, and only in its substituted values
+_BOUNDS_SCRIPT = '''
+tell application "Finder"
+    set desktopBounds to bounds of window of desktop
+    return desktopBounds
+end tell
+'''
+
+_WINDOW_LIST_SCRIPT = '''
+tell application "System Events"
+    set windowList to {}
+    repeat with proc in (every process whose background only is false)
+        set procName to name of proc
+        repeat with win in (every window of proc)
+            set end of windowList to procName & " - " & name of win
+        end repeat
+    end repeat
+    return windowList
+end tell
+'''
+
+# Substituted for $activate unless the caller asks not to raise the app
+_ACTIVATE_LINE = "set frontmost to true"
+_SNAP_SCRIPT_TPL = string.Template('''
+tell application "System Events"
+    tell process "$app"
+        $activate
+        tell window 1
+            set position to {$x, $y}
+            set size to {$w, $h}
+        end tell
+    end tell
+end tell
+''')
+
+# Integers in AppleScript bounds output, whether a list or "x1, y1, x2, y2" text
+_BOUNDS_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+# Display bounds only change when monitors are (re)arranged; cache per display
+DIM_CACHE_TTL = 30.0
+_DIM_CACHE: dict[int, tuple[float, tuple[int, int, int, int]]] = {}
+
+
+def _quartz_display_bounds(display: int) -> tuple[int, int, int, int] | None:
+    """Read display bounds straight from CoreGraphics; None if unavailable."""
+    if display == 0:
+        display_id = CGMainDisplayID()
+    else:
+        err, displays, count = CGGetActiveDisplayList(16, None, None)
+        if err or display >= count:
+            return None
+        display_id = displays[display]
+    
+    b = CGDisplayBounds(display_id)
+    return (
+        int(b.origin.x),
+        int(b.origin.y) + MENU_BAR_HEIGHT,
+        int(b.size.width),
+        int(b.size.height) - MENU_BAR_HEIGHT,
+    )
+
+
+async def get_screen_dimensions(display: int = 0) -> tuple[int, int, int, int]:
     """
     Get screen dimensions for specified display.
     Returns: (x_offset, y_offset, width, height)
     """
+    cached = _DIM_CACHE.get(display)
+    if cached is not None and time.monotonic() - cached[0] < DIM_CACHE_TTL:
+        return cached[1]
+    
+    if QUARTZ_AVAILABLE:
+        # Microseconds in-process versus an AppleScript round-trip
+        try:
+            dims = _quartz_display_bounds(display)
+        except Exception as e:
+            logger.debug(f"CoreGraphics display query failed: {e}")
+            dims = None
+        if dims is not None:
+            _DIM_CACHE[display] = (time.monotonic(), dims)
+            return dims
+    
     try:
-        script = '''
-        tell application "Finder"
-            set desktopBounds to bounds of window of desktop
-            return desktopBounds
-        end tell
-        '''
-        result = subprocess.run(['osascript', '-e', script], 
-                              capture_output=True, text=True, timeout=3)
-        
-        bounds = result.stdout.strip().split(', ')
+        result = await _run_osa(_BOUNDS_SCRIPT) or ""
+        text = result if isinstance(result, str) else " ".join(result)
+        bounds = [int(float(n)) for n in _BOUNDS_RE.findall(text)]
         if len(bounds) >= 4:
-            x1, y1, x2, y2 = map(int, bounds)
+            x1, y1, x2, y2 = bounds[:4]
             
             if display == 0:
-                return (0, 25, x2, y2 - 25)
+                dims = (0, MENU_BAR_HEIGHT, x2, y2 - MENU_BAR_HEIGHT)
             else:
                 width = x2
-                return (width * display, 25, width, y2 - 25)
+                dims = (width * display, MENU_BAR_HEIGHT, width, y2 - MENU_BAR_HEIGHT)
+            _DIM_CACHE[display] = (time.monotonic(), dims)
+            return dims
         
         return (0, 25, 1920, 1055)  # Fallback
             
@@ -44,7 +143,12 @@ def get_screen_dimensions(display: int = 0) -> tuple[int, int, int, int]:
         return (0, 25, 1920, 1055)
 
 
-def snap_window(app_name: str, position: str, display: int = 0) -> str:
+async def snap_window(
+    app_name: str,
+    position: str,
+    display: int = 0,
+    activate: bool = True,
+) -> str:
     """
     Snap a window to a specific position.
     
@@ -52,9 +156,10 @@ def snap_window(app_name: str, position: str, display: int = 0) -> str:
         app_name: Application name.
         position: 'left', 'right', 'top', 'bottom', 'full'.
         display: Display index (0=main).
+        activate: Bring the app to the front first; False saves an AppleEvent.
     """
     try:
-        x_offset, y_offset, screen_width, screen_height = get_screen_dimensions(display)
+        x_offset, y_offset, screen_width, screen_height = await get_screen_dimensions(display)
         
         if position == 'left':
             x, y = x_offset, y_offset
@@ -74,46 +179,30 @@ def snap_window(app_name: str, position: str, display: int = 0) -> str:
         else:
             return f"Unknown position: {position}"
             
-        script = f'''
-        tell application "System Events"
-            tell process "{app_name}"
-                set frontmost to true
-                tell window 1
-                    set position to {{{x}, {y}}}
-                    set size to {{{w}, {h}}}
-                end tell
-            end tell
-        end tell
-        '''
-        subprocess.run(['osascript', '-e', script], check=True, timeout=3)
+        await _run_osa(_SNAP_SCRIPT_TPL.substitute(
+            app=app_name, x=x, y=y, w=w, h=h, activate=_ACTIVATE_LINE if activate else "",
+        ))
         return f"{app_name} snapped to {position} on display {display}"
     except Exception as e:
         return f"Error snapping window: {e}"
 
 
-def list_open_windows() -> str:
+async def list_open_windows() -> str:
     """List all open windows visible to System Events."""
     try:
-        script = '''
-        tell application "System Events"
-            set windowList to {}
-            repeat with proc in (every process whose background only is false)
-                set procName to name of proc
-                repeat with win in (every window of proc)
-                    set end of windowList to procName & " - " & name of win
-                end repeat
-            end repeat
-            return windowList
-        end tell
-        '''
-        result = subprocess.run(['osascript', '-e', script], 
-                              capture_output=True, text=True, check=True, timeout=5)
-        windows = [w.strip() for w in result.stdout.split(',') if w.strip()]
+        result = await _run_osa(_WINDOW_LIST_SCRIPT, timeout=5) or []
+        windows = [w.strip() for w in result if w and w.strip()]
         return f"Open windows ({len(windows)}):\n" + "\n".join(f"- {w}" for w in windows)
     except Exception as e:
         return f"Error listing windows: {e}"
 
 
+def refresh_displays() -> str:
+    """Forget cached display bounds, e.g. after plugging in a monitor."""
+    _DIM_CACHE.clear()
+    return "Display cache cleared"
+
+
 def register_desktop_tools(registry: ToolRegistry):
     """Register desktop tools."""
     registry.register(
@@ -136,6 +225,11 @@ def register_desktop_tools(registry: ToolRegistry):
                     "description": "Display index (0=main, default: 0)",
                     "default": 0,
                 },
+                "activate": {
+                    "type": "boolean",
+                    "description": "Bring the application to the front before snapping (default: true)",
+                    "default": True,
+                },
             },
             "required": ["app_name", "position"],
         },
@@ -150,3 +244,12 @@ def register_desktop_tools(registry: ToolRegistry):
         },
         func=list_open_windows,
     )
+    registry.register(
+        name="refresh_displays",
+        description="Re-detect display sizes after monitors are connected or rearranged",
+        parameters={
+            "type": "object",
+            "properties": {},
+        },
+        func=refresh_displays,
+    )
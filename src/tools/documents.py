@@ -9,15 +9,263 @@ Tools for:
 
 from __future__ import annotations
 
+import asyncio
+import io
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
+from src.extraction.extractor import Extractor
+from src.ingestion.processor import DocumentProcessor
+from src.tools import _query_cache
 from src.tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from src.retrieval.embeddings import length_bucket
+    from src.retrieval.vector_store import get_vector_store
+    from src.tools import _sem_cache
+except ImportError:  # numpy comes with the `local` extra
+    length_bucket = get_vector_store = _sem_cache = None  # type: ignore[assignment]
+
+
+# LangExtract chunk size and pass count for knowledge-base extraction. Retrieved
+# chunks stop being added once their text exceeds the product of the two.
+KB_MAX_CHAR_BUFFER = 3000
+KB_EXTRACTION_PASSES = 1
+
+# Upper bound on concurrent extraction calls per knowledge-base query
+KB_EXTRACTION_GROUPS = 4
+
+# Searches arriving within this many seconds of each other share one batch
+SEARCH_BATCH_DELAY = 0.005
+
+# Collection -> (vector-store write generation, document count read at it)
+_count_cache: dict[str, tuple[int, int]] = {}
+
+
+def _search_uncached(
+    vector_store: Any,
+    queries: list[str],
+    n_results: int,
+    collection: str,
+) -> list[list[dict[str, Any]]]:
+    """
+    Search for queries that missed the exact-match cache.
+
+    All queries are embedded in one batch; close paraphrases of recent queries
+    are answered from the similarity cache and the rest are searched with the
+    same embeddings.
+    """
+    sem_cache = _sem_cache.get_semantic_cache()
+    # Read before searching, so results filed under a generation never predate it
+    generation = vector_store.write_generation(collection)
+    query_vectors = vector_store.embed_queries(queries)
+    results: dict[int, list[dict[str, Any]]] = {}
+    pending = []
+    for i, query_vector in enumerate(query_vectors):
+        hit = sem_cache.lookup(collection, n_results, query_vector, generation)
+        if hit is not None and not sem_cache.should_verify():
+            results[i] = hit.results
+        else:
+            pending.append((i, hit))
+
+    for i, hit in pending:
+        found = vector_store.search_with_embedding(query_vectors[i], n_results=n_results, collection=collection)
+        if hit is None or not sem_cache.feedback(hit, found):
+            sem_cache.put(collection, n_results, query_vectors[i], found, generation)
+        results[i] = found
+    return [results[i] for i in range(len(queries))]
+
+
+def _split_by_length(vector_store: Any, requests: list[tuple]) -> list[list[tuple]]:
+    """
+    Group queued searches by the token-length bucket of their query, so each
+    embedding batch pads queries to similar lengths. Buckets come out in
+    order of their oldest request.
+    """
+    token_counts = getattr(vector_store.embeddings, "token_counts", None)
+    if token_counts is None or len(requests) < 2:
+        return [requests]
+    try:
+        counts = token_counts([r[1] for r in requests])
+    except Exception as e:
+        logger.debug(f"Token counting failed, embedding queries together: {e}")
+        return [requests]
+
+    buckets: dict[int, list[tuple]] = {}
+    for request, count in zip(requests, counts, strict=True):
+        buckets.setdefault(length_bucket(count), []).append(request)
+    return list(buckets.values())
+
+
+def _search_group(requests: list[tuple]) -> list[tuple[list[tuple], Any]]:
+    """
+    Search one (store, collection, n_results) group bucket by bucket.
+
+    Returns (requests, results or the exception raised) per bucket.
+    """
+    vector_store, _, n_results, collection, _ = requests[0]
+    outcomes = []
+    for bucket in _split_by_length(vector_store, requests):
+        found: list[list[dict[str, Any]]] | Exception
+        try:
+            found = _search_uncached(vector_store, [r[1] for r in bucket], n_results, collection)
+        except Exception as e:
+            found = e
+        outcomes.append((bucket, found))
+    return outcomes
+
+
+class _SearchCoalescer:
+    """
+    Batches concurrent searches into one vector-store call.
+
+    Requests are queued; a worker task waits SEARCH_BATCH_DELAY after the
+    first one, drains the queue and runs one `_search_uncached` per
+    (collection, n_results, query length bucket) group.
+    """
+
+    def __init__(self, delay: float = SEARCH_BATCH_DELAY):
+        self.delay = delay
+        self._queue: asyncio.Queue[tuple] | None = None
+        self._worker_task: asyncio.Task[None] | None = None
+
+    async def search(
+        self,
+        vector_store: Any,
+        query: str,
+        n_results: int,
+        collection: str,
+    ) -> list[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        task = self._worker_task
+        if queue is None or task is None or task.done() or task.get_loop() is not loop:
+            queue = self._queue = asyncio.Queue()
+            self._worker_task = loop.create_task(self._worker(queue))
+
+        future: asyncio.Future[list[dict[str, Any]]] = loop.create_future()
+        queue.put_nowait((vector_store, query, n_results, collection, future))
+        return await future
+
+    async def _worker(self, queue: asyncio.Queue[tuple]) -> None:
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(self.delay)
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+
+            groups: dict[tuple[int, str, int], list[tuple]] = {}
+            for request in batch:
+                vector_store, _, n_results, collection, _ = request
+                groups.setdefault((id(vector_store), collection, n_results), []).append(request)
+
+            # Groups run on worker threads; futures are resolved back on the loop
+            outcomes = await asyncio.gather(
+                *(asyncio.to_thread(_search_group, group) for group in groups.values())
+            )
+            for requests, found in (o for group_outcomes in outcomes for o in group_outcomes):
+                if isinstance(found, Exception):
+                    for *_, future in requests:
+                        if not future.done():
+                            future.set_exception(found)
+                    continue
+                for (*_, future), results in zip(requests, found, strict=True):
+                    if not future.done():
+                        future.set_result(results)
+
+
+_coalescer = _SearchCoalescer()
+
+
+async def _cached_search(vector_store: Any, query: str, n_results: int, collection: str) -> list[dict[str, Any]]:
+    """
+    Run a vector search, reusing results for repeated queries on an unchanged
+    collection: exact repeats from the query cache, close paraphrases from the
+    similarity cache. Misses are batched with concurrent searches.
+
+    Both caches key on the store's write generation, so writes made anywhere
+    (not just through these tools) invalidate them.
+    """
+    cache = _query_cache.get_query_cache()
+    generation = vector_store.write_generation(collection)
+    key = _query_cache.make_key(collection, query, n_results, generation)
+    results = cache.get(key)
+    if results is None:
+        results = await _coalescer.search(vector_store, query, n_results, collection)
+        cache.put(key, results)
+    return results
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialize a tool result with orjson when installed. Results read by the
+    model are compact; pretty=True indents status output meant for people.
+    """
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None).decode()
+    return json.dumps(obj, indent=2 if pretty else None)
+
+
+def _err(tag: str, exc: Exception) -> str:
+    """Serialize a tool failure in the same JSON shape as its results."""
+    return _dumps({"success": False, "tool": tag, "error": f"{type(exc).__name__}: {exc}"})
+
+
+def _combine_chunks(chunks: list[dict[str, Any]]) -> str:
+    """Join retrieved chunks into one extraction input, each tagged with its source."""
+    combined = io.StringIO()
+    for i, r in enumerate(chunks):
+        if i:
+            combined.write("\n\n---\n\n")
+        combined.write(f"[Source: {r['metadata'].get('source', 'unknown')}]\n")
+        combined.write(r["text"])
+    return combined.getvalue()
+
+
+def _group_chunks(chunks: list[dict[str, Any]], max_groups: int) -> list[list[dict[str, Any]]]:
+    """
+    Split chunks into up to max_groups groups of similar total length.
+
+    Longest chunks are placed first, each into the currently lightest group;
+    within a group chunks keep their retrieval order.
+    """
+    n_groups = min(len(chunks), max_groups)
+    groups: list[list[int]] = [[] for _ in range(n_groups)]
+    sizes = [0] * n_groups
+    for i in sorted(range(len(chunks)), key=lambda i: -len(chunks[i]["text"])):
+        g = sizes.index(min(sizes))
+        groups[g].append(i)
+        sizes[g] += len(chunks[i]["text"])
+    return [[chunks[i] for i in sorted(group)] for group in groups]
+
+
+def _format_hit(r: dict[str, Any]) -> dict[str, Any]:
+    """Shape a vector-store result for the model, truncating long chunk text."""
+    text = r["text"]
+    metadata = r["metadata"]
+    return {
+        "score": round(r["score"], 4),
+        "text": text[:500] + "..." if len(text) > 500 else text,
+        "source": metadata.get("source", "unknown"),
+        "chunk_index": metadata.get("chunk_index"),
+    }
+
+
+def _get_store() -> Any:
+    """Get the shared vector store, or raise if its dependencies are missing."""
+    if get_vector_store is None:
+        raise ImportError("numpy not installed. Run: pip install wingman[local]")
+    return get_vector_store()
+
 
 async def ingest_document(
     file_path: str,
@@ -34,19 +282,17 @@ async def ingest_document(
         Status message with document stats
     """
     try:
-        from src.ingestion.processor import DocumentProcessor
-        from src.retrieval.vector_store import get_vector_store
-        
-        vector_store = get_vector_store()
+        vector_store = _get_store()
         processor = DocumentProcessor(vector_store=vector_store)
         
-        result = processor.process_file(
+        result = await asyncio.to_thread(
+            processor.process_file,
             file_path=file_path,
             collection_name=collection,
         )
         
         if result.success:
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "message": f"Document ingested successfully",
                 "document_id": result.document_id,
@@ -54,62 +300,67 @@ async def ingest_document(
                 "chunks": result.num_chunks,
                 "characters": result.total_chars,
                 "collection": collection,
-            }, indent=2)
+            }, pretty=True)
         else:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": result.error,
-            }, indent=2)
+            }, pretty=True)
             
     except Exception as e:
-        return f"❌ Failed to ingest document: {e}"
+        return _err("ingest_document", e)
 
 
 async def ingest_directory(
     directory: str,
     collection: str = "documents",
     recursive: bool = True,
+    workers: int = 4,
 ) -> str:
     """
     Add all documents in a directory to the knowledge base.
     
+    Files whose contents are already in the collection are skipped.
+    
     Args:
         directory: Path to the directory
         collection: Collection name
         recursive: Whether to process subdirectories
+        workers: Number of files to process concurrently
         
     Returns:
         Status message with processing stats
     """
     try:
-        from src.ingestion.processor import DocumentProcessor
-        from src.retrieval.vector_store import get_vector_store
-        
-        vector_store = get_vector_store()
+        vector_store = _get_store()
         processor = DocumentProcessor(vector_store=vector_store)
         
-        results = processor.process_directory(
+        results = await asyncio.to_thread(
+            processor.process_directory,
             directory=directory,
             collection_name=collection,
             recursive=recursive,
+            workers=max(1, workers),
+            skip_existing=True,
         )
         
-        successful = [r for r in results if r.success]
+        successful = [r for r in results if r.success and not r.skipped]
         failed = [r for r in results if not r.success]
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "total_files": len(results),
             "successful": len(successful),
+            "skipped": sum(r.skipped for r in results),
             "failed": len(failed),
             "total_chunks": sum(r.num_chunks for r in successful),
             "total_characters": sum(r.total_chars for r in successful),
             "collection": collection,
             "errors": [{"file": r.source, "error": r.error} for r in failed] if failed else None,
-        }, indent=2)
+        }, pretty=True)
         
     except Exception as e:
-        return f"❌ Failed to ingest directory: {e}"
+        return _err("ingest_directory", e)
 
 
 async def search_documents(
@@ -129,40 +380,74 @@ async def search_documents(
         Matching document chunks with relevance scores
     """
     try:
-        from src.retrieval.vector_store import get_vector_store
-        
-        vector_store = get_vector_store()
-        results = vector_store.search(
-            query=query,
-            n_results=num_results,
-            collection=collection,
-        )
+        vector_store = _get_store()
+        results = await _cached_search(vector_store, query, num_results, collection)
         
         if not results:
-            return json.dumps({
+            return _dumps({
                 "query": query,
                 "results": [],
                 "message": "No matching documents found",
-            }, indent=2)
-        
-        formatted_results = []
-        for r in results:
-            formatted_results.append({
-                "score": round(r["score"], 4),
-                "text": r["text"][:500] + "..." if len(r["text"]) > 500 else r["text"],
-                "source": r["metadata"].get("source", "unknown"),
-                "chunk_index": r["metadata"].get("chunk_index"),
             })
         
-        return json.dumps({
+        formatted_results = [_format_hit(r) for r in results]
+        
+        return _dumps({
             "query": query,
             "collection": collection,
             "num_results": len(formatted_results),
             "results": formatted_results,
-        }, indent=2)
+        })
         
     except Exception as e:
-        return f"❌ Search failed: {e}"
+        return _err("search_knowledge", e)
+
+
+async def search_documents_stream(
+    query: str,
+    collection: str = "documents",
+    num_results: int = 5,
+) -> AsyncIterator[str]:
+    """
+    Search the knowledge base, yielding one JSON line per matching chunk.
+    
+    Results arrive best first in the same shape as `search_documents`
+    results, without materializing the whole result list. Unlike
+    `search_documents` this bypasses the search caches.
+    
+    Args:
+        query: Search query (natural language)
+        collection: Collection to search
+        num_results: Number of results to return
+    """
+    vector_store = _get_store()
+    hits = vector_store.search_iter(query, n_results=num_results, collection=collection)
+    # Embedding and ranking happen on the first hit; keep them off the event loop
+    hit = await asyncio.to_thread(next, hits, None)
+    if hit is None:
+        return
+    yield _dumps(_format_hit(hit)) + "\n"
+    for hit in hits:
+        yield _dumps(_format_hit(hit)) + "\n"
+
+
+async def search_documents_jsonl(
+    query: str,
+    collection: str = "documents",
+    num_results: int = 5,
+) -> str:
+    """
+    Search the knowledge base, returning one JSON line per matching chunk.
+    
+    Tool form of `search_documents_stream`: the lines are joined into one
+    string, best match first; an empty string means no matches.
+    """
+    try:
+        return "".join([
+            line async for line in search_documents_stream(query, collection, num_results)
+        ])
+    except Exception as e:
+        return _err("search_knowledge_stream", e)
 
 
 async def extract_from_knowledge_base(
@@ -184,52 +469,68 @@ async def extract_from_knowledge_base(
         Extracted information from matching documents
     """
     try:
-        from src.retrieval.vector_store import get_vector_store
-        from src.extraction.extractor import Extractor
-        
         # Search for relevant chunks
-        vector_store = get_vector_store()
-        results = vector_store.search(
-            query=query,
-            n_results=num_chunks,
-            collection=collection,
-        )
+        vector_store = _get_store()
+        results = await _cached_search(vector_store, query, num_chunks, collection)
         
         if not results:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "No matching documents found",
-            }, indent=2)
+            })
         
-        # Combine relevant text
-        combined_text = "\n\n---\n\n".join([
-            f"[Source: {r['metadata'].get('source', 'unknown')}]\n{r['text']}"
-            for r in results
-        ])
+        # Take relevant chunks, best match first, until the extractor's budget is spent
+        budget = KB_MAX_CHAR_BUFFER * KB_EXTRACTION_PASSES
+        running_chars = 0
+        used = []
+        seen = set()
+        for r in results:
+            # Skip chunks indexed more than once (same passage, e.g. re-ingested files).
+            # The whole text is the key: chunks sharing only a prefix are distinct
+            if r["text"] in seen:
+                continue
+            seen.add(r["text"])
+            used.append(r)
+            running_chars += len(r["text"])
+            if running_chars > budget:
+                break
         
-        # Extract using LangExtract
-        extractor = Extractor(model_id="gpt-4o")
-        extraction_result = extractor.extract(
-            text=combined_text,
-            prompt=extraction_prompt,
-        )
+        # Extract using LangExtract; several chunks are split into groups extracted
+        # concurrently, each on its own Extractor so no instance is shared across threads
+        groups = _group_chunks(used, KB_EXTRACTION_GROUPS) if len(used) > 2 else [used]
+        outcomes = await asyncio.gather(*(
+            asyncio.to_thread(
+                Extractor(model_id="gpt-4o").extract,
+                text=_combine_chunks(group),
+                prompt=extraction_prompt,
+                extraction_passes=KB_EXTRACTION_PASSES,
+                max_char_buffer=KB_MAX_CHAR_BUFFER,
+            )
+            for group in groups
+        ))
         
-        if extraction_result.success:
-            return json.dumps({
-                "success": True,
-                "query": query,
-                "sources": [r["metadata"].get("source") for r in results],
-                "extraction_prompt": extraction_prompt,
-                "extractions": extraction_result.extractions,
-            }, indent=2)
-        else:
-            return json.dumps({
+        errors = [
+            {"group": i, "error": outcome.error}
+            for i, outcome in enumerate(outcomes)
+            if not outcome.success
+        ]
+        if errors:
+            return _dumps({
                 "success": False,
-                "error": extraction_result.error,
-            }, indent=2)
+                "error": "; ".join(str(e["error"]) for e in errors),
+                "errors": errors if len(groups) > 1 else None,
+            })
+        
+        return _dumps({
+            "success": True,
+            "query": query,
+            "sources": [r["metadata"].get("source") for r in used],
+            "extraction_prompt": extraction_prompt,
+            "extractions": [ext for outcome in outcomes for ext in outcome.extractions],
+        })
             
     except Exception as e:
-        return f"❌ Extraction failed: {e}"
+        return _err("extract_from_docs", e)
 
 
 async def list_documents(collection: str = "documents") -> str:
@@ -243,27 +544,34 @@ async def list_documents(collection: str = "documents") -> str:
         Collection statistics
     """
     try:
-        from src.retrieval.vector_store import get_vector_store
+        vector_store = _get_store()
         
-        vector_store = get_vector_store()
-        collections = vector_store.list_collections()
+        def collection_stats() -> list[dict[str, Any]]:
+            stats = []
+            for coll in vector_store.list_collections():
+                gen = vector_store.write_generation(coll)
+                cached = _count_cache.get(coll)
+                if cached is not None and cached[0] == gen:
+                    count = cached[1]
+                else:
+                    count = vector_store.count(coll)
+                    _count_cache[coll] = (gen, count)
+                stats.append({
+                    "collection": coll,
+                    "document_count": count,
+                })
+            return stats
         
-        stats = []
-        for coll in collections:
-            count = vector_store.count(coll)
-            stats.append({
-                "collection": coll,
-                "document_count": count,
-            })
+        stats = await asyncio.to_thread(collection_stats)
         
-        return json.dumps({
+        return _dumps({
             "collections": stats,
             "embedding_model": vector_store.embeddings.model_name,
             "embedding_dimension": vector_store.embeddings.dimension,
-        }, indent=2)
+        }, pretty=True)
         
     except Exception as e:
-        return f"❌ Failed to list documents: {e}"
+        return _err("list_knowledge", e)
 
 
 async def delete_document(
@@ -283,21 +591,144 @@ async def delete_document(
         Confirmation message
     """
     try:
-        from src.retrieval.vector_store import get_vector_store
-        
-        vector_store = get_vector_store()
+        vector_store = _get_store()
         
         if doc_id:
-            vector_store.delete(doc_ids=[doc_id], collection=collection)
+            await asyncio.to_thread(vector_store.delete, doc_ids=[doc_id], collection=collection)
             return f"✅ Deleted document: {doc_id}"
         elif source:
-            vector_store.delete(where={"source": source}, collection=collection)
+            await asyncio.to_thread(vector_store.delete, where={"source": source}, collection=collection)
             return f"✅ Deleted all documents from source: {source}"
         else:
-            return "❌ Please provide either doc_id or source to delete"
+            return _err("delete_document", ValueError("Please provide either doc_id or source to delete"))
             
     except Exception as e:
-        return f"❌ Delete failed: {e}"
+        return _err("delete_document", e)
+
+
+# JSON schemas for the tool parameters, built once at import
+_INGEST_DOCUMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "file_path": {
+            "type": "string",
+            "description": "Path to the document file",
+        },
+        "collection": {
+            "type": "string",
+            "description": "Collection name for organizing documents (default: 'documents')",
+            "default": "documents",
+        },
+    },
+    "required": ["file_path"],
+}
+
+
+_INGEST_DIRECTORY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "directory": {
+            "type": "string",
+            "description": "Path to the directory",
+        },
+        "collection": {
+            "type": "string",
+            "description": "Collection name (default: 'documents')",
+            "default": "documents",
+        },
+        "recursive": {
+            "type": "boolean",
+            "description": "Process subdirectories (default: true)",
+            "default": True,
+        },
+        "workers": {
+            "type": "integer",
+            "description": "Files to process in parallel (default: 4)",
+            "default": 4,
+        },
+    },
+    "required": ["directory"],
+}
+
+
+_SEARCH_KNOWLEDGE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "Natural language search query",
+        },
+        "collection": {
+            "type": "string",
+            "description": "Collection to search (default: 'documents')",
+            "default": "documents",
+        },
+        "num_results": {
+            "type": "integer",
+            "description": "Number of results (default: 5)",
+            "default": 5,
+        },
+    },
+    "required": ["query"],
+}
+
+
+_EXTRACT_FROM_DOCS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "Search query to find relevant documents",
+        },
+        "extraction_prompt": {
+            "type": "string",
+            "description": "What information to extract (e.g., 'Extract all company names and their revenue')",
+        },
+        "collection": {
+            "type": "string",
+            "description": "Collection to search",
+            "default": "documents",
+        },
+        "num_chunks": {
+            "type": "integer",
+            "description": "Number of document chunks to process",
+            "default": 5,
+        },
+    },
+    "required": ["query", "extraction_prompt"],
+}
+
+
+_LIST_KNOWLEDGE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "collection": {
+            "type": "string",
+            "description": "Collection to get stats for",
+            "default": "documents",
+        },
+    },
+}
+
+
+_DELETE_DOCUMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "doc_id": {
+            "type": "string",
+            "description": "Document ID to delete",
+        },
+        "source": {
+            "type": "string",
+            "description": "Delete all docs from this source file path",
+        },
+        "collection": {
+            "type": "string",
+            "description": "Collection to delete from",
+            "default": "documents",
+        },
+    },
+}
 
 
 def register_document_tools(registry: ToolRegistry) -> None:
@@ -309,21 +740,7 @@ def register_document_tools(registry: ToolRegistry) -> None:
             "Add a document (PDF, TXT, MD, HTML, JSON, CSV) to the knowledge base. "
             "The document will be chunked and embedded for semantic search."
         ),
-        parameters={
-            "type": "object",
-            "properties": {
-                "file_path": {
-                    "type": "string",
-                    "description": "Path to the document file",
-                },
-                "collection": {
-                    "type": "string",
-                    "description": "Collection name for organizing documents (default: 'documents')",
-                    "default": "documents",
-                },
-            },
-            "required": ["file_path"],
-        },
+        parameters=_INGEST_DOCUMENT_SCHEMA,
         func=ingest_document,
     )
     
@@ -331,28 +748,10 @@ def register_document_tools(registry: ToolRegistry) -> None:
         name="ingest_directory",
         description=(
             "Add all supported documents in a directory to the knowledge base. "
-            "Processes PDF, TXT, MD, HTML, JSON, and CSV files."
+            "Processes PDF, TXT, MD, HTML, JSON, and CSV files; files already "
+            "ingested with the same contents are skipped."
         ),
-        parameters={
-            "type": "object",
-            "properties": {
-                "directory": {
-                    "type": "string",
-                    "description": "Path to the directory",
-                },
-                "collection": {
-                    "type": "string",
-                    "description": "Collection name (default: 'documents')",
-                    "default": "documents",
-                },
-                "recursive": {
-                    "type": "boolean",
-                    "description": "Process subdirectories (default: true)",
-                    "default": True,
-                },
-            },
-            "required": ["directory"],
-        },
+        parameters=_INGEST_DIRECTORY_SCHEMA,
         func=ingest_directory,
     )
     
@@ -362,98 +761,40 @@ def register_document_tools(registry: ToolRegistry) -> None:
             "Semantic search over the knowledge base. "
             "Finds document chunks most relevant to the query."
         ),
-        parameters={
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Natural language search query",
-                },
-                "collection": {
-                    "type": "string",
-                    "description": "Collection to search (default: 'documents')",
-                    "default": "documents",
-                },
-                "num_results": {
-                    "type": "integer",
-                    "description": "Number of results (default: 5)",
-                    "default": 5,
-                },
-            },
-            "required": ["query"],
-        },
+        parameters=_SEARCH_KNOWLEDGE_SCHEMA,
         func=search_documents,
     )
     
+    registry.register(
+        name="search_knowledge_stream",
+        description=(
+            "Semantic search over the knowledge base returning JSON Lines, "
+            "one matching chunk per line, best first."
+        ),
+        parameters=_SEARCH_KNOWLEDGE_SCHEMA,
+        func=search_documents_jsonl,
+    )
+    
     registry.register(
         name="extract_from_docs",
         description=(
             "Search documents and extract structured information using LangExtract. "
             "Combines semantic search with AI-powered extraction."
         ),
-        parameters={
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Search query to find relevant documents",
-                },
-                "extraction_prompt": {
-                    "type": "string",
-                    "description": "What information to extract (e.g., 'Extract all company names and their revenue')",
-                },
-                "collection": {
-                    "type": "string",
-                    "description": "Collection to search",
-                    "default": "documents",
-                },
-                "num_chunks": {
-                    "type": "integer",
-                    "description": "Number of document chunks to process",
-                    "default": 5,
-                },
-            },
-            "required": ["query", "extraction_prompt"],
-        },
+        parameters=_EXTRACT_FROM_DOCS_SCHEMA,
         func=extract_from_knowledge_base,
     )
     
     registry.register(
         name="list_knowledge",
         description="List all document collections and their statistics.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "collection": {
-                    "type": "string",
-                    "description": "Collection to get stats for",
-                    "default": "documents",
-                },
-            },
-        },
+        parameters=_LIST_KNOWLEDGE_SCHEMA,
         func=list_documents,
     )
     
     registry.register(
         name="delete_document",
         description="Delete documents from the knowledge base by ID or source file.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "doc_id": {
-                    "type": "string",
-                    "description": "Document ID to delete",
-                },
-                "source": {
-                    "type": "string",
-                    "description": "Delete all docs from this source file path",
-                },
-                "collection": {
-                    "type": "string",
-                    "description": "Collection to delete from",
-                    "default": "documents",
-                },
-            },
-        },
+        parameters=_DELETE_DOCUMENT_SCHEMA,
         func=delete_document,
     )
@@ -7,14 +7,63 @@ using Google's LangExtract library with LLM-powered extraction.
 
 from __future__ import annotations
 
+import codecs
 import json
 import logging
-from typing import Any
+import mmap
+from pathlib import Path
+from typing import Any, Iterable, Iterator
 
 from src.tools.registry import ToolRegistry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from src.extraction.extractor import get_extractor
+except ImportError:
+    get_extractor = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+LANGEXTRACT_MISSING = (
+    "❌ LangExtract not available. Install with:\n"
+    "pip install langextract"
+)
+
+# Documents larger than this are memory-mapped and extracted window by window
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Window size for streamed documents, in multiples of max_chunk_size
+STREAM_WINDOW_CHUNKS = 64
+
+
+def _iter_text_windows(path: Path, window_bytes: int) -> Iterator[str]:
+    """Decode a file from a memory map in windows of at most window_bytes bytes."""
+    # Incremental decoding carries multi-byte characters split across windows
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        for start in range(0, size, window_bytes):
+            end = min(start + window_bytes, size)
+            text = decoder.decode(mm[start:end], final=end == size)
+            if text:
+                yield text
+
+
+def _dumps(obj: Any) -> str:
+    """Compact JSON for extraction results (they're read by the model), via orjson when installed."""
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _err(tag: str, exc: Exception) -> str:
+    """Serialize a tool failure in the same JSON shape as its results."""
+    return _dumps({"success": False, "tool": tag, "error": f"{type(exc).__name__}: {exc}"})
+
 
 async def extract_entities_from_text(
     text: str,
@@ -32,16 +81,11 @@ async def extract_entities_from_text(
     Returns:
         JSON string of extracted entities with source grounding
     """
-    try:
-        from src.extraction.extractor import Extractor
-    except ImportError:
-        return (
-            "❌ LangExtract not available. Install with:\n"
-            "pip install langextract"
-        )
+    if get_extractor is None:
+        return LANGEXTRACT_MISSING
     
     try:
-        extractor = Extractor(model_id=model)
+        extractor = get_extractor(model)
         entity_list = [e.strip() for e in entity_types.split(",")]
         
         prompt = f"""Extract all entities of the following types from the text:
@@ -55,19 +99,19 @@ For each entity, identify:
         result = extractor.extract(text, prompt)
         
         if result.success:
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "entity_count": len(result.extractions),
                 "entities": result.extractions,
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": result.error,
-            }, indent=2)
+            })
             
     except Exception as e:
-        return f"❌ Extraction failed: {e}"
+        return _err("extract_entities", e)
 
 
 async def extract_structured_info(
@@ -86,16 +130,11 @@ async def extract_structured_info(
     Returns:
         JSON string of extracted structured data
     """
-    try:
-        from src.extraction.extractor import Extractor
-    except ImportError:
-        return (
-            "❌ LangExtract not available. Install with:\n"
-            "pip install langextract"
-        )
+    if get_extractor is None:
+        return LANGEXTRACT_MISSING
     
     try:
-        extractor = Extractor(model_id=model)
+        extractor = get_extractor(model)
         
         prompt = f"""Extract structured information from the text according to this schema:
 
@@ -107,18 +146,18 @@ Include source text references where possible."""
         result = extractor.extract(text, prompt)
         
         if result.success:
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "extractions": result.extractions,
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": result.error,
-            }, indent=2)
+            })
             
     except Exception as e:
-        return f"❌ Extraction failed: {e}"
+        return _err("extract_structured", e)
 
 
 async def extract_from_document(
@@ -139,52 +178,64 @@ async def extract_from_document(
     Returns:
         JSON string of extracted information
     """
-    from pathlib import Path
-    
-    try:
-        from src.extraction.extractor import Extractor
-    except ImportError:
-        return (
-            "❌ LangExtract not available. Install with:\n"
-            "pip install langextract"
-        )
+    if get_extractor is None:
+        return LANGEXTRACT_MISSING
     
     try:
         # Read document
         path = Path(file_path).expanduser().resolve()
         if not path.exists():
-            return f"❌ File not found: {file_path}"
+            return _err("extract_from_file", FileNotFoundError(f"File not found: {file_path}"))
         
-        text = path.read_text(encoding="utf-8", errors="replace")
+        extractor = get_extractor(model)
         
-        extractor = Extractor(model_id=model)
-        
-        # Use multiple passes for long documents
-        extraction_passes = 1 if len(text) < max_chunk_size else 3
+        windows: Iterable[str]
+        if path.stat().st_size > STREAM_THRESHOLD_BYTES:
+            # Never hold the whole decoded document; extract one window at a time
+            windows = _iter_text_windows(path, max_chunk_size * STREAM_WINDOW_CHUNKS)
+        else:
+            # One bytes copy, decoded once
+            with path.open("rb") as f:
+                windows = [f.read().decode("utf-8", errors="replace")]
         
-        result = extractor.extract(
-            text=text,
-            prompt=extraction_prompt,
-            extraction_passes=extraction_passes,
-            max_char_buffer=max_chunk_size,
-        )
+        extractions = []
+        document_length = 0
+        for text in windows:
+            # Use multiple passes for long documents
+            extraction_passes = 1 if document_length + len(text) < max_chunk_size else 3
+            
+            result = extractor.extract(
+                text=text,
+                prompt=extraction_prompt,
+                extraction_passes=extraction_passes,
+                max_char_buffer=max_chunk_size,
+            )
+            if not result.success:
+                return _dumps({
+                    "success": False,
+                    "error": result.error,
+                })
+            
+            # Source positions are relative to the window; make them document offsets
+            for ext in result.extractions:
+                if "source" in ext and document_length:
+                    ext["source"] = {
+                        k: v if v is None else v + document_length
+                        for k, v in ext["source"].items()
+                    }
+            extractions.extend(result.extractions)
+            document_length += len(text)
         
-        if result.success:
-            return json.dumps({
-                "success": True,
-                "source_file": str(path),
-                "document_length": len(text),
-                "extraction_count": len(result.extractions),
-                "extractions": result.extractions,
-            }, indent=2)
-        else:
-            return json.dumps({
-                "success": False,
-                "error": result.error,
-            }, indent=2)
+        return _dumps({
+            "success": True,
+            "source_file": str(path),
+            "document_length": document_length,
+            "extraction_count": len(extractions),
+            "extractions": extractions,
+        })
             
     except Exception as e:
-        return f"❌ Document extraction failed: {e}"
+        return _err("extract_from_file", e)
 
 
 async def extract_key_value_pairs(
@@ -203,16 +254,11 @@ async def extract_key_value_pairs(
     Returns:
         JSON object with field names as keys
     """
-    try:
-        from src.extraction.extractor import Extractor
-    except ImportError:
-        return (
-            "❌ LangExtract not available. Install with:\n"
-            "pip install langextract"
-        )
+    if get_extractor is None:
+        return LANGEXTRACT_MISSING
     
     try:
-        extractor = Extractor(model_id=model)
+        extractor = get_extractor(model)
         field_list = [f.strip() for f in fields.split(",")]
         
         prompt = f"""Extract the following fields from the text:
@@ -226,26 +272,119 @@ If a field is not found, indicate it as null."""
         if result.success:
             # Convert extractions to key-value format
             extracted = {}
+            lowered_fields: dict[str, str] = {}
+            for field in field_list:
+                lowered_fields.setdefault(field.lower(), field)
             for ext in result.extractions:
                 ext_type = ext.get("type", "").lower()
-                for field in field_list:
-                    if field.lower() in ext_type or ext_type in field.lower():
-                        extracted[field] = ext.get("text", "")
-                        break
+                name = lowered_fields.get(ext_type)
+                if name is None:
+                    # Tolerate partial names, e.g. "email" vs "email_address"
+                    name = next(
+                        (f for lf, f in lowered_fields.items() if lf in ext_type or ext_type in lf),
+                        None,
+                    )
+                if name is not None:
+                    extracted[name] = ext.get("text", "")
             
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "fields": extracted,
                 "raw_extractions": result.extractions,
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": result.error,
-            }, indent=2)
+            })
             
     except Exception as e:
-        return f"❌ Extraction failed: {e}"
+        return _err("extract_fields", e)
+
+
+# JSON schemas for the tool parameters, built once at import
+_EXTRACT_ENTITIES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "text": {
+            "type": "string",
+            "description": "The text to extract entities from",
+        },
+        "entity_types": {
+            "type": "string",
+            "description": "Comma-separated entity types to extract (e.g., 'person, organization, location, date')",
+        },
+        "model": {
+            "type": "string",
+            "description": "LLM model to use (default: gemini-2.5-flash)",
+            "default": "gemini-2.5-flash",
+        },
+    },
+    "required": ["text", "entity_types"],
+}
+
+
+_EXTRACT_STRUCTURED_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "text": {
+            "type": "string",
+            "description": "The text to extract from",
+        },
+        "schema_description": {
+            "type": "string",
+            "description": "Description of what to extract and expected structure",
+        },
+        "model": {
+            "type": "string",
+            "description": "LLM model to use",
+            "default": "gemini-2.5-flash",
+        },
+    },
+    "required": ["text", "schema_description"],
+}
+
+
+_EXTRACT_FROM_FILE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "file_path": {
+            "type": "string",
+            "description": "Path to the document file",
+        },
+        "extraction_prompt": {
+            "type": "string",
+            "description": "What information to extract from the document",
+        },
+        "model": {
+            "type": "string",
+            "description": "LLM model to use",
+            "default": "gemini-2.5-flash",
+        },
+    },
+    "required": ["file_path", "extraction_prompt"],
+}
+
+
+_EXTRACT_FIELDS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "text": {
+            "type": "string",
+            "description": "The text to extract from",
+        },
+        "fields": {
+            "type": "string",
+            "description": "Comma-separated field names to extract (e.g., 'name, email, phone')",
+        },
+        "model": {
+            "type": "string",
+            "description": "LLM model to use",
+            "default": "gemini-2.5-flash",
+        },
+    },
+    "required": ["text", "fields"],
+}
 
 
 def register_extraction_tools(registry: ToolRegistry) -> None:
@@ -258,25 +397,7 @@ def register_extraction_tools(registry: ToolRegistry) -> None:
             "using LangExtract with source grounding. Returns entities with their "
             "exact positions in the source text."
         ),
-        parameters={
-            "type": "object",
-            "properties": {
-                "text": {
-                    "type": "string",
-                    "description": "The text to extract entities from",
-                },
-                "entity_types": {
-                    "type": "string",
-                    "description": "Comma-separated entity types to extract (e.g., 'person, organization, location, date')",
-                },
-                "model": {
-                    "type": "string",
-                    "description": "LLM model to use (default: gemini-2.5-flash)",
-                    "default": "gemini-2.5-flash",
-                },
-            },
-            "required": ["text", "entity_types"],
-        },
+        parameters=_EXTRACT_ENTITIES_SCHEMA,
         func=extract_entities_from_text,
     )
     
@@ -286,25 +407,7 @@ def register_extraction_tools(registry: ToolRegistry) -> None:
             "Extract structured information from text according to a schema description. "
             "Useful for parsing contracts, reports, emails, etc. into structured data."
         ),
-        parameters={
-            "type": "object",
-            "properties": {
-                "text": {
-                    "type": "string",
-                    "description": "The text to extract from",
-                },
-                "schema_description": {
-                    "type": "string",
-                    "description": "Description of what to extract and expected structure",
-                },
-                "model": {
-                    "type": "string",
-                    "description": "LLM model to use",
-                    "default": "gemini-2.5-flash",
-                },
-            },
-            "required": ["text", "schema_description"],
-        },
+        parameters=_EXTRACT_STRUCTURED_SCHEMA,
         func=extract_structured_info,
     )
     
@@ -314,25 +417,7 @@ def register_extraction_tools(registry: ToolRegistry) -> None:
             "Extract information from a document file (txt, md, etc.). "
             "Handles long documents with chunking and multiple passes."
         ),
-        parameters={
-            "type": "object",
-            "properties": {
-                "file_path": {
-                    "type": "string",
-                    "description": "Path to the document file",
-                },
-                "extraction_prompt": {
-                    "type": "string",
-                    "description": "What information to extract from the document",
-                },
-                "model": {
-                    "type": "string",
-                    "description": "LLM model to use",
-                    "default": "gemini-2.5-flash",
-                },
-            },
-            "required": ["file_path", "extraction_prompt"],
-        },
+        parameters=_EXTRACT_FROM_FILE_SCHEMA,
         func=extract_from_document,
     )
     
@@ -342,24 +427,6 @@ def register_extraction_tools(registry: ToolRegistry) -> None:
             "Extract specific fields/key-value pairs from text. "
             "Useful for parsing structured text like contact info, forms, receipts."
         ),
-        parameters={
-            "type": "object",
-            "properties": {
-                "text": {
-                    "type": "string",
-                    "description": "The text to extract from",
-                },
-                "fields": {
-                    "type": "string",
-                    "description": "Comma-separated field names to extract (e.g., 'name, email, phone')",
-                },
-                "model": {
-                    "type": "string",
-                    "description": "LLM model to use",
-                    "default": "gemini-2.5-flash",
-                },
-            },
-            "required": ["text", "fields"],
-        },
+        parameters=_EXTRACT_FIELDS_SCHEMA,
         func=extract_key_value_pairs,
     )
@@ -6,9 +6,17 @@ All operations respect workspace sandboxing when enabled.
 
 from __future__ import annotations
 
+import asyncio
+import mmap
 import os
 import logging
+import re
+import shutil
+import tempfile
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import overload
 
 from src.tools.registry import ToolRegistry
 from src.config.settings import get_settings
@@ -22,14 +30,37 @@ BLOCKED_PATHS = {
     '/var/root', '/.Trashes', '/System', '/Library',
     '/bin', '/sbin', '/usr/bin', '/usr/sbin',
 }
+# Same, as a tuple, and as one pattern that also reports which prefix matched
+BLOCKED_PREFIXES = tuple(sorted(BLOCKED_PATHS))
+_BLOCKED_RE = re.compile("|".join(re.escape(prefix) for prefix in BLOCKED_PREFIXES))
+
+# Files larger than this are memory-mapped rather than read into a buffer
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Ranged reads of files larger than this stream lines instead of loading the file
+STREAM_READ_THRESHOLD = 1024 * 1024
+
+# list_directory stops counting a subdirectory's entries past this many
+MAX_CHILD_COUNT = 1000
+
+# edit_file reports at most this many remaining occurrences ("5+" beyond)
+EDIT_COUNT_LIMIT = 5
+
+# Subdirectories counted at once by list_directory(deep=True)
+MAX_COUNT_CONCURRENCY = 32
+
+
+@lru_cache(maxsize=4)
+def _resolve_workspace(workspace: str) -> Path:
+    """Resolve (and create) a workspace directory; done once per configured value."""
+    root = Path(workspace).expanduser().resolve()
+    root.mkdir(parents=True, exist_ok=True)
+    return root
 
 
 def _get_workspace_root() -> Path:
     """Get the configured workspace root directory."""
-    settings = get_settings()
-    workspace = Path(settings.agents.defaults.workspace).expanduser().resolve()
-    workspace.mkdir(parents=True, exist_ok=True)
-    return workspace
+    return _resolve_workspace(str(get_settings().agents.defaults.workspace))
 
 
 def _is_sandboxed() -> bool:
@@ -38,6 +69,13 @@ def _is_sandboxed() -> bool:
     return settings.agents.defaults.workspace_sandboxed
 
 
+@lru_cache(maxsize=512)
+def _blocked_prefix(resolved_str: str) -> str | None:
+    """The blocked prefix a resolved path starts with, if any; agents revisit the same paths."""
+    match = _BLOCKED_RE.match(resolved_str)
+    return match.group() if match else None
+
+
 def _is_safe_path(path: Path, session_id: str | None = None) -> tuple[bool, str]:
     """
     Check if path is safe to access.
@@ -53,26 +91,90 @@ def _is_safe_path(path: Path, session_id: str | None = None) -> tuple[bool, str]
     resolved_str = str(resolved)
 
     # Block absolute paths to sensitive locations
-    for blocked in BLOCKED_PATHS:
-        if resolved_str.startswith(blocked):
-            return False, f"Access denied to system path: {blocked}"
+    blocked = _blocked_prefix(resolved_str)
+    if blocked is not None:
+        return False, f"Access denied to system path: {blocked}"
 
     # Check workspace sandboxing
-    if _is_sandboxed():
-        workspace_root = _get_workspace_root()
-        try:
-            resolved.relative_to(workspace_root)
-        except ValueError:
-            logger.warning(f"Path outside workspace (sandboxed mode): {path} -> {resolved}")
-            return False, f"Path is outside workspace: {path}"
+    sandboxed = _is_sandboxed()
+    if sandboxed and not resolved.is_relative_to(_get_workspace_root()):
+        logger.warning(f"Path outside workspace (sandboxed mode): {path} -> {resolved}")
+        return False, f"Path is outside workspace: {path}"
 
     # Additional check: prevent access to hidden system directories in root
-    if resolved_str.startswith('/.') and not _is_sandboxed():
+    if resolved_str.startswith('/.') and not sandboxed:
         return False, "Access denied to hidden system directory"
 
     return True, ""
 
 
+def _read_lines(p: Path, start: int, end: int | None) -> str:
+    """
+    Read lines [start, end) of a file (0-indexed, end=None for to-the-end)
+    without loading the rest of it. Matches splitting the whole text on "\n".
+    """
+    with p.open("r", encoding="utf-8", errors="replace") as f:
+        lines = list(islice(f, start, end))
+    text = "".join(lines)
+    # A full range stops before the line's own newline; a range reaching EOF keeps it
+    if end is not None and len(lines) == end - start and text.endswith("\n"):
+        text = text[:-1]
+    return text
+
+
+def _slice_lines(content: str, start: int, end: int | None) -> str:
+    """
+    Lines [start, end) of content (0-indexed, end=None for to-the-end), found
+    by scanning for newlines rather than splitting the whole text.
+    """
+    if end is not None and end <= start:
+        return ""
+    pos = 0
+    for _ in range(start):
+        pos = content.find("\n", pos) + 1
+        if pos == 0:
+            return ""
+    if end is None:
+        return content[pos:]
+    stop = pos
+    for _ in range(end - start):
+        stop = content.find("\n", stop) + 1
+        if stop == 0:
+            return content[pos:]
+    return content[pos:stop - 1]
+
+
+def _read_text(p: Path) -> str:
+    """Read a whole file as UTF-8 text with universal newlines, like Path.read_text."""
+    with p.open("rb") as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            # Decode straight from the page cache, skipping the intermediate bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, "utf-8", "replace")
+        else:
+            content = f.read().decode("utf-8", errors="replace")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _read_range(p: Path, start_line: int, end_line: int) -> str:
+    """Read a file, or a 1-indexed line range of it, as read_file returns it."""
+    if start_line > 0 or end_line > 0:
+        start = max(0, start_line - 1) if start_line > 0 else 0
+        end = end_line if end_line > 0 else None
+        if p.stat().st_size > STREAM_READ_THRESHOLD:
+            return _read_lines(p, start, end)
+        return _slice_lines(_read_text(p), start, end)
+    return _read_text(p)
+
+
+def _write_text(p: Path, content: str) -> None:
+    """Write a file, creating its parent directories."""
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(content, encoding="utf-8")
+
+
 async def read_file(path: str, start_line: int = 0, end_line: int = 0) -> str:
     """
     Read the contents of a file.
@@ -92,15 +194,8 @@ async def read_file(path: str, start_line: int = 0, end_line: int = 0) -> str:
         if not p.is_file():
             return f"Error: Not a file: {path}"
 
-        content = p.read_text(encoding="utf-8", errors="replace")
-
-        if start_line > 0 or end_line > 0:
-            lines = content.split("\n")
-            start = max(0, start_line - 1) if start_line > 0 else 0
-            end = end_line if end_line > 0 else len(lines)
-            content = "\n".join(lines[start:end])
-
-        return content
+        # File I/O runs on a worker thread so large reads don't stall the event loop
+        return await asyncio.to_thread(_read_range, p, start_line, end_line)
     except Exception as e:
         return f"Error reading file: {e}"
 
@@ -118,13 +213,73 @@ async def write_file(path: str, content: str) -> str:
         is_safe, error = _is_safe_path(p)
         if not is_safe:
             return f"Error: {error}"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(content, encoding="utf-8")
+        await asyncio.to_thread(_write_text, p, content)
         return f"Wrote {len(content)} bytes to {p}"
     except Exception as e:
         return f"Error writing file: {e}"
 
 
+@overload
+def _count_occurrences(text: str, target: str, start: int, limit: int) -> int: ...
+@overload
+def _count_occurrences(text: bytes | mmap.mmap, target: bytes, start: int, limit: int) -> int: ...
+def _count_occurrences(text, target, start, limit):
+    """
+    Count non-overlapping occurrences of a non-empty target in text[start:], stopping at limit.
+
+    For UTF-8 bytes the count equals the count over the decoded text: a
+    non-empty encoded target can only match on character boundaries.
+    """
+    count = 0
+    step = len(target)
+    while count < limit:
+        start = text.find(target, start)
+        if start < 0:
+            break
+        count += 1
+        start += step
+    return count
+
+
+def _edit_mapped(p: Path, target: str, replacement: str) -> int | None:
+    """
+    Replace the first occurrence of target in a large file without decoding it.
+
+    The file is searched through a memory map and rewritten to a temporary
+    file that atomically replaces it. Returns the number of occurrences left
+    (bounded as in edit_file), -1 if target is missing, or None if the file
+    has carriage returns and must take the text path for newline translation.
+    """
+    target_bytes = target.encode("utf-8")
+    with p.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm.find(b"\r") >= 0:
+            return None
+        idx = mm.find(target_bytes)
+        if idx < 0:
+            return -1
+        end = idx + len(target_bytes)
+        remaining = _count_occurrences(mm, target_bytes, end, EDIT_COUNT_LIMIT + 1)
+
+        fd, tmp_path = tempfile.mkstemp(dir=p.parent, prefix=f".{p.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(memoryview(mm)[:idx])
+                out.write(replacement.encode("utf-8"))
+                out.write(memoryview(mm)[end:])
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    # Swap in the new file once the map is closed
+    try:
+        shutil.copymode(p, tmp_path)
+        os.replace(tmp_path, p)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return remaining
+
+
 async def edit_file(
     path: str,
     target_content: str,
@@ -138,35 +293,72 @@ async def edit_file(
         target_content: The exact text to find and replace.
         replacement_content: The replacement text.
     """
+    if not target_content:
+        return "Error: target_content must not be empty"
+
     try:
         p = Path(path).expanduser().resolve()
         if not p.exists():
             return f"Error: File not found: {path}"
 
-        original = p.read_text(encoding="utf-8")
+        remaining = None
+        if p.stat().st_size > MMAP_THRESHOLD:
+            remaining = await asyncio.to_thread(_edit_mapped, p, target_content, replacement_content)
+        if remaining is None:
+            original = await asyncio.to_thread(p.read_text, encoding="utf-8")
+            idx = original.find(target_content)
+            if idx >= 0:
+                end = idx + len(target_content)
+                modified = original[:idx] + replacement_content + original[end:]
+                await asyncio.to_thread(p.write_text, modified, encoding="utf-8")
+                remaining = _count_occurrences(original, target_content, end, EDIT_COUNT_LIMIT + 1)
+            else:
+                remaining = -1
 
-        if target_content not in original:
+        if remaining < 0:
             return f"Error: Target content not found in {path}. Make sure it matches exactly."
 
-        count = original.count(target_content)
-        modified = original.replace(target_content, replacement_content, 1)
-        p.write_text(modified, encoding="utf-8")
-
+        if remaining > EDIT_COUNT_LIMIT:
+            remaining_str = f"{EDIT_COUNT_LIMIT}+"
+        else:
+            remaining_str = str(remaining)
         return (
             f"Replaced 1 occurrence in {p}"
-            + (f" ({count - 1} more occurrence(s) remain)" if count > 1 else "")
+            + (f" ({remaining_str} more occurrence(s) remain)" if remaining else "")
         )
     except Exception as e:
         return f"Error editing file: {e}"
 
 
-async def list_directory(path: str = ".", show_hidden: bool = False) -> str:
+def _count_entries(path: str) -> int | None:
+    """Count a directory's entries, up to MAX_CHILD_COUNT + 1; None if unreadable."""
+    try:
+        with os.scandir(path) as children:
+            return sum(1 for _ in islice(children, MAX_CHILD_COUNT + 1))
+    except PermissionError:
+        return None
+
+
+async def _count_subdirs(subdirs: list[os.DirEntry]) -> dict[str, int | None]:
+    """Count several subdirectories' entries concurrently on worker threads."""
+    semaphore = asyncio.Semaphore(MAX_COUNT_CONCURRENCY)
+
+    async def count(entry: os.DirEntry) -> int | None:
+        async with semaphore:
+            return await asyncio.to_thread(_count_entries, entry.path)
+
+    counts = await asyncio.gather(*(count(entry) for entry in subdirs))
+    return {entry.name: n for entry, n in zip(subdirs, counts, strict=True)}
+
+
+async def list_directory(path: str = ".", show_hidden: bool = False, deep: bool = False) -> str:
     """
     List files and directories at the given path.
 
     Args:
         path: Directory path to list (default: current directory).
         show_hidden: Whether to show hidden files (default: false).
+        deep: Whether to count the entries in each subdirectory (default: false).
     """
     try:
         p = Path(path).expanduser().resolve()
@@ -175,17 +367,30 @@ async def list_directory(path: str = ".", show_hidden: bool = False) -> str:
         if not p.is_dir():
             return f"Error: Not a directory: {path}"
 
-        entries = []
-        for item in sorted(p.iterdir()):
-            if not show_hidden and item.name.startswith("."):
-                continue
+        # scandir reports each entry's type from the directory read itself
+        with os.scandir(p) as it:
+            items = sorted(it, key=lambda entry: entry.name)
+
+        if not show_hidden:
+            items = [item for item in items if not item.name.startswith(".")]
 
+        counts = {}
+        if deep:
+            # Slow filesystems (network, FUSE) answer these in parallel
+            counts = await _count_subdirs([item for item in items if item.is_dir()])
+
+        entries = []
+        for item in items:
             if item.is_dir():
-                try:
-                    child_count = sum(1 for _ in item.iterdir())
-                    entries.append(f"[dir] {item.name}/ ({child_count} items)")
-                except PermissionError:
+                if not deep:
+                    entries.append(f"[dir] {item.name}/")
+                    continue
+                child_count = counts[item.name]
+                if child_count is None:
                     entries.append(f"[dir] {item.name}/ (permission denied)")
+                else:
+                    count_str = f"{MAX_CHILD_COUNT}+" if child_count > MAX_CHILD_COUNT else str(child_count)
+                    entries.append(f"[dir] {item.name}/ ({count_str} items)")
             else:
                 size = item.stat().st_size
                 if size < 1024:
@@ -293,6 +498,11 @@ def register_filesystem_tools(registry: ToolRegistry) -> None:
                     "description": "Whether to show hidden files",
                     "default": False,
                 },
+                "deep": {
+                    "type": "boolean",
+                    "description": "Whether to count the items in each subdirectory",
+                    "default": False,
+                },
             },
             "required": [],
         },
@@ -6,12 +6,20 @@ from __future__ import annotations
 
 import logging
 import subprocess
+from itertools import islice
 from typing import Optional
 
+from src.tools._osascript import get_osa_pipe
 from src.tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+# Scripts run through the shared osascript host instead of one process per call
+_OSA = get_osa_pipe()
+
+# Seconds an app script may run; launching Notes or Reminders can take a while
+OSA_TIMEOUT = 30
+
 
 # ==================== APPLICATION CONTROL ====================
 
@@ -42,7 +50,7 @@ def close_application(app_name: str, force: bool = False) -> str:
             subprocess.run(['killall', app_name], check=False)
         else:
             script = f'tell application "{app_name}" to quit'
-            subprocess.run(['osascript', '-e', script], check=True)
+            _OSA.run(script, timeout=OSA_TIMEOUT)
         return f"Closed {app_name}"
     except Exception as e:
         return f"Error closing {app_name}: {e}"
@@ -51,13 +59,10 @@ def close_application(app_name: str, force: bool = False) -> str:
 def list_running_apps() -> str:
     """List all running applications."""
     try:
-        result = subprocess.run(
-            ['osascript', '-e', 'tell application "System Events" to get name of every process whose background only is false'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        apps = [app.strip() for app in result.stdout.split(',')]
+        apps = _OSA.run(
+            'tell application "System Events" to get name of every process whose background only is false',
+            timeout=OSA_TIMEOUT,
+        ) or []
         return f"Running apps ({len(apps)}): {', '.join(sorted(apps))}"
     except Exception as e:
         return f"Error listing apps: {e}"
@@ -65,6 +70,13 @@ def list_running_apps() -> str:
 
 # ==================== APPLE NOTES ====================
 
+# Every note's name and body in one round trip; search_notes filters in Python
+_NOTES_SCRIPT = '''
+tell application "Notes"
+    return {name of every note, body of every note}
+end tell
+'''
+
 def create_note(title: str, content: str, folder: str = "Notes") -> str:
     """
     Create a new note in Apple Notes.
@@ -85,7 +97,7 @@ def create_note(title: str, content: str, folder: str = "Notes") -> str:
             end tell
         end tell
         '''
-        subprocess.run(['osascript', '-e', script], check=True)
+        _OSA.run(script, timeout=OSA_TIMEOUT)
         return f"Created note '{title}' in {folder}"
     except Exception as e:
         return f"Error creating note: {e}"
@@ -100,27 +112,14 @@ def search_notes(query: str, limit: int = 5) -> str:
         limit: Maximum results (default 5).
     """
     try:
-        script = f'''
-        tell application "Notes"
-            set noteList to {{}}
-            set allNotes to every note
-            repeat with aNote in allNotes
-                set noteBody to body of aNote as text
-                set noteName to name of aNote as text
-                if noteBody contains "{query}" or noteName contains "{query}" then
-                    set end of noteList to noteName
-                end if
-            end repeat
-            return noteList
-        end tell
-        '''
-        result = subprocess.run(
-            ['osascript', '-e', script],
-            capture_output=True,
-            text=True,
-            check=True
+        names, bodies = _OSA.run(_NOTES_SCRIPT, timeout=OSA_TIMEOUT) or (None, None)
+        # AppleScript's `contains` ignores case; so does this
+        needle = query.casefold()
+        matches = (
+            name for name, body in zip(names or [], bodies or [], strict=True)
+            if name and (needle in name.casefold() or needle in (body or "").casefold())
         )
-        notes = [n.strip() for n in result.stdout.split(',') if n.strip()][:limit]
+        notes = list(islice(matches, max(limit, 0)))
         if not notes:
             return f"No notes found containing '{query}'"
         return f"Found {len(notes)} notes:\n" + "\n".join(f"- {n}" for n in notes)
@@ -147,7 +146,7 @@ def create_reminder(title: str, list_name: str = "Reminders") -> str:
             end tell
         end tell
         '''
-        subprocess.run(['osascript', '-e', script], check=True)
+        _OSA.run(script, timeout=OSA_TIMEOUT)
         return f"Created reminder '{title}' in list '{list_name}'"
     except Exception as e:
         return f"Error creating reminder: {e}"
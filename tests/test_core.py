@@ -7,6 +7,7 @@ from pathlib import Path
 from datetime import datetime
 import tempfile
 import json
+from types import SimpleNamespace
 
 from src.core.session import Session, SessionType, SessionManager, SessionConfig, SandboxPolicy
 from src.core.protocol import Message, ToolCall, ToolDefinition, WebSocketMessage, MessageType
@@ -273,6 +274,439 @@ class TestSkills:
             assert found is not None
             assert found.name == "test-skill"
 
+    async def test_skill_hub_detects_changes(self):
+        """Test that the hub only reports skills whose module changed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            from src.skills.hub import SkillHub
+
+            skill_dir = Path(tmpdir) / "echo"
+            skill_dir.mkdir()
+            (skill_dir / "manifest.json").write_text(json.dumps({
+                "name": "echo", "version": "1.0", "description": "Echo", "author": "test",
+            }))
+            (skill_dir / "__init__.py").write_text("VALUE = 1\n")
+
+            hub = SkillHub(Path(tmpdir))
+            hub.load_skill("echo")
+            assert await hub.check_for_updates() == {"echo": False}
+
+            (skill_dir / "__init__.py").write_text("VALUE = 22\n")
+            assert await hub.check_for_updates() == {"echo": True}
+            assert hub.reload_skill("echo").module.VALUE == 22
+
+            # A broken edit fails the reload itself, not a later attribute access
+            (skill_dir / "__init__.py").write_text("VALUE = (\n")
+            with pytest.raises(SyntaxError):
+                hub.reload_skill("echo")
+
+            # A missing skills directory reports no changes instead of raising
+            hub.skills_dir = Path(tmpdir) / "gone"
+            assert await hub.check_for_updates() == {}
+
+
+class _FakeEmbeddings:
+    """Deterministic embeddings so vector store tests don't need a model."""
+
+    dimension = 4
+    model_name = "fake"
+
+    def embed(self, text):
+        return [float(len(text)), float(text.count("a")), float(text.count("e")), 1.0]
+
+    def embed_batch(self, texts):
+        return [self.embed(t) for t in texts]
+
+
+class TestVectorStore:
+    """Tests for the file-backed vector store."""
+
+    def test_write_log_replay_and_compaction(self):
+        """Test that adds/deletes survive a reload and compaction folds the log."""
+        pytest.importorskip("numpy")
+        from src.retrieval.vector_store import VectorStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = VectorStore(tmpdir, embeddings=_FakeEmbeddings())
+            ids = store.add_batch(["alpha", "beta", "gamma"], metadatas=[{"source": "a"}] * 3)
+            store.add("delta", metadata={"source": "b"})
+            store.delete(doc_ids=ids[1:])
+
+            assert (Path(tmpdir) / "documents.jsonl").exists()
+            reloaded = VectorStore(tmpdir, embeddings=_FakeEmbeddings())
+            assert reloaded.count() == 2
+            assert reloaded.get([ids[1]]) == []
+            # The ID counter survives the restart, so deleted IDs are not reissued
+            assert not set(reloaded.add_batch(["epsilon"])) & set(ids)
+
+            reloaded.compact()
+            assert not (Path(tmpdir) / "documents.jsonl").exists()
+            assert VectorStore(tmpdir, embeddings=_FakeEmbeddings()).count() == 3
+
+    def test_filtered_fp32_search_matches_fp16(self):
+        """Test that filtered search scores the same rows at either storage precision."""
+        pytest.importorskip("numpy")
+        from src.retrieval.vector_store import VectorStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            texts = [f"doc {i}" for i in range(20)]
+            metadatas = [{"source": f"s{i % 3}"} for i in range(20)]
+            results = []
+            for dtype in ("float32", "float16"):
+                store = VectorStore(Path(tmpdir) / dtype, embeddings=_FakeEmbeddings(), embedding_dtype=dtype)
+                store.add_batch(texts, metadatas=metadatas)
+                results.append(store.search("doc 4", n_results=5, where={"source": "s1"}))
+
+            assert [r["id"] for r in results[0]] == [r["id"] for r in results[1]]
+            assert all(r["metadata"]["source"] == "s1" for r in results[0])
+
+    def test_search_iter_matches_search(self):
+        """Test that streamed results equal the materialized search."""
+        pytest.importorskip("numpy")
+        from src.retrieval.vector_store import VectorStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = VectorStore(tmpdir, embeddings=_FakeEmbeddings())
+            store.add_batch([f"doc {i}" for i in range(10)])
+
+            assert list(store.search_iter("doc 3", n_results=4)) == store.search("doc 3", n_results=4)
+            assert list(store.search_iter("doc", collection="empty")) == []
+
+
+class _StubSearchStore:
+    """Vector store stand-in that records embed_queries batches.
+
+    Each distinct query embeds to its own one-hot vector, and searching with
+    it returns that query as the only hit.
+    """
+
+    def __init__(self, token_counts=None, fail=False):
+        self.embeddings = SimpleNamespace(token_counts=token_counts)
+        self.fail = fail
+        self.batches = []
+        self.vocab = []
+
+    def write_generation(self, collection):
+        return 0
+
+    def embed_queries(self, queries):
+        np = pytest.importorskip("numpy")
+        self.batches.append(list(queries))
+        if self.fail:
+            raise RuntimeError("embedding backend down")
+        vectors = np.zeros((len(queries), 16), dtype=np.float32)
+        for row, query in enumerate(queries):
+            if query not in self.vocab:
+                self.vocab.append(query)
+            vectors[row, self.vocab.index(query)] = 1.0
+        return vectors
+
+    def search_with_embedding(self, query_vector, n_results, collection):
+        query = self.vocab[int(query_vector.argmax())]
+        return [{"text": query, "score": 1.0, "metadata": {}}]
+
+
+class TestQueryCache:
+    """Tests for the document search result cache."""
+
+    def test_lru_eviction_and_invalidation(self):
+        """Test that the cache evicts least recently used entries and drops a collection."""
+        from src.tools._query_cache import QueryCache, make_key
+
+        cache = QueryCache(maxsize=2, ttl=60)
+        a, b, c = (make_key("docs", q, 5) for q in ("a", "b", "c"))
+        cache.put(a, ["A"])
+        cache.put(b, ["B"])
+        assert cache.get(a) == ["A"]
+        cache.put(c, ["C"])
+
+        assert cache.get(b) is None
+        assert cache.stats()["evictions"] == 1
+
+        cache.put(make_key("notes", "a", 5), ["N"])
+        cache.invalidate("docs")
+        assert cache.get(a) is None and cache.get(c) is None
+        assert cache.get(make_key("notes", "a", 5)) == ["N"]
+
+    def test_entries_expire(self):
+        """Test that entries past their TTL are treated as misses."""
+        from src.tools._query_cache import QueryCache
+
+        cache = QueryCache(maxsize=4, ttl=-1)
+        cache.put("k", 1)
+        assert cache.get("k") is None
+
+    def test_semantic_cache_threshold(self):
+        """Test that near-duplicate queries hit and a wrong hit tightens the threshold."""
+        np = pytest.importorskip("numpy")
+        from src.tools._sem_cache import SemanticCache
+
+        cache = SemanticCache(capacity=4, threshold=0.95)
+        cache.put("docs", 5, np.array([1.0, 0.0]), [{"id": "a"}])
+        near = np.array([0.96, 0.28])
+
+        assert cache.lookup("docs", 3, near) is None
+        hit = cache.lookup("docs", 5, near)
+        assert hit is not None and hit.results == [{"id": "a"}]
+
+        assert cache.feedback(hit, [{"id": "b"}]) is False
+        assert cache.lookup("docs", 5, near) is None
+
+        cache.invalidate("docs")
+        assert cache.lookup("docs", 5, np.array([1.0, 0.0])) is None
+
+    async def test_direct_store_writes_invalidate_search(self):
+        """Test that writes bypassing the document tools still refresh cached searches."""
+        pytest.importorskip("numpy")
+        from src.retrieval.vector_store import VectorStore
+        from src.tools import documents
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = VectorStore(tmpdir, embeddings=_FakeEmbeddings())
+            store.add("alpha", collection="qc_direct")
+            first = await documents._cached_search(store, "alpha", 5, "qc_direct")
+            assert len(first) == 1
+
+            store.add("beta", collection="qc_direct")  # e.g. a WebChat upload
+            assert len(await documents._cached_search(store, "alpha", 5, "qc_direct")) == 2
+
+    async def test_stream_tool_matches_search(self, monkeypatch):
+        """Test that search_knowledge_stream returns the search results as JSON lines."""
+        pytest.importorskip("numpy")
+        from src.retrieval.vector_store import VectorStore
+        from src.tools import documents
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = VectorStore(tmpdir, embeddings=_FakeEmbeddings())
+            store.add_batch([f"doc {i}" for i in range(6)], metadatas=[{"source": "a.txt"}] * 6)
+            monkeypatch.setattr(documents, "get_vector_store", lambda *a, **k: store)
+
+            lines = (await documents.search_documents_jsonl("doc 2", num_results=3)).splitlines()
+            expected = json.loads(await documents.search_documents("doc 2", num_results=3))["results"]
+            assert [json.loads(line) for line in lines] == expected
+            assert await documents.search_documents_jsonl("doc", collection="empty") == ""
+
+
+class TestSearchCoalescer:
+    """Tests for batching concurrent document searches."""
+
+    async def _search_all(self, monkeypatch, store, queries, collection):
+        import asyncio
+        from src.tools import documents
+
+        monkeypatch.setattr(documents, "get_vector_store", lambda *a, **k: store)
+        outputs = await asyncio.gather(
+            *(documents.search_documents(q, collection=collection) for q in queries)
+        )
+        return [json.loads(out) for out in outputs]
+
+    async def test_concurrent_searches_share_one_batch(self, monkeypatch):
+        """Test that concurrent searches are embedded together and routed back to their callers."""
+        store = _StubSearchStore()
+        queries = ["alpha", "beta", "gamma"]
+        outputs = await self._search_all(monkeypatch, store, queries, "co_batch")
+
+        assert store.batches == [queries]
+        assert [out["results"][0]["text"] for out in outputs] == queries
+
+    async def test_batches_split_by_query_length(self, monkeypatch):
+        """Test that queries in different token-length buckets get separate embed calls."""
+        store = _StubSearchStore(token_counts=lambda qs: [len(q.split()) for q in qs])
+        long_query = " ".join(["word"] * 40)
+        queries = ["short one", long_query, "short two"]
+        outputs = await self._search_all(monkeypatch, store, queries, "co_buckets")
+
+        assert store.batches == [["short one", "short two"], [long_query]]
+        assert [out["results"][0]["text"] for out in outputs] == queries
+
+    async def test_failure_reaches_every_waiter(self, monkeypatch):
+        """Test that an embedding error is reported to each batched caller."""
+        store = _StubSearchStore(fail=True)
+        outputs = await self._search_all(monkeypatch, store, ["x", "y", "z"], "co_fail")
+
+        assert len(store.batches) == 1
+        assert all(
+            out == {"success": False, "tool": "search_knowledge", "error": "RuntimeError: embedding backend down"}
+            for out in outputs
+        )
+
+
+class TestSecurityAudit:
+    """Tests for security audit logging."""
+
+    async def test_read_events_returns_latest_in_order(self):
+        """Test that read_events returns the newest matching events, oldest first."""
+        from src.security.audit import AuditSeverity, SecurityAudit
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audit = SecurityAudit(Path(tmpdir))
+            for i in range(50):
+                audit.log_workspace_violation(f"/outside/{i}", "read")
+            audit.log_path_traversal("../etc", "/etc")
+            await audit.flush()
+
+            events = audit.read_events(limit=3, event_type="workspace_violation")
+            assert [e["details"]["path"] for e in events] == [
+                "/outside/47", "/outside/48", "/outside/49",
+            ]
+
+            critical = audit.read_events(severity=AuditSeverity.CRITICAL)
+            assert len(critical) == 1
+            assert critical[0]["event_type"] == "path_traversal"
+
+    async def test_unencodable_event_drops_only_itself(self):
+        """Test that non-str keys are written and a bad event doesn't sink its batch."""
+        from src.security.audit import AuditEvent, AuditSeverity, SecurityAudit
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audit = SecurityAudit(Path(tmpdir))
+            audit.log_event(AuditEvent("custom", AuditSeverity.INFO, "int key", {1: "x"}))
+            audit.log_event(AuditEvent("custom", AuditSeverity.INFO, "tuple key", {(1, 2): "x"}))
+            audit.log_event(AuditEvent("custom", AuditSeverity.INFO, "plain", {"a": 1}))
+            await audit.flush()
+
+            events = audit.read_events(event_type="custom")
+            assert [e["message"] for e in events] == ["int key", "plain"]
+            assert events[0]["details"] == {"1": "x"}
+
+    async def test_overflow_keeps_log_order(self, monkeypatch):
+        """Test that a warning written past a full queue lands after the queued events."""
+        from src.security import audit as audit_mod
+        from src.security.audit import AuditEvent, AuditSeverity, SecurityAudit
+
+        monkeypatch.setattr(audit_mod, "MAX_QUEUE_SIZE", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audit = SecurityAudit(Path(tmpdir))
+            for message, severity in [
+                ("info 0", AuditSeverity.INFO),
+                ("info 1", AuditSeverity.INFO),
+                ("info 2", AuditSeverity.INFO),  # Queue full: dropped
+                ("warn 3", AuditSeverity.WARNING),  # Queue full: written after 0 and 1
+                ("info 4", AuditSeverity.INFO),
+            ]:
+                audit.log_event(AuditEvent("custom", severity, message))
+            await audit.flush()
+
+            assert [e["message"] for e in audit.read_events()] == ["info 0", "info 1", "warn 3", "info 4"]
+            assert audit.dropped_events == 1
+
+            audit.log_event(AuditEvent("custom", AuditSeverity.INFO, "info 5"))
+            audit.close()
+            assert audit.read_events(limit=1)[0]["message"] == "info 5"
+
+
+class TestFilesystem:
+    """Tests for filesystem tool helpers."""
+
+    def test_line_ranges_match_split(self):
+        """Test that scanned and streamed line ranges equal splitting on newlines."""
+        from src.tools.filesystem import _read_lines, _slice_lines
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "f.txt"
+            for content in ["", "a", "a\nb\n", "x\n\ny\nz\n\n"]:
+                path.write_text(content)
+                lines = content.split("\n")
+                for start in range(5):
+                    for end in [None, *range(5)]:
+                        expected = "\n".join(lines[start:end])
+                        assert _slice_lines(content, start, end) == expected
+                        assert _read_lines(path, start, end) == expected
+
+    async def test_edit_file_counts_remaining(self):
+        """Test that edit_file reports the occurrences left and rejects an empty target."""
+        from src.tools.filesystem import edit_file
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "f.txt"
+            path.write_text("ab ab ab")
+            assert "(2 more occurrence(s) remain)" in await edit_file(str(path), "ab", "cd")
+            assert path.read_text() == "cd ab ab"
+
+            assert (await edit_file(str(path), "", "x")).startswith("Error")
+            assert path.read_text() == "cd ab ab"
+
+
+class TestExtraction:
+    """Tests for document extraction tools."""
+
+    async def test_windowed_document_offsets(self, monkeypatch, tmp_path):
+        """Test that streamed windows are extracted separately with document offsets."""
+        from src.extraction.extractor import ExtractionResult
+        from src.tools import extraction
+
+        calls = []
+
+        class StubExtractor:
+            def extract(self, text, prompt, extraction_passes, max_char_buffer):
+                calls.append((text, extraction_passes))
+                return ExtractionResult(success=True, extractions=[
+                    {"type": "t", "source": {"start": 1, "end": 3}},
+                    {"type": "t", "source": {"start": 2, "end": None}},
+                ])
+
+        monkeypatch.setattr(extraction, "get_extractor", lambda model: StubExtractor())
+        monkeypatch.setattr(extraction, "STREAM_THRESHOLD_BYTES", 10)
+        monkeypatch.setattr(extraction, "STREAM_WINDOW_CHUNKS", 4)
+        path = tmp_path / "doc.txt"
+        path.write_text("a" * 50)
+
+        result = json.loads(await extraction.extract_from_document(str(path), "x", max_chunk_size=5))
+        assert result["success"] and result["document_length"] == 50
+        assert [len(text) for text, _ in calls] == [20, 20, 10]
+        assert [e["source"] for e in result["extractions"]] == [
+            {"start": 1, "end": 3}, {"start": 2, "end": None},
+            {"start": 21, "end": 23}, {"start": 22, "end": None},
+            {"start": 41, "end": 43}, {"start": 42, "end": None},
+        ]
+
+
+class TestCron:
+    """Tests for the cron job log."""
+
+    @pytest.fixture
+    def cron_dir(self, monkeypatch, tmp_path):
+        from src.config.settings import get_settings
+
+        monkeypatch.setattr(get_settings().agents.defaults, "workspace", str(tmp_path))
+        cron_dir = tmp_path / "cron"
+        cron_dir.mkdir()
+        return cron_dir
+
+    async def test_replay_and_compaction(self, cron_dir):
+        """Test that the log replays updates/tombstones and folds once dead records pile up."""
+        from src.tools import cron
+
+        lines = [
+            {"id": "a", "name": "old"},
+            {"id": "b", "name": "b"},
+            {"id": "a", "name": "new"},
+            {"_tombstone": "b"},
+        ]
+        db = cron_dir / "jobs.jsonl"
+        db.write_text("".join(json.dumps(r) + "\n" for r in lines) + '{"id": "c", "na')
+        assert cron._load_jobs() == {"a": {"id": "a", "name": "new"}}
+
+        db.unlink()
+        for i in range(8):
+            await cron.cron_add(f"j{i}", "0 9 * * *", "echo")
+        ids = list(cron._load_jobs())
+        await cron.cron_remove(ids[0])
+        assert len(db.read_text().splitlines()) == 9  # 2/9 dead: tombstone appended
+        await cron.cron_remove(ids[1])
+        assert len(db.read_text().splitlines()) == 6  # 4/10 dead: compacted
+        assert list(cron._load_jobs()) == ids[2:]
+
+    def test_migrates_legacy_json(self, cron_dir):
+        """Test that a legacy jobs.json list is converted to the JSONL log."""
+        from src.tools import cron
+
+        jobs = [{"id": "x", "name": "X"}, {"id": "y", "name": "Y"}]
+        (cron_dir / "jobs.json").write_text(json.dumps(jobs))
+
+        assert cron._load_jobs() == {"x": jobs[0], "y": jobs[1]}
+        assert not (cron_dir / "jobs.json").exists()
+        assert (cron_dir / "jobs.jsonl").exists()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])